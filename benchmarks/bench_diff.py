@@ -0,0 +1,75 @@
+"""Débit de l'encodeur/décodeur de différences et octets par tick
+
+    python -m benchmarks.bench_diff
+    python -m benchmarks.bench_diff --load "poisson:rate=0.5,max_concurrent=50" --keyframe-every 600
+
+Une partie complète (bot EDF) est encodée tick par tick, puis les trames sont
+décodées dans une réplique. La colonne « keyframe seule » donne la taille
+d'un état complet, c'est-à-dire le coût par tick sans différences.
+"""
+import argparse
+import time
+
+from src.controller.bot_controller import AIBot
+from src.model.order_stream import parse_profile
+from src.net.diff import KEYFRAME, DiffDecoder, DiffEncoder
+from src.simulation.headless import DEFAULT_DT, new_model
+
+
+def bench(seed: int, load, keyframe_every: int, dt: float = DEFAULT_DT):
+    model = new_model(seed=seed, order_stream=parse_profile(load) if load else None)
+    bot = AIBot(player_index=0, verbose=False)
+    encoder = DiffEncoder(keyframe_every)
+    frames = []
+    encode_s = 0.0
+    tick = 0
+    while not model.is_over() and tick < 3600 / dt:
+        model.clock.advance(dt)
+        model.update(dt)
+        bot.update(model)
+        tick += 1
+        start = time.perf_counter()
+        frames.append(encoder.encode(model, tick))
+        encode_s += time.perf_counter() - start
+    keyframe_bytes = len(encoder.snapshot(model))
+    encoder.close()
+
+    decoder = DiffDecoder(new_model(seed=seed))
+    start = time.perf_counter()
+    for payload in frames:
+        decoder.apply(payload)
+    decode_s = time.perf_counter() - start
+
+    total = sum(map(len, frames))
+    keyframes = sum(1 for f in frames if f[0] == KEYFRAME)
+    return {
+        "ticks": len(frames),
+        "keyframes": keyframes,
+        "bytes_per_tick": total / len(frames),
+        "delta_bytes_per_tick": (total - sum(len(f) for f in frames if f[0] == KEYFRAME)) / max(1, len(frames) - keyframes),
+        "keyframe_bytes": keyframe_bytes,
+        "encode_us": encode_s / len(frames) * 1e6,
+        "decode_us": decode_s / len(frames) * 1e6,
+        "encode_mb_s": total / encode_s / 1e6,
+        "decode_mb_s": total / decode_s / 1e6,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--load", default=None)
+    parser.add_argument("--keyframe-every", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    print(f"{'seed':>4} {'ticks':>6} {'octets/tick':>12} {'delta seul':>11} {'keyframe seule':>15} "
+          f"{'enc (us)':>9} {'dec (us)':>9} {'enc (ticks/s)':>14} {'dec (ticks/s)':>14}")
+    for seed in args.seeds:
+        r = bench(seed, args.load, args.keyframe_every)
+        print(f"{seed:>4} {r['ticks']:>6} {r['bytes_per_tick']:>12.2f} {r['delta_bytes_per_tick']:>11.2f} "
+              f"{r['keyframe_bytes']:>15} {r['encode_us']:>9.2f} {r['decode_us']:>9.2f} "
+              f"{1e6 / r['encode_us']:>14.0f} {1e6 / r['decode_us']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
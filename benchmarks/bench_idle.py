@@ -0,0 +1,53 @@
+"""CPU consommé par la boucle de jeu quand rien ne bouge, avec et sans cadence adaptative
+
+    python -m benchmarks.bench_idle
+    python -m benchmarks.bench_idle --seconds 10
+
+Le jeu tourne (pilote SDL « dummy ») pendant une attente entre deux
+commandes: aucune commande active, prochaine arrivée après la mesure. On
+compare le temps CPU du processus par seconde écoulée et le nombre d'images
+dessinées.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.controller.game_controller import GameController
+
+
+def bench(seconds: float, idle_throttle: bool):
+    controller = GameController(idle_throttle=idle_throttle)
+    controller.model.next_order_time = controller.model.clock() + seconds + 60  # pas de commande pendant la mesure
+    controller.view.render(controller.model)  # sprites, polices
+    frames = []
+    render = controller.view.render
+
+    def counted(model, overlay=None):
+        frames.append(None)
+        render(model, overlay)
+    controller.view.render = counted
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+    cpu, wall = time.process_time(), time.perf_counter()
+    controller.run()
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    return cpu / wall, len(frames) / wall
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<22} {'CPU (s/s)':>10} {'images/s':>9}")
+    for name, throttle in (("60 FPS fixe", False), ("cadence adaptative", True)):
+        cpu, fps = bench(args.seconds, throttle)
+        print(f"{name:<22} {cpu:>10.3f} {fps:>9.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
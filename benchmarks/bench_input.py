@@ -0,0 +1,118 @@
+"""Latence entrée -> image du joueur humain, cuisine chargée
+    python -m benchmarks.bench_input
+    python -m benchmarks.bench_input --seconds 10 --profile poisson:rate=8,max_concurrent=400
+
+Un thread injecte des flèches (KEYDOWN puis KEYUP, à intervalles aléatoires)
+dans la file d'événements de pygame pendant que la boucle de jeu tourne
+(pilote SDL « dummy »), sous la charge donnée par le profil de commandes.
+Chaque événement porte son instant d'émission: la latence mesurée comprend
+l'attente dans la file, l'application avant le pas du modèle et le dessin de
+l'image. Avec et sans cadence adaptative.
+
+Touche maintenue: la flèche droite reste enfoncée pendant que la cuisine est
+calme (avant la première commande, la cadence adaptative dort); on mesure
+l'intervalle entre deux pas du joueur, qui doit rester repeat_interval.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.controller.game_controller import GameController
+from src.model.order_stream import parse_profile
+
+
+def press_keys(seconds: float, mean_gap: float, seed: int):
+    rng = random.Random(seed)
+    end = time.perf_counter() + seconds
+    keys = (pygame.K_LEFT, pygame.K_RIGHT)
+    n = 0
+    while time.perf_counter() < end:
+        time.sleep(rng.expovariate(1 / mean_gap))
+        key = keys[n % 2]
+        n += 1
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, sent=time.perf_counter()))
+        time.sleep(0.03)  # relâchée avant la répétition
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+def hold_key(seconds: float):
+    time.sleep(0.3)
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT, sent=time.perf_counter()))
+    time.sleep(seconds)
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_RIGHT))
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+class _Steps:
+    """Instants des pas du joueur (événement player_moved)"""
+    def __init__(self):
+        self.times = []
+
+    def player_moved(self, player_index, player):
+        self.times.append(time.perf_counter())
+
+
+def bench_hold(seconds: float, idle_throttle: bool):
+    """Intervalle moyen entre deux répétitions d'une flèche maintenue (s), nombre de pas"""
+    controller = GameController(idle_throttle=idle_throttle)
+    controller.model.verbose = False
+    controller.model.next_order_time = controller.model.clock() + 3600  # cuisine calme
+    controller.bot_enabled = False
+    steps = controller.model.subscribe(_Steps())
+    thread = threading.Thread(target=hold_key, args=(seconds,), daemon=True)
+    thread.start()
+    controller.run()
+    thread.join()
+    repeats = steps.times[1:]  # le premier pas est la pression elle-même
+    gaps = [b - a for a, b in zip(repeats, repeats[1:])]
+    return (sum(gaps) / len(gaps) if gaps else float("nan")), len(steps.times), controller.human.repeat_interval
+
+
+def bench(seconds: float, profile: str, mean_gap: float, idle_throttle: bool, seed: int):
+    controller = GameController(idle_throttle=idle_throttle)
+    controller.model.verbose = False  # pas de journal des commandes au milieu des résultats
+    controller.model.order_stream = parse_profile(profile)
+    controller.model.next_order_time = controller.model.clock()
+    controller.bot_enabled = False  # le chef est au joueur
+    controller.view.render(controller.model)  # sprites, polices
+    thread = threading.Thread(target=press_keys, args=(seconds, mean_gap, seed), daemon=True)
+    thread.start()
+    controller.run()
+    thread.join()
+    return controller.human.latency, len(controller.model.orders)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=6.0)
+    parser.add_argument("--profile", default="poisson:rate=8,max_concurrent=200")
+    parser.add_argument("--gap", type=float, default=0.15, help="intervalle moyen entre deux touches (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--hold", type=float, default=1.0, help="durée de la touche maintenue (s), le chef ne doit pas atteindre le mur")
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<22} {'entrées':>8} {'commandes':>10} {'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    for name, throttle in (("60 FPS fixe", False), ("cadence adaptative", True)):
+        latency, orders = bench(args.seconds, args.profile, args.gap, throttle, args.seed)
+        p = latency.percentiles((50, 90, 99))
+        print(f"{name:<22} {latency.count:>8} {orders:>10} {p['p50'] * 1000:>9.1f} {p['p90'] * 1000:>9.1f} "
+              f"{p['p99'] * 1000:>9.1f} {latency.max * 1000:>9.1f}")
+
+    print(f"\n{'touche maintenue':<22} {'pas':>8} {'intervalle (ms)':>16} {'attendu (ms)':>13}")
+    for name, throttle in (("60 FPS fixe", False), ("cadence adaptative", True)):
+        gap, steps, expected = bench_hold(args.hold, throttle)
+        print(f"{name:<22} {steps:>8} {gap * 1000:>16.1f} {expected * 1000:>13.1f}")
+        if not gap <= expected * 1.2:
+            print(f"  !! répétition trop lente ({gap * 1000:.0f} ms au lieu de {expected * 1000:.0f} ms)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Coût de update et des interactions selon la taille du plan (10, 100, 1000 stations)
+
+    python -m benchmarks.bench_layout_scaling
+
+La colonne « scan » refait la recherche de station la plus proche par
+parcours linéaire (l'ancien interact_with_station) pour comparaison.
+"""
+import argparse
+import random
+import time
+
+from src.model.clock import SimClock
+from src.model.game_model import INTERACT_RANGE, GameModel, Item, ItemType, StationType
+from src.model.layout import grid_layout
+
+
+def _scan_closest(model, player):
+    closest, min_distance = None, float('inf')
+    for station in model.stations:
+        distance = abs(player.x - station.x) + abs(player.y - station.y)
+        if distance < min_distance and distance <= INTERACT_RANGE:
+            min_distance, closest = distance, station
+    return closest
+
+
+def bench(n_stations: int, ticks: int, lookups: int, dt: float = 1 / 60):
+    clock = SimClock()
+    model = GameModel(clock=clock, verbose=False, layout=grid_layout(n_stations))
+    player = model.players[0]
+
+    # Un steak sur un fourneau sur deux
+    for stove in model.stations_by_type[StationType.STOVE][::2]:
+        stove.item = Item(ItemType.RAW_PATTY)
+        model._start_cooking(stove)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        clock.advance(dt)
+        model.update(dt)
+    update_us = (time.perf_counter() - start) / ticks * 1e6
+
+    rng = random.Random(n_stations)
+    positions = [(s.x, s.y + 50) for s in rng.choices(model.stations, k=lookups)]
+
+    start = time.perf_counter()
+    for x, y in positions:
+        player.x, player.y, player.held_item = x, y, None
+        model.interact_with_station(0)
+    interact_us = (time.perf_counter() - start) / lookups * 1e6
+
+    start = time.perf_counter()
+    for x, y in positions:
+        player.x, player.y = x, y
+        _scan_closest(model, player)
+    scan_us = (time.perf_counter() - start) / lookups * 1e6
+    return update_us, interact_us, scan_us
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--ticks", type=int, default=240)  # 4 s: les steaks cuisent encore
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    print(f"{'stations':>8} {'update (us)':>12} {'interact (us)':>14} {'scan (us)':>10}")
+    for n in args.sizes:
+        update_us, interact_us, scan_us = bench(n, args.ticks, args.lookups)
+        print(f"{n:>8} {update_us:>12.2f} {interact_us:>14.2f} {scan_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Mémoire par cuisine et allocations par tick
+
+    python -m benchmarks.bench_memory --kitchens 2000
+"""
+import argparse
+import time
+import tracemalloc
+
+from src.model.clock import SimClock
+from src.model.game_model import GameModel
+from src.controller.bot_controller import AIBot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kitchens", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    args = parser.parse_args(argv)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    kitchens = [GameModel(clock=SimClock(), verbose=False) for _ in range(args.kitchens)]
+    bots = [AIBot(0, verbose=False) for _ in kitchens]
+    built, _ = tracemalloc.get_traced_memory()
+    print(f"{args.kitchens} cuisines: {(built - base) / args.kitchens:.0f} octets/cuisine")
+
+    # Churn: nombre de blocs alloués pendant la simulation d'un échantillon
+    sample = kitchens[:50]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    ticks = int(args.seconds / args.dt)
+    before = tracemalloc.take_snapshot()
+    for _ in range(ticks):
+        for model, bot in zip(sample, bots):
+            model.clock.advance(args.dt)
+            model.update(args.dt)
+            bot.update(model)
+    after = tracemalloc.take_snapshot()
+    elapsed = time.perf_counter() - start
+    grown = sum(s.count_diff for s in after.compare_to(before, "filename") if s.count_diff > 0)
+    print(f"{len(sample)} cuisines x {ticks} ticks: {elapsed:.2f}s, blocs retenus: {grown}")
+
+
+if __name__ == "__main__":
+    main()
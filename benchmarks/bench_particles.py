@@ -0,0 +1,71 @@
+"""Coût par image du système de particules selon le nombre de particules vivantes
+
+    python -m benchmarks.bench_particles
+    python -m benchmarks.bench_particles --stations 200 --frames 600
+
+Des émetteurs (vapeur, flammes, fumée) sont répartis sur une surface de la
+taille de l'écran; on mesure update + draw une fois le régime établi. La
+colonne « ancien » refait le dessin d'origine (une Surface 20x20 allouée
+par bouffée de vapeur) pour le même nombre de particules.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.view.particles import FLAME, KINDS, SMOKE, STEAM, ParticleSystem
+
+DT = 1 / 60
+
+
+def bench(stations: int, frames: int):
+    screen = pygame.display.set_mode((1000, 700))
+    particles = ParticleSystem(capacity=64 * 1024, seed=0)
+    positions = [(50 + (i * 97) % 900, 120 + (i * 53) % 500) for i in range(stations)]
+
+    def frame():
+        for i, (x, y) in enumerate(positions):
+            for kind in (STEAM, FLAME, SMOKE):
+                particles.emitter((i, kind), kind, x, y, DT)
+        particles.update(DT)
+        particles.draw(screen)
+
+    warmup = int(max(k.life for k in KINDS) / DT) + 1  # régime établi: naissances = morts
+    for _ in range(warmup):
+        frame()
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    new_ms = (time.perf_counter() - start) / frames * 1000
+
+    # Même nombre de bouffées avec l'ancien dessin
+    count = particles.count
+    start = time.perf_counter()
+    for _ in range(frames):
+        for i in range(count):
+            steam = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.circle(steam, (255, 255, 255, 80), (10, 10), 8)
+            screen.blit(steam, (i % 1000, (i * 7) % 700))
+    old_ms = (time.perf_counter() - start) / frames * 1000
+    return count, new_ms, old_ms
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stations", type=int, nargs="+", default=[4, 40, 200])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    print(f"{'stations':>8} {'particules':>10} {'ms/image':>9} {'ancien (ms)':>12}")
+    for stations in args.stations:
+        count, new_ms, old_ms = bench(stations, args.frames)
+        print(f"{stations:>8} {count:>10} {new_ms:>9.2f} {old_ms:>12.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Coût d'une image selon la taille de l'écran: résolution native ou canevas logique
+
+    python -m benchmarks.bench_render
+    python -m benchmarks.bench_render --displays 1920x1080 3840x2160 --canvas 1280x720 --scaler smoothscale
+
+Pilote SDL « dummy »: mesure le dessin et la mise à l'échelle logicielle
+(scale / smoothscale), pas la présentation par la carte graphique; le mode
+« gpu » (pygame.SCALED) demande un vrai moteur de rendu. La partie (bot EDF)
+est avancée d'une minute avant la mesure pour avoir commandes, clients et
+cuissons à l'écran.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.controller.bot_controller import AIBot
+from src.simulation.headless import DEFAULT_DT, new_model
+from src.view.game_view import SCALERS, GameView, init_display, parse_size
+
+
+def bench(display_size, logical_size, scaler: str, frames: int) -> float:
+    view = GameView(display_size=display_size, logical_size=logical_size, scaler=scaler)
+    model = new_model(seed=0)
+    bot = AIBot(player_index=0, verbose=False)
+    for _ in range(int(60 / DEFAULT_DT)):
+        model.clock.advance(DEFAULT_DT)
+        model.update(DEFAULT_DT)
+        bot.update(model)
+    view.render(model)  # sprites, polices
+    start = time.perf_counter()
+    for _ in range(frames):
+        model.clock.advance(DEFAULT_DT)
+        model.update(DEFAULT_DT)
+        bot.update(model)
+        view.render(model)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--displays", nargs="+", default=["1280x720", "1920x1080", "2560x1440", "3840x2160", "5120x1440"])
+    parser.add_argument("--canvas", default="1280x720")
+    parser.add_argument("--scaler", default="scale", choices=SCALERS)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args(argv)
+
+    init_display()
+    canvas = parse_size(args.canvas)
+    print(f"{'écran':>10} {'natif (ms)':>11} {'canevas ' + args.canvas + ' (ms)':>22}")
+    for text in args.displays:
+        size = parse_size(text)
+        native = bench(size, None, args.scaler, args.frames)
+        scaled = bench(size, canvas, args.scaler, args.frames)
+        print(f"{text:>10} {native:>11.2f} {scaled:>22.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Temps de démarrage: premier tick (modèle + bot, sans pygame) et première image
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --workers 4 --start-method spawn
+
+Chaque mesure part d'un interpréteur neuf: le temps compté va du lancement du
+sous-processus au premier tick (ou à la première image affichée), démarrage
+de Python et imports compris. La ligne « pool » mesure le temps pour qu'un
+ProcessPoolExecutor de N workers ait rendu un premier tick dans chacun
+(le coût payé par headless --runs et par le balayage de paramètres).
+La première image utilise le pilote SDL « dummy » (pas de fenêtre).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_BARE = """
+import json, time
+print(json.dumps({"t": time.time(), "pygame": False}))
+"""
+
+_IMPORT = """
+import json, sys, time
+from src.model.game_model import GameModel
+from src.controller.bot_controller import AIBot
+print(json.dumps({"t": time.time(), "pygame": "pygame" in sys.modules}))
+"""
+
+_FIRST_TICK = """
+import json, sys, time
+from src.model.clock import SimClock
+from src.model.game_model import GameModel
+from src.controller.bot_controller import AIBot
+model = GameModel(clock=SimClock(), verbose=False, seed=0)
+bot = AIBot(player_index=0, verbose=False)
+model.clock.advance(1 / 60)
+model.update(1 / 60)
+bot.update(model)
+print(json.dumps({"t": time.time(), "pygame": "pygame" in sys.modules}))
+"""
+
+_FIRST_FRAME = """
+import json, sys, time
+from src.controller.game_controller import GameController
+controller = GameController()
+controller.model.update(0.0)
+controller.bot.update(controller.model)
+controller.view.render(controller.model)
+print(json.dumps({"t": time.time(), "pygame": "pygame" in sys.modules}))
+"""
+
+_POOL = """
+import json, sys, time
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from benchmarks.bench_startup import first_tick
+workers, method = int(sys.argv[1]), sys.argv[2]
+context = multiprocessing.get_context(None if method == "default" else method)
+with ProcessPoolExecutor(workers, mp_context=context) as pool:
+    flags = list(pool.map(first_tick, range(workers)))
+    t = time.time()
+print(json.dumps({"t": t, "pygame": any(flags)}))
+"""
+
+
+def first_tick(_=None) -> bool:
+    """Tâche de pool: un tick de modèle + bot; retourne True si pygame a été importé"""
+    from src.model.clock import SimClock
+    from src.model.game_model import GameModel
+    from src.controller.bot_controller import AIBot
+    model = GameModel(clock=SimClock(), verbose=False, seed=0)
+    bot = AIBot(player_index=0, verbose=False)
+    model.clock.advance(1 / 60)
+    model.update(1 / 60)
+    bot.update(model)
+    return "pygame" in sys.modules
+
+
+def measure(script: str, *args: str) -> dict:
+    """Lance `script` dans un interpréteur neuf; retourne le délai jusqu'à son horodatage"""
+    env = dict(os.environ, PYTHONPATH=_ROOT, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.time()
+    out = subprocess.run([sys.executable, "-c", script, *args], cwd=_ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    return {"seconds": result["t"] - start, "pygame": result["pygame"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temps jusqu'au premier tick et à la première image")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--start-method", default="default", choices=("default", "fork", "spawn", "forkserver"))
+    parser.add_argument("--no-frame", action="store_true", help="sans la mesure de première image (pas de pygame)")
+    args = parser.parse_args(argv)
+
+    cases = [("python seul", _BARE, ()),
+             ("import modèle + bot", _IMPORT, ()),
+             ("premier tick", _FIRST_TICK, ())]
+    if not args.no_frame:
+        cases.append(("première image", _FIRST_FRAME, ()))
+    cases.append((f"pool {args.workers} workers ({args.start_method})", _POOL,
+                  (str(args.workers), args.start_method)))
+
+    print(f"{'mesure':<32} {'médiane (ms)':>13} {'min (ms)':>9}  pygame")
+    for name, script, extra in cases:
+        runs = [measure(script, *extra) for _ in range(args.repeat)]
+        seconds = [r["seconds"] for r in runs]
+        print(f"{name:<32} {statistics.median(seconds) * 1000:>13.1f} {min(seconds) * 1000:>9.1f}  "
+              f"{'oui' if runs[0]['pygame'] else 'non'}")
+
+
+if __name__ == "__main__":
+    main()
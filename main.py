@@ -1,13 +1,77 @@
-import pygame
+"""Point d'entrée unique
+
+    python main.py                      # jouer (équivaut à: python main.py play)
+    python main.py play --planner --record partie.ocrec
+    python main.py headless --seed 0 --runs 32
+    python main.py bench startup
+    python main.py replay partie.ocrec
+
+pygame n'est importé que par play et replay: headless et les benchmarks sans
+affichage démarrent sans lui.
+"""
+import argparse
 import sys
-from src.controller.game_controller import GameController
 
-def main():
-    pygame.init()
-    controller = GameController()
+BENCHMARKS = ("startup", "diff", "layout_scaling", "memory", "particles", "render", "idle", "input")
+
+
+def play(args):
+    import pygame
+    from src.controller.game_controller import GameController
+    from src.view.game_view import parse_size
+    controller = GameController(use_planner=args.planner, layout_path=args.layout,
+                                metrics_port=args.metrics_port, metrics_jsonl=args.metrics_jsonl,
+                                trace_path=args.trace, record_path=args.record,
+                                canvas=parse_size(args.canvas) if args.canvas else None, scaler=args.scaler,
+                                idle_throttle=not args.no_idle_throttle)
     controller.run()
     pygame.quit()
-    sys.exit()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Overcooked: jeu, simulation, benchmarks, relecture")
+    commands = parser.add_subparsers(dest="command")
+
+    p = commands.add_parser("play", help="partie avec affichage (défaut)")
+    p.add_argument("--planner", action="store_true", help="bot à rollouts Monte Carlo")
+    p.add_argument("--layout", default=None, help="plan de cuisine JSON ou TOML")
+    p.add_argument("--metrics-port", type=int, default=None)
+    p.add_argument("--metrics-jsonl", default=None)
+    p.add_argument("--trace", default=None, help="trace Chrome des décisions du bot")
+    p.add_argument("--record", default=None, help="enregistre la partie pour la relecture")
+    p.add_argument("--canvas", default=None, help="canevas logique mis à l'échelle de l'écran, ex. 1280x720")
+    p.add_argument("--scaler", default="scale", choices=("scale", "smoothscale", "gpu"))  # game_view.SCALERS (sans importer pygame)
+    p.add_argument("--no-idle-throttle", action="store_true", help="toujours 60 FPS, même quand rien ne bouge")
+
+    # Les autres commandes transmettent leurs arguments au module concerné
+    commands.add_parser("headless", help="simulation sans affichage (src.simulation.headless)", add_help=False)
+    p = commands.add_parser("bench", help="benchmarks (benchmarks.bench_*)", add_help=False)
+    p.add_argument("name", choices=BENCHMARKS)
+    commands.add_parser("replay", help="relecture d'un enregistrement (src.replay.viewer)", add_help=False)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    if not argv or argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv = ["play"] + argv
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command == "headless":
+        from src.simulation import headless
+        headless.main(rest)
+    elif args.command == "bench":
+        import importlib
+        importlib.import_module(f"benchmarks.bench_{args.name}").main(rest)
+    elif args.command == "replay":
+        from src.replay import viewer
+        viewer.main(rest)
+    else:
+        if rest:
+            parser.error(f"arguments inconnus: {' '.join(rest)}")
+        play(args)
+
 
 if __name__ == "__main__":
     main()
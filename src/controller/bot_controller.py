@@ -1,10 +1,13 @@
+import math
+from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional, List, Tuple, Dict
-import time
 
 from src.model.game_model import (
     GameModel, StationType, ItemType, Station, Player, Order
 )
+from src.model.recipes import RECIPES, INGREDIENT_BITS, Recipe, prepared, type_bits
+from src.controller.order_policies import ORDER_POLICIES, estimate_duration
 
 # Étapes atomiques
 class Step(Enum):
@@ -13,55 +16,32 @@ class Step(Enum):
     CHOP = auto()
     WAIT = auto()
 
+@dataclass(frozen=True)
+class BotParams:
+    """Réglages du bot (balayés par src/simulation/sweep.py)
+
+    step_gap: pause entre deux étapes (s)
+    cooldown: délai min entre deux interactions/découpes (s)
+    oven_wait: attente devant le four pendant la cuisson d'une pizza (s)
+    stove_wait: attente max devant un steak en cuisson (s)
+    order_choice: politique de choix de commande (src/controller/order_policies.py):
+                  "edf", "fifo", "spt", "density", "feasible"
+    """
+    step_gap: float = 0.25
+    cooldown: float = 0.0
+    oven_wait: float = 1.0
+    stove_wait: float = 0.5
+    order_choice: str = "edf"
+
+
+ORDER_CHOICES = tuple(ORDER_POLICIES)  # politiques fournies (balayées par sweep.py)
+
 # État interne de l'agent
 class AgentState(Enum):
     IDLE = auto()
     EXECUTING_RECIPE = auto()
     DELIVERING = auto()
 
-class Recipe:
-    """Définit une recette avec ses ingrédients et leurs préparations"""
-    def __init__(self, name: str, result: ItemType, ingredients: List[Tuple[ItemType, bool]]):
-        """
-        name: nom de la recette
-        result: type d'item final produit
-        ingredients: liste de (ItemType, needs_chopping)
-        """
-        self.name = name
-        self.result = result
-        self.ingredients = ingredients  # [(ItemType, needs_chopping), ...]
-
-# Bibliothèque de recettes
-RECIPES = {
-    ItemType.BURGER: Recipe(
-        name="Burger",
-        result=ItemType.BURGER,
-        ingredients=[
-            (ItemType.BREAD, False),      # pain (pas de découpe)
-            (ItemType.RAW_PATTY, False),  # steak (cuisson nécessaire)
-            (ItemType.TOMATO, True),      # tomate coupée
-            (ItemType.LETTUCE, True),     # salade coupée
-        ]
-    ),
-    ItemType.PIZZA: Recipe(
-        name="Pizza",
-        result=ItemType.UNCOOKED_PIZZA, # MODIFICATION: Le résultat de l'assemblage est une pizza non cuite
-        ingredients=[
-            (ItemType.BREAD, False),
-            (ItemType.TOMATO, True),
-            (ItemType.CHEESE, False),
-        ]
-    ),
-    ItemType.SALAD: Recipe(
-        name="Salad",
-        result=ItemType.SALAD,
-        ingredients=[
-            (ItemType.LETTUCE, True),      # salade coupée
-            (ItemType.TOMATO, True),      # tomate coupée
-        ]
-    ),
-}
-
 class AIBot:
     """
     Agent autonome conforme à la définition de Wooldridge:
@@ -78,9 +58,23 @@ class AIBot:
     - Dynamique: les commandes changent, le temps passe
     """
 
-    def __init__(self, player_index: int = 0):
+    def __init__(self, player_index: int = 0, planner=None, verbose: bool = True, tracer=None,
+                 params: Optional[BotParams] = None):
         # Identité de l'agent
         self.player_index = player_index
+        self.verbose = verbose
+        self.params = params or BotParams()
+        if self.params.order_choice not in ORDER_POLICIES:
+            raise ValueError(f"order_choice inconnu: {self.params.order_choice}")
+        self._order_policy = ORDER_POLICIES[self.params.order_choice]
+        # Durée estimée par plat, recalculée si le plan de la cuisine change
+        self._durations: Dict[ItemType, float] = {}
+        self._durations_layout = None
+
+        # Planificateur optionnel (ex: MonteCarloPlanner); None = heuristique EDF
+        self.planner = planner
+        # Traces optionnelles des phases de décision (src/metrics/tracing.py)
+        self.tracer = tracer
         
         # État interne (I)
         self.internal_state = AgentState.IDLE
@@ -92,29 +86,44 @@ class AIBot:
         self.queue: List[Tuple[Step, Optional[Station], float]] = []
         
         # Timing controls
-        self._cooldown = 0.0
+        self._cooldown = self.params.cooldown
         self._last_action_ts = 0.0
-        self._step_gap = 0.25
+        self._step_gap = self.params.step_gap
         self._gap_until = 0.0
+        self._now = 0.0  # horloge du modèle, relue à chaque update
+        # Perception incrémentale (versions du modèle, voir perceive)
+        self._percepts: Dict = {}
+        self._perceived = None
+        self._idle_versions = None  # versions au dernier cycle resté sans rien à faire
+        self._layout_ok = None      # stations_by_type vérifié (assemblage et livraison présents)
+        self._max_y = 550  # borne basse du plan (m.max_y), relue à chaque update
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
 
     # ============ PERCEPTION (see function) ============
     def perceive(self, m: GameModel) -> Dict:
         """
         Fonction 'see' : perçoit l'état de l'environnement
         Retourne un dictionnaire de percepts
+
+        Percepts persistants: les parties coûteuses (objet tenu, stations,
+        assemblage) ne sont recalculées que si Player.version ou
+        GameModel.stations_version ont bougé depuis la dernière perception.
         """
         p = self._p(m)
-        
-        percepts = {
-            'player_position': (p.x, p.y),
-            'held_item': p.held_item,
-            'active_orders': m.orders.copy(),
-            'active_order_ids': [o.id for o in m.orders],
-            'score': m.score,
-            'stations_state': self._perceive_stations(m),
-            'assembly_state': self._perceive_assembly(m),
-        }
-        
+        percepts = self._percepts
+        percepts['player_position'] = (p.x, p.y)
+        percepts['active_orders'] = m.orders       # OrderBook (lecture seule, pas de copie)
+        percepts['active_order_ids'] = m.orders    # `id in` interroge l'index par id
+        percepts['score'] = m.score
+        versions = (p.version, m.stations_version, m.stations_by_type)
+        if versions != self._perceived:
+            self._perceived = versions
+            percepts['held_item'] = p.held_item
+            percepts['stations_state'] = self._perceive_stations(m)
+            percepts['assembly_state'] = self._perceive_assembly(m)
         return percepts
 
     def _perceive_stations(self, m: GameModel) -> Dict:
@@ -148,7 +157,9 @@ class AIBot:
         if self.current_order_id is not None:
             if self.current_order_id not in percepts['active_order_ids']:
                 # Order expired or was completed by someone else - abandon current task
-                print(f"Agent: Commande #{self.current_order_id} expirée/complétée - abandon")
+                self._log(f"Agent: Commande #{self.current_order_id} expirée/complétée - abandon")
+                if self.tracer is not None:
+                    self.tracer.instant("abandon", order_id=self.current_order_id)
                 self._abandon_current_task(m, percepts)
                 return
         
@@ -157,7 +168,10 @@ class AIBot:
         
         # Sélectionner la prochaine action basée sur l'état
         if self.internal_state == AgentState.IDLE:
-            self._select_order(percepts)
+            if self.planner is not None:
+                self._select_with_planner(m, percepts)
+            else:
+                self._select_order(m, percepts)
         elif self.internal_state == AgentState.EXECUTING_RECIPE:
             if not self.queue:
                 self._plan_recipe(percepts)
@@ -195,27 +209,91 @@ class AIBot:
              assembly['finished_item'].item_type == self.current_order.items_needed[0]:
             self.internal_state = AgentState.DELIVERING
 
-    def _select_order(self, percepts: Dict):
+    def _select_order(self, m: GameModel, percepts: Dict):
         """Sélectionne une commande à traiter (goal selection)"""
         orders = percepts['active_orders']
         if not orders:
             return
         
-        # Prendre la commande la plus urgente
-        self.current_order = min(orders, key=lambda o: o.time_remaining)
-        self.current_order_id = self.current_order.id
+        # Un plat déjà prêt (en main, sur l'assemblage, au four) est livré avant d'en choisir un autre
+        order = None
+        for dish in self._ready_dishes(m, percepts):
+            order = orders.earliest(dish)
+            if order is not None:
+                break
+        # Sinon politique de BotParams.order_choice (la plus urgente par défaut)
+        if order is None:
+            order = self._order_policy(orders, lambda o: self.estimated_duration(m, o))
+        if order is not None:
+            self.commit_order(order)
+
+    def _ready_dishes(self, m: GameModel, percepts: Dict) -> List[ItemType]:
+        held = percepts['held_item']
+        finished = percepts['assembly_state']['finished_item']
+        ready = [item.item_type for item in (held, finished) if item is not None]
+        if ItemType.UNCOOKED_PIZZA in ready or self._furnace_with(m, ItemType.UNCOOKED_PIZZA) \
+                or self._furnace_with(m, ItemType.PIZZA):
+            ready.append(ItemType.PIZZA)
+        return [dish for dish in ready if dish in RECIPES]
+
+    def estimated_duration(self, m: GameModel, order: Order) -> float:
+        """Temps estimé pour préparer et livrer une commande (order_policies.estimate_duration)"""
+        if m.stations_by_type is not self._durations_layout:
+            self._durations.clear()
+            self._durations_layout = m.stations_by_type
+        dish = order.items_needed[0]
+        try:
+            return self._durations[dish]
+        except KeyError:
+            recipe = RECIPES.get(dish)
+            duration = estimate_duration(m, recipe, self._step_gap) if recipe else math.inf
+            self._durations[dish] = duration
+            return duration
+
+    def commit_order(self, order: Order):
+        """S'engage sur une commande et charge la recette correspondante"""
+        self.current_order = order
+        self.current_order_id = order.id
         
-        # Identifier la recette correspondante
+        # Identifier la recette correspondante (table partagée avec le modèle)
         if self.current_order.items_needed:
             needed_item = self.current_order.items_needed[0]
             if needed_item in RECIPES:
                 self.current_recipe = RECIPES[needed_item]
                 self.internal_state = AgentState.EXECUTING_RECIPE
-                print(f"Agent: Nouvelle commande #{self.current_order_id} - {self.current_recipe.name}")
-            elif needed_item == ItemType.PIZZA: # Cas spécial pour la pizza qui demande une pizza cuite
-                self.current_recipe = RECIPES[ItemType.UNCOOKED_PIZZA]
-                self.internal_state = AgentState.EXECUTING_RECIPE
-                print(f"Agent: Nouvelle commande #{self.current_order_id} - Pizza")
+                self._log(f"Agent: Nouvelle commande #{self.current_order_id} - {self.current_recipe.name}")
+
+    def _select_with_planner(self, m: GameModel, percepts: Dict):
+        """Sélection par rollouts: ne bloque pas, la décision arrive en quelques ticks"""
+        if not percepts['active_orders']:
+            return
+        macro = self.planner.decide(m, self)
+        if macro is not None:
+            # False si la commande a disparu entre-temps: on replanifie au prochain cycle
+            self.apply_macro(m, macro)
+
+    def apply_macro(self, m: GameModel, macro) -> bool:
+        """Applique une macro-action du planificateur (commande choisie + steak en avance)"""
+        self._now = m.clock()
+        order = m.orders.get(macro.order_id)
+        if order is None:
+            return False
+        self.commit_order(order)
+        if macro.precook and self.internal_state == AgentState.EXECUTING_RECIPE:
+            self._plan_precook(m)
+        return True
+
+    def _plan_precook(self, m: GameModel):
+        """Lance un steak sur un fourneau libre avant d'attaquer la commande"""
+        if self._p(m).held_item is not None:
+            return
+        spawn = self._spawn(m, ItemType.RAW_PATTY)
+        stove = next((s for s in self._stations(m, StationType.STOVE) if s.item is None), None)
+        if spawn and stove:
+            self._push_with_gap(Step.GO_TO, spawn)
+            self._push_with_gap(Step.INTERACT, spawn)
+            self._push_with_gap(Step.GO_TO, stove)
+            self._push_with_gap(Step.INTERACT, stove)
 
 
     # ============ HELPERS ============
@@ -223,7 +301,7 @@ class AIBot:
         return m.players[self.player_index]
 
     def _stations(self, m: GameModel, t: StationType) -> List[Station]:
-        return [s for s in m.stations if s.station_type == t]
+        return m.stations_by_type[t]
 
     def _one(self, m: GameModel, t: StationType, ingredient_type: Optional[ItemType] = None) -> Optional[Station]:
         for s in self._stations(m, t):
@@ -238,7 +316,7 @@ class AIBot:
         return self._one(m, StationType.DELIVERY)
 
     def _spawn(self, m: GameModel, it: ItemType) -> Station:
-        return self._one(m, StationType.INGREDIENT_SPAWN, it)
+        return m.spawns.get(it)
 
     def _free_board(self, m: GameModel) -> Optional[Station]:
         for b in self._stations(m, StationType.CUTTING_BOARD):
@@ -280,7 +358,7 @@ class AIBot:
 
     def _anchor(self, s: Station) -> Tuple[int, int]:
         ax = s.x
-        ay = min(550, s.y + 50)
+        ay = min(self._max_y, s.y + 50)
         return ax, ay
 
     def _near(self, px: int, py: int, s: Station, tol: int = 10) -> bool:
@@ -314,7 +392,7 @@ class AIBot:
 
     def _push(self, step: Step, station: Optional[Station] = None, wait_seconds: float = 0.0):
         if step == Step.WAIT:
-            self.queue.append((Step.WAIT, None, time.time() + wait_seconds))
+            self.queue.append((Step.WAIT, None, self._now + wait_seconds))
         else:
             self.queue.append((step, station, 0.0))
 
@@ -329,18 +407,8 @@ class AIBot:
         a = self._assembly(m)
         if a is None:
             return False
-        if not hasattr(a, 'contents'):
-            return False
-        
-        for item in a.contents:
-            if item.item_type == it:
-                if chopped is None:
-                    return True
-                elif chopped and item.chopped:
-                    return True
-                elif not chopped and not item.chopped:
-                    return True
-        return False
+        bits = type_bits(it) if chopped is None else INGREDIENT_BITS[(it, chopped)]
+        return bool(a.contents_mask & bits)
 
 
     # ============ PLANIFICATION DE RECETTE ============
@@ -359,8 +427,8 @@ class AIBot:
             return
 
         # Vérifie si la commande existe toujours
-        if self.current_order_id not in [o.id for o in m.orders]:
-            self._abandon_current_task(m, {'active_order_ids': [o.id for o in m.orders]})
+        if self.current_order_id not in m.orders:
+            self._abandon_current_task(m, {'active_order_ids': m.orders})
             return
 
         p = self._p(m)
@@ -405,12 +473,12 @@ class AIBot:
             return
         if uncooked_pizza_station and uncooked_pizza_station.cooking_start_time > 0:
             self._push_with_gap(Step.GO_TO, uncooked_pizza_station)
-            self._push(Step.WAIT, None, 1.0) # Attend une seconde
+            self._push(Step.WAIT, None, self.params.oven_wait) # Attend la fin de cuisson
             return
 
         # --- Étape 3: Logique d'assemblage des ingrédients ---
         for ingredient_type, needs_chopping in self.current_recipe.ingredients:
-            effective_ingredient = ItemType.COOKED_PATTY if ingredient_type == ItemType.RAW_PATTY else ingredient_type
+            effective_ingredient = prepared(ingredient_type)
             
             if self._assembly_has(m, effective_ingredient, chopped=needs_chopping if needs_chopping else None):
                 continue
@@ -480,8 +548,8 @@ class AIBot:
                 stove_raw = self._stove_with(m, ItemType.RAW_PATTY)
                 if stove_raw and stove_raw.cooking_start_time > 0:
                     self._push_with_gap(Step.GO_TO, stove_raw)
-                    remaining = max(0.0, stove_raw.cooking_duration - (time.time() - stove_raw.cooking_start_time))
-                    self._push(Step.WAIT, None, min(0.5, remaining))
+                    remaining = max(0.0, stove_raw.cooking_duration - (self._now - stove_raw.cooking_start_time))
+                    self._push(Step.WAIT, None, min(self.params.stove_wait, remaining))
                     return
                 
                 # Commencer la cuisson
@@ -581,25 +649,60 @@ class AIBot:
         Fonction principale : perception -> action -> exécution
         Représente un cycle complet de l'agent
         """
-        if self._assembly(m) is None or self._delivery(m) is None:
-            return
+        if m.stations_by_type is not self._layout_ok:
+            if self._assembly(m) is None or self._delivery(m) is None:
+                return
+            self._layout_ok = m.stations_by_type
 
-        now = time.time()
+        now = m.clock()
+        self._now = now
+        self._max_y = m.max_y
 
         # Respecter le délai entre actions
         if now < self._gap_until:
             return
 
+        tracer = self.tracer
+        if tracer is None:
+            self._cycle(m, now)
+            return
+        start = tracer.now()
+        self._cycle(m, now)
+        tracer.complete("update", start, t_sim=round(now, 3))
+
+    def _cycle(self, m: GameModel, now: float):
+        """Un cycle perception -> action -> planification -> exécution"""
+        # Rien n'a bougé depuis un cycle resté sans rien à faire: il donnerait le même résultat
+        versions = self._versions(m)
+        if not self.queue and versions == self._idle_versions:
+            return
+        tracer = self.tracer
+
         # PERCEPTION
+        if tracer is not None:
+            start = tracer.now()
         percepts = self.perceive(m)
-        
+        if tracer is not None:
+            tracer.complete("perceive", start, orders=len(m.orders))
+            start = tracer.now()
+
         # ACTION SELECTION
         self.action(m, percepts)
-        
+        if tracer is not None:
+            tracer.complete("action", start, state=self.internal_state.name,
+                            order_id=self.current_order_id, queue=len(self.queue))
+
         # Planification si nécessaire
         if self.internal_state == AgentState.EXECUTING_RECIPE and not self.queue:
+            if tracer is not None:
+                start = tracer.now()
             self._plan_from_model(m)
+            if tracer is not None:
+                tracer.complete("_plan_from_model", start, order_id=self.current_order_id,
+                                recipe=self.current_recipe.name if self.current_recipe else None,
+                                queue=len(self.queue))
             if not self.queue:
+                self._remember_idle(m, versions)
                 return
         
         if self.internal_state == AgentState.DELIVERING and not self.queue:
@@ -609,21 +712,42 @@ class AIBot:
 
         # EXÉCUTION de l'action planifiée
         if not self.queue:
+            self._remember_idle(m, versions)
             return
-
+        if tracer is None:
+            self._execute_step(m, now)
+            return
+        start = tracer.now()
+        step = self.queue[0][0]
+        self._execute_step(m, now)
+        tracer.complete("step", start, step=step.name, order_id=self.current_order_id, queue=len(self.queue))
+
+    def _versions(self, m: GameModel) -> Tuple:
+        """Tout ce dont dépendent perception, choix et planification, hors déplacements et temps"""
+        return (m.orders.version, self._p(m).version, m.stations_version, m.stations_by_type,
+                self.internal_state, self.current_order_id)
+
+    def _remember_idle(self, m: GameModel, versions: Tuple):
+        """Cycle terminé sans étape à exécuter: s'il n'a rien changé non plus, le suivant est sauté
+        tant que les versions ne bougent pas (pas avec le planificateur, qui répond de façon asynchrone)"""
+        if self.planner is None and self._versions(m) == versions:
+            self._idle_versions = versions
+
+    def _execute_step(self, m: GameModel, now: float):
+        """Avance l'étape en tête de file (déplacement d'une case, interaction, attente)"""
         step, station, deadline = self.queue[0]
 
         # WAIT
         if step == Step.WAIT:
             if now >= deadline:
                 self.queue.pop(0)
-                self._gap_until = time.time() + self._step_gap
+                self._gap_until = now + self._step_gap
             return
 
         # Mouvement vers la station
         if station is not None:
             if self._move_to_anchor_step(m, station):
-                self._gap_until = time.time() + self._step_gap
+                self._gap_until = now + self._step_gap
                 return
 
         # Anti-spam
@@ -633,19 +757,19 @@ class AIBot:
         # Exécuter l'étape
         if step == Step.GO_TO:
             self.queue.pop(0)
-            self._gap_until = time.time() + self._step_gap
+            self._gap_until = now + self._step_gap
             return
 
         if step == Step.INTERACT:
             self._interact(m)
-            self._last_action_ts = time.time()
+            self._last_action_ts = now
             self.queue.pop(0)
-            self._gap_until = time.time() + self._step_gap
+            self._gap_until = now + self._step_gap
             return
 
         if step == Step.CHOP:
             self._chop(m)
-            self._last_action_ts = time.time()
+            self._last_action_ts = now
             self.queue.pop(0)
-            self._gap_until = time.time() + self._step_gap
+            self._gap_until = now + self._step_gap
             return
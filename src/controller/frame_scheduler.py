@@ -0,0 +1,60 @@
+"""Cadence adaptative de la boucle de jeu
+
+Pleine cadence tant que quelque chose bouge à l'écran: le modèle a changé
+(GameModel.changes) ou la vue anime encore (GameView.animating). Sinon,
+aucune image n'est dessinée et la boucle dort jusqu'au prochain événement
+planifié du modèle (GameModel.next_event_time), au prochain changement de la
+seconde affichée par le chrono, à la prochaine répétition d'une touche
+maintenue (HumanInput.next_repeat), ou au plus tard `idle_interval`. L'attente se
+fait dans pygame.event.wait: une touche ou un clic la réveille aussitôt.
+"""
+import math
+import time
+from typing import Optional
+
+import pygame
+
+
+class FrameScheduler:
+    def __init__(self, fps: int = 60, idle_interval: float = 0.25):
+        self.fps = fps
+        self.idle_interval = idle_interval
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.idle_seconds = 0.0
+        self._rendered_changes = None
+        self._rendered_second = None
+
+    def invalidate(self):
+        """Force la prochaine image (fenêtre réexposée, redimensionnée...)"""
+        self._rendered_changes = None
+
+    def needs_render(self, model, view) -> bool:
+        return (model.changes != self._rendered_changes or view.animating(model)
+                or _timer_second(model) != self._rendered_second)
+
+    def rendered(self, model):
+        self.frames_rendered += 1
+        self._rendered_changes = model.changes
+        self._rendered_second = _timer_second(model)
+
+    def wait(self, model, input_due: Optional[float] = None):
+        """Dort (sans image) jusqu'au prochain événement du modèle ou la prochaine entrée
+        input_due: instant (perf_counter) de la prochaine répétition de touche"""
+        self.frames_skipped += 1
+        now = model.clock()
+        timeout = min(self.idle_interval, model.next_event_time() - now)
+        if model.game_started:
+            timeout = min(timeout, model.time_left() % 1.0)
+        start = time.perf_counter()
+        if input_due is not None:
+            timeout = min(timeout, input_due - start)
+        event = pygame.event.wait(max(1, int(math.ceil(timeout * 1000))))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)  # traité par la boucle au tour suivant
+        self.idle_seconds += time.perf_counter() - start
+
+
+def _timer_second(model):
+    """Seconde affichée par le chrono (None avant la première commande)"""
+    return int(model.time_left()) if model.game_started else None
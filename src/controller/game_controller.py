@@ -1,22 +1,62 @@
 import pygame
 import time
 from src.model.game_model import GameModel
-from src.view.game_view import GameView
+from src.model.layout import load_layout
+from src.view.game_view import GameView, init_display
 from src.controller.bot_controller import AIBot  
+from src.controller.frame_scheduler import FrameScheduler
+from src.controller.human_input import HumanInput
+from src.metrics.kpi import KitchenMetrics
 
 class GameController:
-    def __init__(self):
-        if not pygame.get_init():
-            pygame.init()
-        self.model = GameModel()
-        self.view = GameView()
+    def __init__(self, use_planner: bool = False, layout_path: str = None,
+                 metrics_port: int = None, metrics_jsonl: str = None, trace_path: str = None,
+                 record_path: str = None, canvas=None, scaler: str = "scale", idle_throttle: bool = True):
+        init_display()
+        layout = load_layout(layout_path) if layout_path else None
+        self.model = GameModel(layout=layout)
+        # canvas: (largeur, hauteur) du canevas logique, mis à l'échelle de l'écran (voir GameView)
+        self.view = GameView(logical_size=canvas, scaler=scaler)
         self.clock = pygame.time.Clock()
         self.running = True
         self.last_time = time.time()
+        # Cadence adaptative: plus d'images ni de ticks à 60 FPS quand rien ne bouge (bornes, kiosques).
+        # Désactivée pendant un enregistrement: la relecture suppose un tick par pas nominal.
+        self.scheduler = FrameScheduler() if idle_throttle and not record_path else None
 
         # Bot
         self.bot_enabled = True   # le bot joue automatiquement
-        self.bot = AIBot(player_index=0)
+        # use_planner: décisions par rollouts Monte Carlo au lieu de l'heuristique EDF
+        # (planner, traceur, enregistreur et exporteurs importés seulement s'ils sont demandés)
+        self.planner = None
+        if use_planner:
+            from src.controller.planner import MonteCarloPlanner
+            self.planner = MonteCarloPlanner()
+        # trace_path: phases de décision du bot en Chrome trace-event JSON, écrit en fin de partie
+        self.trace_path = trace_path
+        self.tracer = None
+        if trace_path:
+            from src.metrics.tracing import Tracer
+            self.tracer = Tracer()
+        self.bot = AIBot(player_index=0, planner=self.planner, tracer=self.tracer)
+        # Clavier: mêmes commandes que le bot (flèches, Espace, C); une touche reprend le chef au bot
+        self.human = HumanInput(player_index=0)
+
+        # Enregistrement de la partie (relecture: python -m src.replay.viewer)
+        self.recorder = None
+        if record_path:
+            from src.replay.recording import SessionRecorder
+            self.recorder = SessionRecorder(self.model, record_path)
+
+        # Indicateurs (Prometheus sur metrics_port, snapshots JSONL dans metrics_jsonl)
+        self.metrics = KitchenMetrics(self.model)
+        self.exporters = []
+        if metrics_port is not None or metrics_jsonl:
+            from src.metrics.export import JsonlSnapshotter, PrometheusExporter
+        if metrics_port is not None:
+            self.exporters.append(PrometheusExporter([self.metrics], port=metrics_port).start())
+        if metrics_jsonl:
+            self.exporters.append(JsonlSnapshotter([self.metrics], metrics_jsonl).start())
     
     def run(self):
         """Boucle principale du jeu"""
@@ -26,31 +66,66 @@ class GameController:
             self.last_time = current_time
             
             self._handle_events()
+            # Entrées du joueur appliquées juste avant le pas du modèle: visibles dans l'image de ce tour
+            if self.human.apply(self.model) and self.scheduler is not None:
+                self.scheduler.invalidate()
             # Mise à jour modèle
             self.model.update(delta_time)
 
             # Bot: fait les actions automatiquement
             if self.bot_enabled:
                 self.bot.update(self.model)
+            if self.recorder is not None:
+                self.recorder.record()
 
-            # Rendu
-            self.view.render(self.model)
-            self.clock.tick(60)  # 60 FPS
-    
-    def _handle_events(self):
-        """Gère les événements d'entrée"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+            # Rendu (ou attente du prochain événement si rien ne bouge)
+            if self.scheduler is None:
+                self.view.render(self.model)
+                self.human.displayed()
+                self.clock.tick(60)  # 60 FPS
+            elif self.scheduler.needs_render(self.model, self.view):
+                self.view.render(self.model)
+                self.human.displayed()
+                self.scheduler.rendered(self.model)
+                self.clock.tick(self.scheduler.fps)
+            else:
+                self.scheduler.wait(self.model, self.human.next_repeat())
 
+        if self.human.latency.count:
+            print(self.human.report())
+        if self.planner is not None:
+            self.planner.close()
+        for exporter in self.exporters:
+            exporter.close()
+        if self.tracer is not None:
+            self.tracer.save(self.trace_path)
+        if self.recorder is not None:
+            self.recorder.close()
+    
     def _handle_events(self):
         """Gère les événements d'entrée"""
         for event in pygame.event.get():
             # Quitter via le bouton de la fenêtre
             if event.type == pygame.QUIT:
                 self.running = False
-            
-            # Quitter via la touche ESC (Échap)
+
             if event.type == pygame.KEYDOWN:
+                # Quitter via la touche ESC (Échap)
                 if event.key == pygame.K_ESCAPE:
-                    self.running = False
\ No newline at end of file
+                    self.running = False
+                # B: rend la main au bot (ou la reprend)
+                elif event.key == pygame.K_b:
+                    self.bot_enabled = not self.bot_enabled
+                elif self.human.handles(event.key):
+                    # Le joueur reprend la main: le bot s'arrête pour ne pas se disputer le chef
+                    self.bot_enabled = False
+                    self.human.key_down(event)
+
+            if event.type == pygame.KEYUP:
+                self.human.key_up(event.key)
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.human.release_all()
+
+            # Fenêtre réaffichée ou redimensionnée: redessiner même si rien n'a changé
+            if event.type in (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED) and self.scheduler is not None:
+                self.scheduler.invalidate()
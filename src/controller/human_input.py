@@ -0,0 +1,102 @@
+"""Commandes du joueur humain: clavier -> actions du modèle, avec latence mesurée
+
+Les touches sont lues avec les autres événements en début de tour, puis
+appliquées juste avant le pas du modèle (apply): une pression est visible dès
+l'image du même tour. Répétition gérée ici (et non par SDL): une flèche
+maintenue redéplace le joueur après `repeat_delay`, puis toutes les
+`repeat_interval` secondes.
+
+Latence entrée -> image: chaque pression est horodatée à sa lecture (ou à son
+émission, attribut `sent` en secondes perf_counter, pour les événements
+injectés par un benchmark) et mesurée quand l'image qui en tient compte est
+affichée (displayed). pygame 2 ne donne pas l'horodatage SDL des touches:
+l'attente dans la file avant lecture (au plus une image) n'est comptée que
+pour les événements injectés.
+"""
+import time
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.metrics.histogram import LogHistogram
+
+MOVES: Dict[int, Tuple[int, int]] = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+INTERACT = pygame.K_SPACE
+CHOP = pygame.K_c
+
+
+class HumanInput:
+    def __init__(self, player_index: int = 0, repeat_delay: float = 0.2, repeat_interval: float = 0.1):
+        self.player_index = player_index
+        self.repeat_delay = repeat_delay
+        self.repeat_interval = repeat_interval
+        self.latency = LogHistogram(lowest=1e-4, highest=10.0, precision=0.01)  # secondes
+        self._pending: List[Tuple[int, float]] = []   # (touche, instant) à appliquer au prochain pas
+        self._held: Dict[int, float] = {}             # flèche maintenue -> prochaine répétition
+        self._unshown: List[float] = []               # instants des entrées appliquées, pas encore affichées
+
+    def handles(self, key: int) -> bool:
+        return key in MOVES or key == INTERACT or key == CHOP
+
+    def key_down(self, event: pygame.event.Event, now: float = None):
+        now = time.perf_counter() if now is None else now
+        self._pending.append((event.key, getattr(event, "sent", now)))
+        if event.key in MOVES:
+            self._held[event.key] = now + self.repeat_delay
+
+    def key_up(self, key: int):
+        self._held.pop(key, None)
+
+    def release_all(self):
+        """Fenêtre sans focus: les KEYUP n'arriveront pas"""
+        self._held.clear()
+
+    def next_repeat(self):
+        """Instant (perf_counter) de la prochaine répétition d'une flèche maintenue, None sinon"""
+        return min(self._held.values(), default=None)
+
+    def apply(self, model, now: float = None) -> bool:
+        """Applique les pressions en attente et les répétitions dues; True si une entrée a été appliquée"""
+        now = time.perf_counter() if now is None else now
+        applied = bool(self._pending)
+        for key, stamp in self._pending:
+            self._act(model, key)
+            self._unshown.append(stamp)
+        self._pending.clear()
+        for key, due in self._held.items():
+            if now >= due:
+                dx, dy = MOVES[key]
+                model.move_player(self.player_index, dx, dy)
+                self._held[key] = max(due + self.repeat_interval, now)
+                applied = True
+        return applied
+
+    def _act(self, model, key: int):
+        if key in MOVES:
+            model.move_player(self.player_index, *MOVES[key])
+        elif key == INTERACT:
+            model.interact_with_station(self.player_index)
+        elif key == CHOP:
+            model.chop_at_station(self.player_index)
+
+    def displayed(self, now: float = None):
+        """L'image qui reflète les entrées appliquées vient d'être affichée"""
+        if not self._unshown:
+            return
+        now = time.perf_counter() if now is None else now
+        record = self.latency.record
+        for stamp in self._unshown:
+            record(now - stamp)
+        self._unshown.clear()
+
+    def report(self) -> str:
+        h = self.latency
+        ps = h.percentiles((50, 90, 99))
+        return (f"latence entrée -> image ({h.count} entrées): "
+                + " ".join(f"{name}={value * 1000:.1f} ms" for name, value in ps.items())
+                + f" max={h.max * 1000:.1f} ms")
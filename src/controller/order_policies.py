@@ -0,0 +1,144 @@
+"""Choix de la prochaine commande du bot (BotParams.order_choice)
+
+Une politique est une fonction (commandes actives, durées) -> commande, où
+durées(order) est le temps estimé pour préparer et livrer la commande
+(estimate_duration, mis en cache par le bot). Politiques fournies:
+
+    edf       échéance la plus proche
+    fifo      la plus ancienne
+    spt       la plus rapide à préparer (puis la plus urgente)
+    density   meilleur gain par seconde de préparation: prix de base + bonus
+              de temps restant à la livraison (_handle_delivery), divisé par
+              la durée; une commande livrée trop tard ne rapporte rien
+    feasible  la plus urgente parmi celles qu'on peut encore livrer à temps,
+              sinon celle qui laisse le plus de marge
+
+register_order_policy ajoute une politique (balayages, tournoi, BotParams).
+"""
+import math
+from typing import Callable, Dict, Optional, Tuple
+
+from src.model.game_model import MOVE_STEP, GameModel, Order, Station, StationType
+from src.model.order_book import OrderBook
+from src.model.recipes import COOKED_FORM, Recipe
+
+# Gains d'une livraison à l'heure (GameModel._handle_delivery)
+BASE_PRICE = 15
+TIME_BONUS_RATE = 0.5  # $ par seconde restante
+
+Durations = Callable[[Order], float]
+OrderPolicy = Callable[[OrderBook, Durations], Optional[Order]]
+
+
+def estimate_duration(m: GameModel, recipe: Recipe, step_gap: float) -> float:
+    """Temps (s) que met AIBot pour une recette, de l'assemblage à la livraison
+
+    Reprend la forme des plans d'AIBot: chaque étape planifiée (aller,
+    interagir, couper) et sa pause coûtent un cycle de step_gap, chaque pas de
+    déplacement (MOVE_STEP) aussi; s'y ajoutent les cuissons attendues sur
+    place. inf si la cuisine n'a pas de quoi préparer la recette.
+    """
+    a = _first(m, StationType.ASSEMBLY)
+    d = _first(m, StationType.DELIVERY)
+    if a is None or d is None:
+        return math.inf
+    pos = _anchor(m, a)
+    cycles = 0
+    waiting = 0.0
+
+    def go(station: Station, actions: int):
+        nonlocal pos, cycles
+        target = _anchor(m, station)
+        moves = math.ceil((abs(target[0] - pos[0]) + abs(target[1] - pos[1])) / MOVE_STEP)
+        cycles += moves + 2 * (1 + actions)  # déplacement, GO_TO + pause, étapes + pauses
+        pos = target
+
+    for ingredient, needs_chopping in recipe.ingredients:
+        spawn = m.spawns.get(ingredient)
+        if spawn is None:
+            return math.inf
+        go(spawn, 1)
+        if ingredient in COOKED_FORM:
+            stove = _first(m, StationType.STOVE)
+            if stove is None:
+                return math.inf
+            go(stove, 2)  # poser, reprendre une fois cuit
+            waiting += stove.cooking_duration
+        elif needs_chopping:
+            board = _first(m, StationType.CUTTING_BOARD)
+            if board is None:
+                return math.inf
+            go(board, 3)  # poser, couper, reprendre
+        go(a, 1)
+    if recipe.needs_baking:
+        furnace = _first(m, StationType.FURNACE)
+        if furnace is None:
+            return math.inf
+        cycles += 2  # reprendre la pizza crue
+        go(furnace, 2)
+        waiting += furnace.cooking_duration
+    go(d, 1)
+    return cycles * step_gap + waiting
+
+
+def _first(m: GameModel, station_type: StationType) -> Optional[Station]:
+    stations = m.stations_by_type[station_type]
+    return stations[0] if stations else None
+
+
+def _anchor(m: GameModel, s: Station) -> Tuple[int, int]:
+    """Case où le bot se place devant une station (AIBot._anchor)"""
+    return s.x, min(m.max_y, s.y + 50)
+
+
+def delivery_value(order: Order, duration: float) -> float:
+    """Gain attendu si on commence la commande maintenant (0 si elle expire avant)"""
+    left = order.time_remaining - duration
+    return BASE_PRICE + TIME_BONUS_RATE * left if left > 0 else 0.0
+
+
+# ============ POLITIQUES ============
+def earliest_deadline(orders: OrderBook, durations: Durations) -> Optional[Order]:
+    return orders.earliest()
+
+
+def first_in(orders: OrderBook, durations: Durations) -> Optional[Order]:
+    return next(iter(orders), None)
+
+
+def shortest_processing(orders: OrderBook, durations: Durations) -> Optional[Order]:
+    return min(orders, key=lambda o: (durations(o), o.time_remaining), default=None)
+
+
+def value_density(orders: OrderBook, durations: Durations) -> Optional[Order]:
+    def density(o: Order):
+        duration = durations(o)
+        return (delivery_value(o, duration) / duration if duration > 0 else 0.0, -o.time_remaining)
+    return max(orders, key=density, default=None)
+
+
+def feasible_deadline(orders: OrderBook, durations: Durations) -> Optional[Order]:
+    best, best_slack = None, -math.inf
+    for o in orders:
+        slack = o.time_remaining - durations(o)
+        if slack >= 0:
+            if best_slack < 0 or o.time_remaining < best.time_remaining:
+                best, best_slack = o, slack
+        elif best_slack < 0 and slack > best_slack:
+            best, best_slack = o, slack
+    return best
+
+
+ORDER_POLICIES: Dict[str, OrderPolicy] = {
+    "edf": earliest_deadline,
+    "fifo": first_in,
+    "spt": shortest_processing,
+    "density": value_density,
+    "feasible": feasible_deadline,
+}
+
+
+def register_order_policy(name: str, policy: OrderPolicy):
+    if name in ORDER_POLICIES:
+        raise ValueError(f"politique de commande en double: {name}")
+    ORDER_POLICIES[name] = policy
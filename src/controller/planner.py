@@ -0,0 +1,160 @@
+"""Planificateur Monte Carlo pour AIBot
+
+À chaque point de décision (bot IDLE), on énumère des macro-actions
+(quelle commande servir, lancer un steak en avance ou non) et on les évalue
+par de courts rollouts sur des copies du GameModel. La politique de rollout
+est l'heuristique existante d'AIBot (_plan_from_model / _plan_ingredient),
+avec les réglages (BotParams) du bot qui décide.
+Les rollouts tournent dans un pool de processus sous un budget de temps par
+décision; ce qui n'est pas terminé à l'échéance est ignoré.
+"""
+import itertools
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.model.clock import SimClock
+from src.model.game_model import GameModel, ItemType, StationType
+from src.controller.bot_controller import AIBot, BotParams
+from src.simulation.headless import simulate
+
+
+@dataclass(frozen=True)
+class MacroAction:
+    order_id: int
+    precook: bool = False  # lancer un steak sur un fourneau libre avant la commande
+
+
+def _rollout(snapshot: GameModel, player_index: int, macro: MacroAction,
+             horizon: float, dt: float, seed: int, params: Optional[BotParams] = None) -> int:
+    """Joue `horizon` secondes simulées après la macro-action; retourne le gain de score
+    params: réglages du bot qui décide (pause entre étapes, politique de commande...)"""
+    model = snapshot.clone(clock=SimClock(snapshot.clock()), verbose=False)
+    model.rng.seed(seed)  # arrivées futures différentes d'un rollout à l'autre
+    bot = AIBot(player_index, verbose=False, params=params)
+    if not bot.apply_macro(model, macro):
+        return 0
+    start = model.score
+    simulate(model, bot, horizon, dt)
+    return model.score - start
+
+
+class MonteCarloPlanner:
+    def __init__(self, horizon: float = 30.0, rollouts_per_action: int = 4,
+                 time_budget: float = 0.05, workers: Optional[int] = None,
+                 dt: float = 0.05, max_candidates: int = 6,
+                 blocking: bool = False, seed: int = 0):
+        """
+        horizon: durée simulée de chaque rollout (s)
+        time_budget: temps réel max par décision (s)
+        workers: taille du pool (None = nb de CPU, 0 = rollouts dans le processus courant)
+        blocking: attendre les rollouts (headless) au lieu de redonner la main au jeu
+        """
+        self.horizon = horizon
+        self.rollouts_per_action = rollouts_per_action
+        self.time_budget = time_budget
+        self.workers = os.cpu_count() if workers is None else workers
+        self.dt = dt
+        self.max_candidates = max_candidates
+        self.blocking = blocking
+
+        self._seeds = itertools.count(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Optional[Tuple[Dict[Future, MacroAction], float, List[MacroAction]]] = None
+
+    # ============ MACRO-ACTIONS ============
+    def candidates(self, m: GameModel, bot) -> List[MacroAction]:
+        """Commandes par urgence, plus les variantes « steak en avance »"""
+        orders = m.orders.earliest_n(self.max_candidates)
+        macros = [MacroAction(o.id) for o in orders]
+
+        burger_waiting = any(ItemType.BURGER in o.items_needed for o in orders)
+        free_stove = any(s.item is None for s in m.stations_by_type[StationType.STOVE])
+        hands_free = m.players[bot.player_index].held_item is None
+        if burger_waiting and free_stove and hands_free:
+            macros += [MacroAction(o.id, precook=True) for o in orders
+                       if ItemType.BURGER not in o.items_needed]
+        return macros[:self.max_candidates]
+
+    # ============ DÉCISION ============
+    def decide(self, m: GameModel, bot) -> Optional[MacroAction]:
+        """Retourne la macro-action choisie, ou None si les rollouts sont encore en cours"""
+        if self._pending is None:
+            candidates = self.candidates(m, bot)
+            if not candidates:
+                return None
+            if len(candidates) == 1:
+                return candidates[0]
+            if self.workers == 0:
+                return self._decide_inline(m, bot, candidates)
+            self._submit(m, bot, candidates)
+            if not self.blocking:
+                return None
+        return self._collect()
+
+    def _snapshot(self, m: GameModel) -> GameModel:
+        return m.clone(clock=SimClock(m.clock()), verbose=False)
+
+    def _submit(self, m: GameModel, bot, candidates: List[MacroAction]):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        snapshot = self._snapshot(m)
+        futures = {}
+        for _ in range(self.rollouts_per_action):
+            for macro in candidates:
+                f = self._executor.submit(_rollout, snapshot, bot.player_index, macro,
+                                          self.horizon, self.dt, next(self._seeds), bot.params)
+                futures[f] = macro
+        self._pending = (futures, time.perf_counter() + self.time_budget, candidates)
+
+    def _collect(self) -> Optional[MacroAction]:
+        futures, deadline, candidates = self._pending
+        remaining = deadline - time.perf_counter()
+        if self.blocking:
+            wait(futures, timeout=max(0.0, remaining))
+        elif remaining > 0 and not all(f.done() for f in futures):
+            return None
+        self._pending = None
+
+        gains: Dict[MacroAction, List[int]] = {}
+        for f, macro in futures.items():
+            if f.done() and not f.cancelled() and f.exception() is None:
+                gains.setdefault(macro, []).append(f.result())
+            else:
+                f.cancel()
+        return self._best(candidates, gains)
+
+    def _decide_inline(self, m: GameModel, bot, candidates: List[MacroAction]) -> MacroAction:
+        deadline = time.perf_counter() + self.time_budget
+        snapshot = self._snapshot(m)
+        gains: Dict[MacroAction, List[int]] = {}
+        for _ in range(self.rollouts_per_action):
+            for macro in candidates:
+                if time.perf_counter() >= deadline:
+                    return self._best(candidates, gains)
+                gain = _rollout(snapshot, bot.player_index, macro, self.horizon, self.dt,
+                                next(self._seeds), bot.params)
+                gains.setdefault(macro, []).append(gain)
+        return self._best(candidates, gains)
+
+    def _best(self, candidates: List[MacroAction], gains: Dict[MacroAction, List[int]]) -> MacroAction:
+        """Meilleur gain moyen; à égalité (ou sans résultat) on garde l'ordre EDF"""
+        best, best_value = candidates[0], None
+        for macro in candidates:
+            if macro not in gains:
+                continue
+            value = sum(gains[macro]) / len(gains[macro])
+            if best_value is None or value > best_value:
+                best, best_value = macro, value
+        return best
+
+    def close(self):
+        if self._pending is not None:
+            for f in self._pending[0]:
+                f.cancel()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,126 @@
+"""Exporteurs des indicateurs (KitchenMetrics)
+
+- PrometheusExporter: GET /metrics au format texte Prometheus, servi par un
+  thread en arrière-plan (la boucle de jeu n'est jamais bloquée)
+- JsonlSnapshotter: une ligne JSON par cuisine toutes les `interval` secondes
+
+Les deux lisent les compteurs sans verrou: une lecture peut mélanger deux
+ticks, ce qui est sans conséquence pour des compteurs monotones. Les
+dictionnaires (issues, items brûlés, histogrammes par plat), que la boucle de
+jeu agrandit pendant la lecture, sont d'abord copiés d'un seul appel C
+(list(d.items()), sous le GIL): les parcourir directement lèverait
+« dictionary changed size during iteration » dans le thread de l'exporteur.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Sequence
+
+from src.metrics.kpi import KitchenMetrics
+
+_PREFIX = "overcooked"
+
+
+def render_prometheus(metrics_list: Sequence[KitchenMetrics]) -> str:
+    """Format d'exposition texte (version 0.0.4)"""
+    lines: List[str] = []
+
+    def family(name, kind, help_text, samples):
+        lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+            lines.append(f"{_PREFIX}_{name}{suffix}{{{label_text}}} {value}")
+
+    family("orders_created_total", "counter", "Commandes créées",
+           [("", {"kitchen": m.kitchen}, m.orders_created) for m in metrics_list])
+    family("orders_total", "counter", "Commandes terminées par issue",
+           [("", {"kitchen": m.kitchen, "outcome": outcome}, count)
+            for m in metrics_list for outcome, count in list(m.orders_by_outcome.items())])
+    family("orders_active", "gauge", "Commandes en attente",
+           [("", {"kitchen": m.kitchen}, m.orders_active) for m in metrics_list])
+    family("burnt_items_total", "counter", "Items brûlés par type",
+           [("", {"kitchen": m.kitchen, "item": item}, count)
+            for m in metrics_list for item, count in list(m.burnt_items.items())])
+    family("score", "gauge", "Score courant",
+           [("", {"kitchen": m.kitchen}, m.score) for m in metrics_list])
+    family("order_latency_seconds", "summary", "Délai création -> issue de la commande",
+           [s for m in metrics_list for (dish, outcome), hist in sorted(list(m.latency.items()))
+            for s in _summary_samples({"kitchen": m.kitchen, "dish": dish, "outcome": outcome}, hist)])
+    family("tick_rate", "gauge", "Ticks de simulation par seconde",
+           [("", {"kitchen": m.kitchen}, round(m.tick_rate, 2)) for m in metrics_list])
+    return "\n".join(lines) + "\n"
+
+
+def _summary_samples(labels, hist):
+    for q in (0.5, 0.9, 0.99):
+        yield "", {**labels, "quantile": str(q)}, round(hist.percentile(q * 100), 4)
+    yield "_sum", labels, hist.total
+    yield "_count", labels, hist.count
+
+
+class PrometheusExporter:
+    def __init__(self, metrics_list: Sequence[KitchenMetrics], host: str = "127.0.0.1", port: int = 9108):
+        self.metrics_list = list(metrics_list)
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render_prometheus(exporter.metrics_list).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def start(self) -> "PrometheusExporter":
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class JsonlSnapshotter:
+    def __init__(self, metrics_list: Sequence[KitchenMetrics], path: str, interval: float = 5.0):
+        self.metrics_list = list(metrics_list)
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-jsonl", daemon=True)
+
+    def start(self) -> "JsonlSnapshotter":
+        self._thread.start()
+        return self
+
+    def write_snapshot(self):
+        t = time.time()
+        with open(self.path, "a", encoding="utf-8") as f:
+            for m in self.metrics_list:
+                f.write(json.dumps({"t": round(t, 3), **m.snapshot()}) + "\n")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write_snapshot()
+
+    def close(self):
+        """Arrête le thread et écrit un dernier snapshot"""
+        self._stop.set()
+        self._thread.join()
+        self.write_snapshot()
@@ -0,0 +1,125 @@
+"""Histogramme de latences à buckets logarithmiques
+
+Chaque bucket couvre [lo * g^i, lo * g^(i+1)) avec g = 1 + 2 * precision:
+l'erreur relative d'un percentile est bornée par `precision` sur toute la
+plage, avec un nombre de buckets fixé à la construction (mémoire constante,
+~650 compteurs pour 10 ms..1 h à 1 %). Deux histogrammes de mêmes paramètres
+se fusionnent en additionnant leurs compteurs, ce qui permet d'agréger des
+parties jouées dans des processus différents (to_dict / from_dict pour JSON).
+"""
+import math
+from typing import Dict, Iterable, List, Optional
+
+
+class LogHistogram:
+    __slots__ = ("lowest", "highest", "precision", "_log_gamma", "counts",
+                 "count", "total", "min", "max")
+
+    def __init__(self, lowest: float = 0.01, highest: float = 3600.0, precision: float = 0.01):
+        """
+        lowest / highest: plage couverte (s); les valeurs hors plage vont au premier / dernier bucket
+        precision: erreur relative max d'un percentile
+        """
+        if not 0 < lowest < highest or not 0 < precision < 1:
+            raise ValueError("il faut 0 < lowest < highest et 0 < precision < 1")
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+        self._log_gamma = math.log1p(2 * precision)
+        self.counts: List[int] = [0] * (self._index(highest) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, value: float) -> int:
+        if value <= self.lowest:
+            return 0
+        return int(math.log(value / self.lowest) / self._log_gamma)
+
+    def record(self, value: float):
+        index = self._index(value)
+        counts = self.counts
+        counts[index if index < len(counts) else -1] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    # ============ REQUÊTES ============
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Valeur sous laquelle tombent p % des mesures (0 si vide)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                # Milieu (géométrique) du bucket, borné par les extrêmes observés
+                value = self.lowest * math.exp((index + 0.5) * self._log_gamma)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def percentiles(self, ps: Iterable[float] = (50, 90, 99)) -> Dict[str, float]:
+        return {f"p{p:g}": self.percentile(p) for p in ps}
+
+    # ============ FUSION ============
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        """Ajoute les mesures de `other` (mêmes paramètres) à cet histogramme"""
+        if (other.lowest, other.highest, other.precision) != (self.lowest, self.highest, self.precision):
+            raise ValueError("histogrammes de paramètres différents")
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def to_dict(self) -> dict:
+        """Forme compacte (seuls les buckets non vides)"""
+        return {
+            "lowest": self.lowest, "highest": self.highest, "precision": self.precision,
+            "count": self.count, "total": self.total,
+            "min": self.min if self.count else None, "max": self.max if self.count else None,
+            "buckets": {str(i): n for i, n in enumerate(self.counts) if n},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogHistogram":
+        hist = cls(data["lowest"], data["highest"], data["precision"])
+        for index, n in data["buckets"].items():
+            hist.counts[int(index)] = n
+        hist.count = data["count"]
+        hist.total = data["total"]
+        if hist.count:
+            hist.min = data["min"]
+            hist.max = data["max"]
+        return hist
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        hist = LogHistogram.from_dict(state)
+        for name in self.__slots__:
+            setattr(self, name, getattr(hist, name))
+
+
+def merge_all(histograms: Iterable[LogHistogram]) -> Optional[LogHistogram]:
+    """Fusion d'une suite d'histogrammes (None si la suite est vide)"""
+    merged = None
+    for hist in histograms:
+        if merged is None:
+            merged = LogHistogram(hist.lowest, hist.highest, hist.precision)
+        merged.merge(hist)
+    return merged
@@ -0,0 +1,124 @@
+"""Indicateurs de débit d'une cuisine
+
+Le collecteur est abonné aux événements du modèle (src/model/events.py):
+commande créée, retirée avec son issue (livrée, expirée, refusée), cuisson
+(item brûlé), tick.
+Le délai de chaque commande terminée va dans un histogramme par plat et par
+issue (src/metrics/histogram.py), d'où les percentiles p50/p90/p99.
+Chaque appel ne fait qu'incrémenter des compteurs: le coût dans update est
+négligeable. La lecture (snapshot) est faite par les exporteurs
+(src/metrics/export.py), éventuellement depuis un autre thread.
+"""
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.metrics.histogram import LogHistogram, merge_all
+
+OUTCOMES = ("delivered", "expired", "overcooked")
+
+# Le taux de ticks est recalculé tous les N ticks (évite un appel d'horloge par tick)
+_RATE_EVERY = 60
+
+
+class KitchenMetrics:
+    def __init__(self, model=None, kitchen: str = "0"):
+        self.kitchen = kitchen
+        self.model = None
+        self.orders_created = 0
+        self.orders_by_outcome: Dict[str, int] = {outcome: 0 for outcome in OUTCOMES}
+        self.burnt_items: Dict[str, int] = {}
+        # (plat, issue) -> histogramme du délai création -> issue (s)
+        self.latency: Dict[Tuple[str, str], LogHistogram] = {}
+        self.ticks = 0
+        self.tick_rate = 0.0      # ticks/s (temps réel)
+        self._rate_mark: Optional[float] = None
+        if model is not None:
+            self.attach(model)
+
+    def attach(self, model):
+        """Branche le collecteur sur un GameModel"""
+        if self.model is not None:
+            self.model.unsubscribe(self)
+        self.model = model
+        model.subscribe(self)
+
+    # ============ ÉVÉNEMENTS DU MODÈLE ============
+    def tick(self, now: float = None):
+        self.ticks += 1
+        if self.ticks % _RATE_EVERY == 0:
+            now = time.perf_counter()
+            if self._rate_mark is not None and now > self._rate_mark:
+                self.tick_rate = _RATE_EVERY / (now - self._rate_mark)
+            self._rate_mark = now
+
+    def order_added(self, order):
+        self.orders_created += 1
+
+    def order_removed(self, order, outcome: Optional[str]):
+        if outcome is not None:
+            self._order_done(order, outcome, self.model.clock())
+
+    def cooking_changed(self, station, state: str):
+        if state == "burnt":
+            self.item_burnt(station.item.item_type)
+
+    def _order_done(self, order, outcome: str, now: float):
+        self.orders_by_outcome[outcome] += 1
+        key = (order.items_needed[0].value, outcome)
+        hist = self.latency.get(key)
+        if hist is None:
+            hist = self.latency[key] = LogHistogram()
+        hist.record(now - order.created_at)
+
+    def item_burnt(self, item_type):
+        key = item_type.value
+        self.burnt_items[key] = self.burnt_items.get(key, 0) + 1
+
+    # ============ LECTURE ============
+    @property
+    def score(self) -> int:
+        return self.model.score if self.model is not None else 0
+
+    @property
+    def orders_active(self) -> int:
+        return len(self.model.orders) if self.model is not None else 0
+
+    def latency_for(self, dish: Optional[str] = None, outcome: Optional[str] = "delivered") -> Optional[LogHistogram]:
+        """Histogramme fusionné (None = tous les plats / toutes les issues)"""
+        # Copie d'abord: lu aussi par les threads des exporteurs pendant que le jeu ajoute des clés
+        return merge_all(h for (d, o), h in list(self.latency.items())
+                         if dish in (None, d) and outcome in (None, o))
+
+    def snapshot(self) -> dict:
+        """État courant; sûr depuis un autre thread (dictionnaires copiés avant d'être parcourus)"""
+        delivered = self.latency_for()
+        return {
+            "kitchen": self.kitchen,
+            "score": self.score,
+            "orders_created": self.orders_created,
+            "orders_active": self.orders_active,
+            **{f"orders_{outcome}": count for outcome, count in list(self.orders_by_outcome.items())},
+            "burnt_items": dict(self.burnt_items),
+            "latency_avg": delivered.mean if delivered else 0.0,
+            "latency": {f"{dish}/{outcome}": latency_summary(hist)
+                        for (dish, outcome), hist in sorted(list(self.latency.items()))},
+            "ticks": self.ticks,
+            "tick_rate": round(self.tick_rate, 2),
+        }
+
+
+def latency_summary(hist: LogHistogram, ps: Iterable[float] = (50, 90, 99)) -> dict:
+    return {"count": hist.count, "mean": round(hist.mean, 3),
+            **{name: round(v, 3) for name, v in hist.percentiles(ps).items()}}
+
+
+def merge_latency(latencies: Iterable[Dict[Tuple[str, str], LogHistogram]]) -> Dict[Tuple[str, str], LogHistogram]:
+    """Fusionne les histogrammes (plat, issue) de plusieurs parties (ex: processus parallèles)"""
+    merged: Dict[Tuple[str, str], LogHistogram] = {}
+    for latency in latencies:
+        for key, hist in latency.items():
+            if key in merged:
+                merged[key].merge(hist)
+            else:
+                merged[key] = merge_all([hist])
+    return merged
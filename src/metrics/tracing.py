@@ -0,0 +1,63 @@
+"""Traces des cycles de décision d'AIBot (format Chrome trace-event)
+
+Chaque phase d'AIBot.update (perception, sélection, planification, exécution
+d'une étape) devient un événement "complet" (ph = "X") avec sa durée réelle
+et des attributs (commande, recette, longueur de la file). Le fichier écrit
+par save() s'ouvre dans chrome://tracing, Perfetto ou speedscope (flamegraph).
+
+Sans tracer (AIBot.tracer = None), le bot ne fait aucun appel d'horloge.
+"""
+import json
+import os
+import threading
+import time
+from typing import List
+
+
+class Tracer:
+    def __init__(self, max_events: int = 1_000_000, process_name: str = "AIBot"):
+        """max_events: au-delà, les événements sont ignorés (compteur `dropped`)"""
+        self.max_events = max_events
+        self.events: List[dict] = []
+        self.dropped = 0
+        self._pid = os.getpid()
+        self._tid = threading.get_ident()
+        self._origin = time.perf_counter()
+        self.events.append({"name": "process_name", "ph": "M", "pid": self._pid, "tid": self._tid,
+                            "args": {"name": process_name}})
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def _ts(self, t: float) -> float:
+        return round((t - self._origin) * 1e6, 3)  # µs depuis la création du tracer
+
+    def complete(self, name: str, start: float, **args):
+        """Enregistre une phase commencée à `start` (valeur de now()) et finie maintenant"""
+        end = time.perf_counter()
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append({"name": name, "ph": "X", "pid": self._pid, "tid": self._tid,
+                            "ts": self._ts(start), "dur": self._ts(end) - self._ts(start), "args": args})
+
+    def instant(self, name: str, **args):
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append({"name": name, "ph": "i", "s": "t", "pid": self._pid, "tid": self._tid,
+                            "ts": self._ts(time.perf_counter()), "args": args})
+
+    def summary(self) -> dict:
+        """Nombre d'appels et temps total (ms) par phase"""
+        totals = {}
+        for event in self.events:
+            if event["ph"] == "X":
+                count, dur = totals.get(event["name"], (0, 0.0))
+                totals[event["name"]] = (count + 1, dur + event["dur"])
+        return {name: {"count": count, "total_ms": round(dur / 1000, 3)} for name, (count, dur) in totals.items()}
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms",
+                       "otherData": {"dropped": self.dropped}}, f)
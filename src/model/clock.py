@@ -0,0 +1,13 @@
+class SimClock:
+    """Horloge simulée avancée manuellement (simulations headless, rollouts)
+
+    S'utilise à la place de time.time: GameModel(clock=SimClock()).
+    """
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, dt: float):
+        self.now += dt
@@ -0,0 +1,49 @@
+"""Abonnements aux changements d'un GameModel
+
+model.subscribe(obj): chaque méthode de obj qui porte le nom d'un événement
+ci-dessous est appelée quand il se produit, les autres événements sont
+ignorés. Un émetteur parcourt la liste des méthodes abonnées à son événement:
+sans abonné, l'événement coûte un test de liste vide, et un abonné ne fait
+que O(changements) de travail par tick au lieu de comparer tout le modèle.
+
+    player_moved(player_index, player)
+    item_picked(player_index, station, item)   le joueur prend item (station None sur une réplique)
+    item_placed(player_index, station, item)   le joueur pose / livre item
+    item_chopped(station)
+    cooking_changed(station, state)            "started", "cooked", "burnt", "stopped"
+    station_changed(station)                   objet, cuisson ou contenu (après les précédents)
+    order_added(order)
+    order_removed(order, outcome)              "delivered", "expired", "overcooked",
+                                               None (disparue d'une réplique)
+    tick(now)                                  début de GameModel.update
+
+Les événements sont émis par GameModel et, pour une réplique, par
+DiffDecoder. Les copies (GameModel.clone) n'ont pas d'abonnés.
+"""
+from typing import Callable, List
+
+EVENTS = ("player_moved", "item_picked", "item_placed", "item_chopped", "cooking_changed",
+          "station_changed", "order_added", "order_removed", "tick")
+
+
+class ModelEvents:
+    """Méthodes abonnées, une liste par événement (model.events.order_added, etc.)"""
+    __slots__ = EVENTS
+
+    def __init__(self):
+        for name in EVENTS:
+            setattr(self, name, [])
+
+    def subscribe(self, listener):
+        for name in EVENTS:
+            handler = getattr(listener, name, None)
+            if callable(handler):
+                getattr(self, name).append(handler)
+        return listener
+
+    def unsubscribe(self, listener):
+        for name in EVENTS:
+            handlers: List[Callable] = getattr(self, name)
+            handler = getattr(listener, name, None)
+            if handler in handlers:
+                handlers.remove(handler)
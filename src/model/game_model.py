@@ -1,43 +1,29 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
-from enum import Enum
+from dataclasses import field, replace
+from typing import Callable, List, Optional
+import copy
+import math
 import time
 import random
 
-class ItemType(Enum):
-    TOMATO = "tomato"
-    LETTUCE = "lettuce"
-    BREAD = "bread"
-    COOKED_PATTY = "cooked_patty"
-    RAW_PATTY = "raw_patty"
-    BURNT_PATTY = "burnt_patty"
-    CHEESE = "cheese"
-    BURGER = "burger"
-    PIZZA = "pizza"
-    UNCOOKED_PIZZA = "uncooked_pizza"
-    SALAD = "salad"
+from src.model.events import ModelEvents
+from src.model.items import Item, ItemType, StationType, slotted
+from src.model.layout import KitchenLayout, default_layout
+from src.model.order_book import OrderBook
+from src.model.order_stream import ClassicStream, OrderStream
+from src.model.recipes import ingredient_bit, match_recipe, type_bits
 
-class StationType(Enum):
-    INGREDIENT_SPAWN = "ingredient_spawn"
-    CUTTING_BOARD = "cutting_board"
-    STOVE = "stove"
-    ASSEMBLY = "assembly"
-    DELIVERY = "delivery"
-    FURNACE = "furnace"
+INTERACT_RANGE = 70  # distance de Manhattan max joueur-station
+MOVE_STEP = 50
+HEATED_STATIONS = (StationType.STOVE, StationType.FURNACE)
 
-@dataclass
-class Item:
-    item_type: ItemType
-    chopped: bool = False
-    overcooked: bool = False
-
-@dataclass
+@slotted
 class Player:
     x: int
     y: int
     held_item: Optional[Item] = None
+    version: int = field(default=0, repr=False, compare=False)  # change quand held_item change
 
-@dataclass
+@slotted
 class Station:
     x: int
     y: int
@@ -48,144 +34,289 @@ class Station:
     overcook_duration: float = 5.0
     ingredient_type: Optional[ItemType] = None
     contents: List[Item] = field(default_factory=list)
+    contents_mask: int = 0  # bits des ingrédients posés (voir recipes.INGREDIENT_BITS)
+    version: int = field(default=0, repr=False, compare=False)  # change avec item, cuisson ou contenu
 
-@dataclass
+@slotted
 class Order:
     items_needed: List[ItemType]
-    time_remaining: float = 60.0
+    time_limit: float = 60.0
     expired: bool = False
     id: int = 0  # Add unique ID for tracking
+    deadline: float = 0.0  # échéance sur l'horloge du carnet (OrderBook.now)
+    created_at: float = 0.0  # heure d'arrivée (horloge du modèle)
+    book: Optional[OrderBook] = field(default=None, repr=False, compare=False)
+
+    @property
+    def time_remaining(self) -> float:
+        if self.book is None:
+            return self.time_limit
+        return self.deadline - self.book.now
 
 class GameModel:
-    def __init__(self):
-        self.players: List[Player] = [Player(100, 100)]
+    def __init__(self, clock: Callable[[], float] = time.time, verbose: bool = True,
+                 layout: Optional[KitchenLayout] = None,
+                 order_stream: Optional[OrderStream] = None, seed: Optional[int] = None):
+        # Horloge injectable: time.time en jeu, SimClock en simulation headless
+        self.clock = clock
+        self.verbose = verbose
+        # RNG propre à chaque partie: simulations parallèles reproductibles et indépendantes
+        self.rng = random.Random(seed)
+        # Profil de charge (par défaut le rythme d'origine: 3 max, toutes les 15-30 s)
+        self.order_stream = order_stream if order_stream is not None else ClassicStream()
+        self.layout = layout if layout is not None else default_layout()
+        self.width = self.layout.width
+        self.height = self.layout.height
+        # Bornes de déplacement (750x550 pour la cuisine par défaut)
+        self.max_x = self.width - MOVE_STEP
+        self.max_y = self.height - MOVE_STEP
+        self.players: List[Player] = [Player(x, y) for x, y in self.layout.players]
         self.stations: List[Station] = []
-        self.orders: List[Order] = []
+        self.orders = OrderBook()  # commandes actives, indexées par id, plat et échéance
         self.score = 0
         self.game_time = 300.0
         self.start_time = None  # Will be set when first order arrives
         self.next_order_id = 0  # Track order IDs
         self.completed_orders = []  # Track recently completed orders
-        self.next_order_time = time.time() + 3.0  # First order in 3 seconds
+        self.next_order_time = self.order_stream.start(self.clock(), self.rng)  # First order in 3 seconds
         self.game_started = False  # Track if game has started
+        # Abonnés aux changements (src/model/events.py): vue, indicateurs, encodeurs...
+        self.events = ModelEvents()
+        # Compteur de changements visibles (joueurs, stations, commandes, score): la boucle
+        # d'affichage ne redessine pas tant qu'il ne bouge pas (voir FrameScheduler)
+        self.changes = 0
+        # Versions par entité: Player.version, Station.version, OrderBook.version, et
+        # stations_version qui bouge avec n'importe quelle station (perception incrémentale du bot)
+        self.stations_version = 0
         
         self._setup_kitchen()
         # Don't generate order immediately - wait for timer
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
+    def subscribe(self, listener):
+        """Abonne listener aux événements dont il a les méthodes (voir src/model/events.py)"""
+        return self.events.subscribe(listener)
+
+    def unsubscribe(self, listener):
+        self.events.unsubscribe(listener)
+
+    def clone(self, clock: Optional[Callable[[], float]] = None, verbose: Optional[bool] = None) -> "GameModel":
+        """Copie indépendante de l'état du jeu (rollouts, simulations parallèles)"""
+        twin = GameModel.__new__(GameModel)
+        twin.__dict__.update(self.__dict__)
+        twin.clock = clock if clock is not None else self.clock
+        twin.verbose = verbose if verbose is not None else self.verbose
+        twin.events = ModelEvents()  # les copies (rollouts) n'ont pas d'abonnés (KPI, vue...)
+        # Les Item sont immuables et partagés: seuls les conteneurs sont copiés
+        twin.players = [replace(p) for p in self.players]
+        twin.stations = [replace(s, contents=list(s.contents)) for s in self.stations]
+        twin.orders = self.orders.clone(lambda o: replace(o, items_needed=list(o.items_needed)))
+        twin.completed_orders = [dict(c) for c in self.completed_orders]
+        twin.rng = random.Random()
+        twin.rng.setstate(self.rng.getstate())
+        twin.order_stream = copy.deepcopy(self.order_stream)
+        twin.rebuild_indexes()
+        return twin
+
+    def time_left(self) -> float:
+        """Temps de jeu restant (le chrono démarre à la première commande)"""
+        if not self.game_started:
+            return self.game_time
+        return max(0.0, self.game_time - (self.clock() - self.start_time))
+
+    def is_over(self) -> bool:
+        return self.game_started and self.time_left() <= 0
+
+    def next_event_time(self) -> float:
+        """Heure (self.clock) du prochain changement planifié: arrivée ou échéance de commande,
+        fin de cuisson ou de sur-cuisson, fin d'animation de commande terminée, fin de partie"""
+        now = self.clock()
+        times = [c['time'] + 3.0 for c in self.completed_orders]
+        if len(self.orders) < self.order_stream.max_concurrent:
+            times.append(self.next_order_time)
+        earliest = self.orders.earliest()
+        if earliest is not None:
+            times.append(now + earliest.time_remaining)
+        for station in self._cooking.values():
+            done = station.cooking_start_time + station.cooking_duration
+            times.append(done if now < done else station.cooking_start_time + station.overcook_duration)
+        if self.game_started:
+            times.append(self.start_time + self.game_time)
+        return min(times, default=math.inf)
     
     def _setup_kitchen(self):
-        """Configuration de la cuisine avec tous les ingrédients"""
-        # Spawn points (ligne du haut)
-        self.stations.extend([
-            Station(100, 100, StationType.INGREDIENT_SPAWN, ingredient_type=ItemType.TOMATO),
-            Station(200, 100, StationType.INGREDIENT_SPAWN, ingredient_type=ItemType.LETTUCE),
-            Station(300, 100, StationType.INGREDIENT_SPAWN, ingredient_type=ItemType.BREAD),
-            Station(400, 100, StationType.INGREDIENT_SPAWN, ingredient_type=ItemType.RAW_PATTY),
-            Station(500, 100, StationType.INGREDIENT_SPAWN, ingredient_type=ItemType.CHEESE),
-        ])
-        
-        # Stations de travail (ligne du milieu)
-        self.stations.extend([
-            Station(150, 200, StationType.CUTTING_BOARD),
-            Station(250, 200, StationType.CUTTING_BOARD),
-            Station(350, 200, StationType.STOVE),
-            Station(450, 200, StationType.STOVE),
-            Station(550, 200, StationType.FURNACE),
-        ])
-        
-        # Stations finales
-        self.stations.extend([
-            Station(250, 300, StationType.ASSEMBLY),
-            Station(400, 300, StationType.DELIVERY),
-        ])
+        """Construit les stations à partir du plan de cuisine"""
+        self.stations.extend(
+            Station(spec.x, spec.y, spec.station_type,
+                    cooking_duration=spec.cooking_duration,
+                    overcook_duration=spec.overcook_duration,
+                    ingredient_type=spec.ingredient_type)
+            for spec in self.layout.stations
+        )
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self):
+        """Index par plan, calculés une fois (à refaire si on modifie self.stations)"""
+        self.stations_by_type = {t: [] for t in StationType}
+        self.spawns = {}  # ItemType -> premier point de spawn
+        self._grid = {}   # cellule INTERACT_RANGE x INTERACT_RANGE -> [(rang, station)]
+        for i, station in enumerate(self.stations):
+            self.stations_by_type[station.station_type].append(station)
+            if station.station_type == StationType.INGREDIENT_SPAWN and station.ingredient_type:
+                self.spawns.setdefault(station.ingredient_type, station)
+            cell = (station.x // INTERACT_RANGE, station.y // INTERACT_RANGE)
+            self._grid.setdefault(cell, []).append((i, station))
+        # Fourneaux/fours en cours de cuisson: update ne parcourt que ceux-là
+        self._cooking = {
+            id(s): s for s in self.stations
+            if s.station_type in HEATED_STATIONS and s.item and s.cooking_start_time > 0
+        }
+
+    def _closest_station(self, player: Player, station_type: Optional[StationType] = None) -> Optional[Station]:
+        """Station la plus proche à portée (à égalité, la première du plan)"""
+        cx, cy = player.x // INTERACT_RANGE, player.y // INTERACT_RANGE
+        closest, best = None, None
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for i, station in self._grid.get((gx, gy), ()):
+                    if station_type is not None and station.station_type != station_type:
+                        continue
+                    distance = abs(player.x - station.x) + abs(player.y - station.y)
+                    if distance <= INTERACT_RANGE and (best is None or (distance, i) < best):
+                        closest, best = station, (distance, i)
+        return closest
     
     def _generate_order(self):
-        """Génère une nouvelle commande aléatoire"""
-        if len(self.orders) < 3:
-            possible_orders = [ItemType.BURGER, ItemType.PIZZA, ItemType.SALAD]            
-            chosen = random.choice(possible_orders)
-            order = Order([chosen], id=self.next_order_id)
+        """Génère une nouvelle commande (plat et cadence donnés par le profil de charge)"""
+        stream = self.order_stream
+        if len(self.orders) < stream.max_concurrent:
+            chosen = stream.next_dish(self.rng)
+            order = Order([chosen], time_limit=stream.patience, id=self.next_order_id,
+                          created_at=self.clock())
             self.next_order_id += 1
-            self.orders.append(order)
-            print(f"Nouvelle commande #{order.id}: {chosen.value.upper()}")
+            self.orders.add(order)
+            self.changes += 1
+            for handler in self.events.order_added:
+                handler(order)
+            self._log(f"Nouvelle commande #{order.id}: {chosen.value.upper()}")
             
             # Start the game timer when first order arrives
             if not self.game_started:
                 self.game_started = True
-                self.start_time = time.time()
-                print("⏱ Game timer started!")
+                self.start_time = self.clock()
+                self._log("⏱ Game timer started!")
             
-            # Schedule next order with random delay (between 15-30 seconds)
-            self.next_order_time = time.time() + random.uniform(15.0, 30.0)
+            # Planifier la prochaine arrivée
+            self.next_order_time = stream.next_arrival(self.next_order_time, self.clock(), self.rng)
     
     def update(self, delta_time: float):
         """Met à jour le modèle de jeu"""
-        current_time = time.time()
+        current_time = self.clock()
+        for handler in self.events.tick:
+            handler(current_time)
         
         # Clean up old completed orders
-        self.completed_orders = [o for o in self.completed_orders if current_time - o['time'] < 3.0]
+        if self.completed_orders:
+            recent = [o for o in self.completed_orders if current_time - o['time'] < 3.0]
+            if len(recent) != len(self.completed_orders):
+                self.changes += 1
+            self.completed_orders = recent
         
-        # Check if it's time to generate a new order
-        if current_time >= self.next_order_time and len(self.orders) < 3:
+        # Check if it's time to generate new orders (plusieurs par tick sous forte charge)
+        while current_time >= self.next_order_time and len(self.orders) < self.order_stream.max_concurrent:
             self._generate_order()
         
         # Only update order timers if game has started
         if self.game_started:
-            # Mise à jour du temps des commandes
-            for order in self.orders[:]:
-                if not order.expired:
-                    order.time_remaining -= delta_time
-                    if order.time_remaining <= 0:
-                        order.expired = True
-                        self.score -= 20
-                        print(f"⏰ Commande expirée: {order.items_needed[0].value} (-20$)")
-                        self.orders.remove(order)
-                        # Mark as expired for animation
-                        self.completed_orders.append({
-                            'id': order.id,
-                            'type': 'expired',
-                            'time': current_time
-                        })
+            # Mise à jour du temps des commandes (seules les échues sont visitées)
+            self.orders.advance(delta_time)
+            for order in self.orders.expire():
+                order.expired = True
+                self.changes += 1
+                self.score -= 20
+                self._log(f"⏰ Commande expirée: {order.items_needed[0].value} (-20$)")
+                for handler in self.events.order_removed:
+                    handler(order, "expired")
+                # Mark as expired for animation
+                self.completed_orders.append({
+                    'id': order.id,
+                    'type': 'expired',
+                    'time': current_time
+                })
         
         # Mise à jour des stations (cuisson et sur-cuisson)
-        for station in self.stations:
-            if (station.station_type in [StationType.STOVE, StationType.FURNACE] and 
-                station.item and
-                station.cooking_start_time > 0):
-                
-                cooking_time = current_time - station.cooking_start_time
-                
-                # Cuit parfaitement
-                if cooking_time >= station.cooking_duration and cooking_time < station.overcook_duration:
-                    # Logique pour le steak
-                    if station.item.item_type == ItemType.RAW_PATTY and station.item.item_type != ItemType.COOKED_PATTY:
-                        station.item = Item(ItemType.COOKED_PATTY)
-                        print("✅ Steak parfaitement cuit!")
-                    # Logique pour la pizza
-                    elif station.item.item_type == ItemType.UNCOOKED_PIZZA and station.item.item_type != ItemType.PIZZA:
-                        station.item = Item(ItemType.PIZZA)
-                        print("✅ Pizza cuite à la perfection !")
-                
-                # Trop cuit / brûlé
-                elif cooking_time >= station.overcook_duration:
-                    # Logique pour le steak
-                    if station.item.item_type != ItemType.BURNT_PATTY and station.station_type == StationType.STOVE:
-                        station.item = Item(ItemType.BURNT_PATTY, overcooked=True)
-                        print("🔥 Steak brûlé! (Overcooked)")
-                        station.cooking_start_time = 0.0
-                    # Logique pour la pizza (elle peut aussi brûler !)
-                    elif station.item.item_type != ItemType.PIZZA and station.station_type == StationType.FURNACE:
-                        station.item = Item(ItemType.PIZZA, overcooked=True) # Une pizza brûlée est une "mauvaise" pizza
-                        print("🔥 Pizza brûlée ! (Overcooked)")
-                        station.cooking_start_time = 0.0
+        for station in list(self._cooking.values()):
+            cooking_time = current_time - station.cooking_start_time
+            
+            # Cuit parfaitement
+            if cooking_time >= station.cooking_duration and cooking_time < station.overcook_duration:
+                # Logique pour le steak
+                if station.item.item_type == ItemType.RAW_PATTY:
+                    station.item = Item(ItemType.COOKED_PATTY)
+                    self._cooking_changed(station, "cooked")
+                    self._log("✅ Steak parfaitement cuit!")
+                # Logique pour la pizza
+                elif station.item.item_type == ItemType.UNCOOKED_PIZZA:
+                    station.item = Item(ItemType.PIZZA)
+                    self._cooking_changed(station, "cooked")
+                    self._log("✅ Pizza cuite à la perfection !")
+            
+            # Trop cuit / brûlé
+            elif cooking_time >= station.overcook_duration:
+                # Logique pour le steak
+                if station.item.item_type != ItemType.BURNT_PATTY and station.station_type == StationType.STOVE:
+                    station.item = Item(ItemType.BURNT_PATTY, overcooked=True)
+                    self._log("🔥 Steak brûlé! (Overcooked)")
+                    self._stop_cooking(station, "burnt")
+                    self._touch(station)
+                # Logique pour la pizza (elle peut aussi brûler !)
+                elif station.item.item_type != ItemType.PIZZA and station.station_type == StationType.FURNACE:
+                    station.item = Item(ItemType.PIZZA, overcooked=True) # Une pizza brûlée est une "mauvaise" pizza
+                    self._log("🔥 Pizza brûlée ! (Overcooked)")
+                    self._stop_cooking(station, "burnt")
+                    self._touch(station)
+
+    def _touch(self, station: Station):
+        """Note un changement d'état d'une station (versions, compteur d'affichage, abonnés)"""
+        station.version += 1
+        self.stations_version += 1
+        self.changes += 1
+        for handler in self.events.station_changed:
+            handler(station)
+
+    def _cooking_changed(self, station: Station, state: str):
+        for handler in self.events.cooking_changed:
+            handler(station, state)
+        self._touch(station)
+
+    def _start_cooking(self, station: Station):
+        station.cooking_start_time = self.clock()
+        self._cooking[id(station)] = station
+        for handler in self.events.cooking_changed:
+            handler(station, "started")
+
+    def _stop_cooking(self, station: Station, state: str = "stopped"):
+        """state: "stopped" (retiré du feu) ou "burnt" """
+        station.cooking_start_time = 0.0
+        self._cooking.pop(id(station), None)
+        for handler in self.events.cooking_changed:
+            handler(station, state)
 
     def move_player(self, player_index: int, dx: int, dy: int):
         """Déplace un joueur"""
         if 0 <= player_index < len(self.players):
             player = self.players[player_index]
-            new_x = max(0, min(750, player.x + dx * 50))
-            new_y = max(0, min(550, player.y + dy * 50))
-            player.x = new_x
-            player.y = new_y
+            new_x = max(0, min(self.max_x, player.x + dx * MOVE_STEP))
+            new_y = max(0, min(self.max_y, player.y + dy * MOVE_STEP))
+            if (new_x, new_y) != (player.x, player.y):
+                self.changes += 1
+                player.x = new_x
+                player.y = new_y
+                for handler in self.events.player_moved:
+                    handler(player_index, player)
     
     def interact_with_station(self, player_index: int):
         """Gère l'interaction joueur-station"""
@@ -195,17 +326,20 @@ class GameModel:
         player = self.players[player_index]
         
         # Trouver la station la plus proche
-        closest_station = None
-        min_distance = float('inf')
-        
-        for station in self.stations:
-            distance = abs(player.x - station.x) + abs(player.y - station.y)
-            if distance < min_distance and distance <= 70:
-                min_distance = distance
-                closest_station = station
-        
+        closest_station = self._closest_station(player)
         if closest_station:
+            held = player.held_item
             self._handle_station_interaction(player, closest_station)
+            if player.held_item is not held:
+                if held is not None:
+                    for handler in self.events.item_placed:
+                        handler(player_index, closest_station, held)
+                if player.held_item is not None:
+                    for handler in self.events.item_picked:
+                        handler(player_index, closest_station, player.held_item)
+            # (compte aussi les interactions sans effet: un rendu ou une perception de trop, au pire)
+            player.version += 1
+            self._touch(closest_station)
     
     def _handle_station_interaction(self, player: Player, station: Station):
         """Gère l'interaction spécifique avec une station"""
@@ -227,24 +361,24 @@ class GameModel:
                 if player.held_item.item_type == ItemType.RAW_PATTY:
                     station.item = player.held_item
                     player.held_item = None
-                    station.cooking_start_time = time.time()
+                    self._start_cooking(station)
             elif station.item and not player.held_item:
                 player.held_item = station.item
                 station.item = None
-                station.cooking_start_time = 0.0
+                self._stop_cooking(station)
 
         elif station.station_type == StationType.FURNACE:
             if player.held_item and not station.item:
                 if player.held_item.item_type == ItemType.UNCOOKED_PIZZA:
                     station.item = player.held_item
                     player.held_item = None
-                    station.cooking_start_time = time.time()
+                    self._start_cooking(station)
             elif station.item and not player.held_item:
                 # On ne peut prendre que des pizzas prêtes (cuites ou brûlées)
                 if station.item.item_type == ItemType.PIZZA:
                     player.held_item = station.item
                     station.item = None
-                    station.cooking_start_time = 0.0
+                    self._stop_cooking(station)
         
         elif station.station_type == StationType.ASSEMBLY:
             self._handle_assembly(player, station)
@@ -261,7 +395,7 @@ class GameModel:
                 station.item = None
                 # Check if overcooked
                 if getattr(player.held_item, 'overcooked', False):
-                    print("⚠️ Picked up overcooked dish - cannot be served!")
+                    self._log("⚠️ Picked up overcooked dish - cannot be served!")
             return
         
         # Si le joueur pose un ingrédient
@@ -271,22 +405,24 @@ class GameModel:
             # Special case: if holding a finished dish and assembly has contents, dispose of old contents
             if held.item_type in [ItemType.BURGER, ItemType.PIZZA, ItemType.SALAD]:
                 if station.contents:
-                    print("🗑️ Clearing partial ingredients from assembly station")
+                    self._log("🗑️ Clearing partial ingredients from assembly station")
                     station.contents.clear()
+                    station.contents_mask = 0
                 return
             
             # Ne pas accepter de viande brûlée
             if held.item_type == ItemType.BURNT_PATTY:
-                print("❌ Viande brûlée, impossible de l'utiliser!")
+                self._log("❌ Viande brûlée, impossible de l'utiliser!")
                 return
             
             # Ajouter l'ingrédient s'il n'est pas déjà présent
-            if not any(i.item_type == held.item_type for i in station.contents):
+            if not station.contents_mask & type_bits(held.item_type):
                 # Vérifier si l'ingrédient doit être coupé
                 if held.item_type in [ItemType.TOMATO, ItemType.LETTUCE] and not held.chopped:
                     return
                 
                 station.contents.append(held)
+                station.contents_mask |= ingredient_bit(held)
                 player.held_item = None
                 
                 # Vérifier si une recette est complète
@@ -295,47 +431,25 @@ class GameModel:
             # Reprendre le dernier ingrédient (allows salvaging partial work)
             if station.contents:
                 last = station.contents.pop()
+                station.contents_mask &= ~ingredient_bit(last)
                 player.held_item = last
-                print(f"📦 Picked up {last.item_type.value} from assembly")
+                self._log(f"📦 Picked up {last.item_type.value} from assembly")
     
     def _check_recipe_completion(self, station: Station):
-        """Vérifie si les ingrédients forment un plat complet"""
-        types = {item.item_type for item in station.contents}
+        """Vérifie si les ingrédients forment un plat complet (une recherche par masque)"""
+        recipe = match_recipe(station.contents_mask)
+        if recipe is None:
+            return
         
         # Vérifier si un item est overcook
-        has_overcooked = any(getattr(item, 'overcooked', False) for item in station.contents)
-        
-        # Burger: pain + steak cuit + tomate coupée + salade coupée
-        if (ItemType.BREAD in types and 
-            ItemType.COOKED_PATTY in types and
-            any(i.item_type == ItemType.TOMATO and i.chopped for i in station.contents) and
-            any(i.item_type == ItemType.LETTUCE and i.chopped for i in station.contents)):
-            burger = Item(ItemType.BURGER)
-            burger.overcooked = has_overcooked
-            station.item = burger
-            station.contents.clear()
-            if has_overcooked:
-                print("🍔 Burger assemblé (mais trop cuit!)")
-            else:
-                print("🍔 Burger assemblé!")
-        
-        # Pizza: pain + tomate coupée + fromage
-        elif (ItemType.BREAD in types and
-              any(i.item_type == ItemType.TOMATO and i.chopped for i in station.contents) and
-              ItemType.CHEESE in types):
-            pizza = Item(ItemType.UNCOOKED_PIZZA) 
-            pizza.overcooked = has_overcooked
-            station.item = pizza
-            station.contents.clear()
-            print("🍕 Pizza non cuite assemblée !")
-        
-        # Salade: salade coupée + tomate coupée
-        elif (any(i.item_type == ItemType.LETTUCE and i.chopped for i in station.contents) and
-              any(i.item_type == ItemType.TOMATO and i.chopped for i in station.contents) and
-              len(station.contents) == 2):
-            station.item = Item(ItemType.SALAD)
-            station.contents.clear()
-            print("🥗 Salade assemblée!")
+        has_overcooked = any(item.overcooked for item in station.contents)
+        station.item = Item(recipe.result, overcooked=has_overcooked)
+        station.contents.clear()
+        station.contents_mask = 0
+        if has_overcooked:
+            self._log(f"{recipe.icon} {recipe.name} assemblé(e) (mais trop cuit!)")
+        else:
+            self._log(f"{recipe.icon} {recipe.name} assemblé(e)!")
     
     def _handle_delivery(self, player: Player):
         """Gère la livraison des plats"""
@@ -346,41 +460,43 @@ class GameModel:
         delivered_type = delivered_item.item_type
         is_overcooked = getattr(delivered_item, 'overcooked', False)
         
-        # Chercher une commande correspondante
-        for order in self.orders[:]:
-            if delivered_type in order.items_needed:
-                self.orders.remove(order)
-                
-                # Calculer le score selon qualité et timing
-                time_bonus = max(0, int(order.time_remaining / 2))
-                
-                if is_overcooked:
-                    # Penalize overcooked food
-                    penalty = 10
-                    self.score -= penalty
-                    player.held_item = None
-                    print(f"😡 OVERCOOKED! {delivered_type.value.upper()} refusé (-{penalty}$)")
-                    # Mark as overcooked for animation
-                    self.completed_orders.append({
-                        'id': order.id,
-                        'type': 'overcooked',
-                        'time': time.time()
-                    })
-                else:
-                    base_price = 15
-                    total = base_price + time_bonus
-                    self.score += total
-                    player.held_item = None
-                    print(f"😄 Livraison parfaite: {delivered_type.value.upper()} (+{total}$ = {base_price}$ + {time_bonus}$ bonus)")
-                    # Mark as completed for animation
-                    self.completed_orders.append({
-                        'id': order.id,
-                        'type': 'completed',
-                        'time': time.time()
-                    })
-                return
+        # Chercher une commande correspondante (la plus urgente pour ce plat)
+        order = self.orders.match(delivered_type)
+        if order is not None:
+            # Calculer le score selon qualité et timing
+            time_bonus = max(0, int(order.time_remaining / 2))
+            
+            if is_overcooked:
+                # Penalize overcooked food
+                penalty = 10
+                self.score -= penalty
+                player.held_item = None
+                self._log(f"😡 OVERCOOKED! {delivered_type.value.upper()} refusé (-{penalty}$)")
+                for handler in self.events.order_removed:
+                    handler(order, "overcooked")
+                # Mark as overcooked for animation
+                self.completed_orders.append({
+                    'id': order.id,
+                    'type': 'overcooked',
+                    'time': self.clock()
+                })
+            else:
+                base_price = 15
+                total = base_price + time_bonus
+                self.score += total
+                player.held_item = None
+                self._log(f"😄 Livraison parfaite: {delivered_type.value.upper()} (+{total}$ = {base_price}$ + {time_bonus}$ bonus)")
+                for handler in self.events.order_removed:
+                    handler(order, "delivered")
+                # Mark as completed for animation
+                self.completed_orders.append({
+                    'id': order.id,
+                    'type': 'completed',
+                    'time': self.clock()
+                })
+            return
         
-        print(f"❌ Aucune commande pour {delivered_type.value}")
+        self._log(f"❌ Aucune commande pour {delivered_type.value}")
     
     def chop_at_station(self, player_index: int):
         """Découpe un item sur la planche à découper"""
@@ -388,18 +504,13 @@ class GameModel:
             return
         
         player = self.players[player_index]
-        closest_cutting_board = None
-        min_distance = float('inf')
-        
-        for station in self.stations:
-            if station.station_type == StationType.CUTTING_BOARD:
-                distance = abs(player.x - station.x) + abs(player.y - station.y)
-                if distance < min_distance and distance <= 70:
-                    min_distance = distance
-                    closest_cutting_board = station
+        closest_cutting_board = self._closest_station(player, StationType.CUTTING_BOARD)
         
         if closest_cutting_board and closest_cutting_board.item:
             if closest_cutting_board.item.item_type in [ItemType.TOMATO, ItemType.LETTUCE]:
                 if not closest_cutting_board.item.chopped:
-                    closest_cutting_board.item.chopped = True
-                    print(f"🔪 {closest_cutting_board.item.item_type.value.capitalize()} coupé(e)!")
+                    closest_cutting_board.item = Item(closest_cutting_board.item.item_type, chopped=True)
+                    for handler in self.events.item_chopped:
+                        handler(closest_cutting_board)
+                    self._touch(closest_cutting_board)
+                    self._log(f"🔪 {closest_cutting_board.item.item_type.value.capitalize()} coupé(e)!")
@@ -0,0 +1,66 @@
+from dataclasses import dataclass, fields
+from enum import Enum
+
+class ItemType(Enum):
+    TOMATO = "tomato"
+    LETTUCE = "lettuce"
+    BREAD = "bread"
+    COOKED_PATTY = "cooked_patty"
+    RAW_PATTY = "raw_patty"
+    BURNT_PATTY = "burnt_patty"
+    CHEESE = "cheese"
+    BURGER = "burger"
+    PIZZA = "pizza"
+    UNCOOKED_PIZZA = "uncooked_pizza"
+    SALAD = "salad"
+
+class StationType(Enum):
+    INGREDIENT_SPAWN = "ingredient_spawn"
+    CUTTING_BOARD = "cutting_board"
+    STOVE = "stove"
+    ASSEMBLY = "assembly"
+    DELIVERY = "delivery"
+    FURNACE = "furnace"
+
+def slotted(cls):
+    """@dataclass avec __slots__ (équivalent de dataclass(slots=True), Python >= 3.10)
+
+    Pas de __dict__ par instance: moins de mémoire quand on héberge des milliers
+    de cuisines simulées dans un même processus.
+    """
+    cls = dataclass(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = {k: v for k, v in cls.__dict__.items()
+                 if k not in names and k not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+class Item:
+    """État d'ingrédient ou de plat, immuable et partagé (flyweight)
+
+    Item(ItemType.COOKED_PATTY) renvoie toujours la même instance: la cuisson,
+    la découpe et l'assemblage n'allouent plus rien, ils remplacent l'item.
+    """
+    __slots__ = ('item_type', 'chopped', 'overcooked')
+    _pool = {}
+
+    def __new__(cls, item_type: ItemType, chopped: bool = False, overcooked: bool = False):
+        key = (item_type, bool(chopped), bool(overcooked))
+        item = cls._pool.get(key)
+        if item is None:
+            item = object.__new__(cls)
+            object.__setattr__(item, 'item_type', item_type)
+            object.__setattr__(item, 'chopped', key[1])
+            object.__setattr__(item, 'overcooked', key[2])
+            cls._pool[key] = item
+        return item
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Item est immuable: créer Item(type, chopped=..., overcooked=...)")
+
+    def __reduce__(self):
+        # Re-interné au dépickling (process pool, enregistrements)
+        return (Item, (self.item_type, self.chopped, self.overcooked))
+
+    def __repr__(self):
+        return f"Item(item_type={self.item_type}, chopped={self.chopped}, overcooked={self.overcooked})"
@@ -0,0 +1,164 @@
+"""Plans de cuisine: taille, stations et positions de départ, chargés depuis un
+fichier JSON ou TOML. GameModel construit ses stations (et ses index) à partir
+d'un KitchenLayout; sans fichier, default_layout() reproduit la cuisine d'origine.
+
+Format (JSON; même structure en TOML avec des [[stations]]):
+
+    {
+      "name": "ma cuisine", "width": 800, "height": 600,
+      "players": [[100, 100]],
+      "counters": [[80, 140, 500, 80]],
+      "stations": [
+        {"type": "ingredient_spawn", "x": 100, "y": 100, "ingredient": "tomato"},
+        {"type": "stove", "x": 350, "y": 200, "cooking_duration": 3.0}
+      ]
+    }
+"""
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from src.model.items import ItemType, StationType
+
+
+@dataclass
+class StationSpec:
+    station_type: StationType
+    x: int
+    y: int
+    ingredient_type: Optional[ItemType] = None
+    cooking_duration: float = 3.0
+    overcook_duration: float = 5.0
+
+
+@dataclass
+class KitchenLayout:
+    name: str
+    width: int
+    height: int
+    stations: List[StationSpec]
+    players: List[Tuple[int, int]] = field(default_factory=lambda: [(100, 100)])
+    # Plans de travail décoratifs (x, y, w, h), dessinés par la vue
+    counters: List[Tuple[int, int, int, int]] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KitchenLayout":
+        stations = []
+        for i, raw in enumerate(data.get("stations", [])):
+            try:
+                ingredient = raw.get("ingredient")
+                stations.append(StationSpec(
+                    station_type=StationType(raw["type"]),
+                    x=int(raw["x"]),
+                    y=int(raw["y"]),
+                    ingredient_type=ItemType(ingredient) if ingredient else None,
+                    cooking_duration=float(raw.get("cooking_duration", 3.0)),
+                    overcook_duration=float(raw.get("overcook_duration", 5.0)),
+                ))
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"station #{i} invalide: {raw!r} ({e})") from e
+        if not stations:
+            raise ValueError("le plan ne contient aucune station")
+        return cls(
+            name=data.get("name", "sans nom"),
+            width=int(data.get("width", 800)),
+            height=int(data.get("height", 600)),
+            stations=stations,
+            players=[tuple(p) for p in data.get("players", [(100, 100)])],
+            counters=[tuple(c) for c in data.get("counters", [])],
+        )
+
+    def to_dict(self) -> dict:
+        stations = []
+        for s in self.stations:
+            raw = {"type": s.station_type.value, "x": s.x, "y": s.y}
+            if s.ingredient_type is not None:
+                raw["ingredient"] = s.ingredient_type.value
+            if s.cooking_duration != 3.0:
+                raw["cooking_duration"] = s.cooking_duration
+            if s.overcook_duration != 5.0:
+                raw["overcook_duration"] = s.overcook_duration
+            stations.append(raw)
+        return {
+            "name": self.name, "width": self.width, "height": self.height,
+            "players": [list(p) for p in self.players],
+            "counters": [list(c) for c in self.counters],
+            "stations": stations,
+        }
+
+
+def load_layout(path: Union[str, Path]) -> KitchenLayout:
+    """Charge un plan .json ou .toml"""
+    path = Path(path)
+    if path.suffix == ".toml":
+        try:
+            import tomllib  # Python >= 3.11
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise RuntimeError("plans TOML: Python >= 3.11 ou le paquet 'tomli' requis") from None
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    return KitchenLayout.from_dict(data)
+
+
+def default_layout() -> KitchenLayout:
+    """La cuisine d'origine: 5 ingrédients, 2 planches, 2 fourneaux, 1 four"""
+    spawn = StationType.INGREDIENT_SPAWN
+    return KitchenLayout(
+        name="default",
+        width=800,
+        height=600,
+        stations=[
+            # Spawn points (ligne du haut)
+            StationSpec(spawn, 100, 100, ItemType.TOMATO),
+            StationSpec(spawn, 200, 100, ItemType.LETTUCE),
+            StationSpec(spawn, 300, 100, ItemType.BREAD),
+            StationSpec(spawn, 400, 100, ItemType.RAW_PATTY),
+            StationSpec(spawn, 500, 100, ItemType.CHEESE),
+            # Stations de travail (ligne du milieu)
+            StationSpec(StationType.CUTTING_BOARD, 150, 200),
+            StationSpec(StationType.CUTTING_BOARD, 250, 200),
+            StationSpec(StationType.STOVE, 350, 200),
+            StationSpec(StationType.STOVE, 450, 200),
+            StationSpec(StationType.FURNACE, 550, 200),
+            # Stations finales
+            StationSpec(StationType.ASSEMBLY, 250, 300),
+            StationSpec(StationType.DELIVERY, 400, 300),
+        ],
+        players=[(100, 100)],
+        counters=[(80, 140, 500, 80), (620, 140, 150, 80)],
+    )
+
+
+_GRID_PATTERN = (
+    [(StationType.INGREDIENT_SPAWN, t) for t in
+     (ItemType.TOMATO, ItemType.LETTUCE, ItemType.BREAD, ItemType.RAW_PATTY, ItemType.CHEESE)]
+    + [(StationType.CUTTING_BOARD, None), (StationType.CUTTING_BOARD, None),
+       (StationType.STOVE, None), (StationType.STOVE, None), (StationType.FURNACE, None),
+       (StationType.ASSEMBLY, None), (StationType.DELIVERY, None)]
+)
+
+
+def grid_layout(n_stations: int, spacing: int = 100) -> KitchenLayout:
+    """Plan synthétique de n stations en grille (benchmarks de passage à l'échelle)"""
+    cols = max(1, math.ceil(math.sqrt(n_stations)))
+    stations = []
+    for i in range(n_stations):
+        station_type, ingredient = _GRID_PATTERN[i % len(_GRID_PATTERN)]
+        row, col = divmod(i, cols)
+        stations.append(StationSpec(station_type, spacing + col * spacing, spacing + row * spacing, ingredient))
+    rows = math.ceil(n_stations / cols)
+    return KitchenLayout(
+        name=f"grid-{n_stations}",
+        width=(cols + 2) * spacing,
+        height=(rows + 2) * spacing,
+        stations=stations,
+        players=[(spacing, spacing)],
+    )
@@ -0,0 +1,141 @@
+"""Carnet des commandes actives
+
+Index par identifiant (ordre d'arrivée), par plat et par échéance:
+ajout, livraison (match) et expiration en O(log n), sans recopier ni
+parcourir la liste des commandes. Les échéances sont exprimées sur
+l'horloge des commandes (`now`), qui n'avance qu'une fois la partie lancée;
+Order.time_remaining en est déduit.
+
+`version` change à chaque ajout ou retrait (perception incrémentale du bot).
+Le carnet n'émet pas d'événements: GameModel (ou DiffDecoder pour une
+réplique) publie order_added / order_removed avec l'issue de la commande
+(src/model/events.py).
+
+Les tas utilisent la suppression paresseuse: une entrée dont la commande
+n'est plus dans le carnet est ignorée quand elle remonte au sommet. Le tas
+d'un plat jamais demandé ne remonte jamais: les tas par plat sont compactés
+quand leurs entrées dépassent _COMPACT_RATIO fois les commandes actives.
+"""
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.model.game_model import Order
+
+# Compactage des tas par plat: entrées > ratio * commandes actives + marge
+_COMPACT_RATIO = 2
+_COMPACT_SLACK = 64
+
+
+class OrderBook:
+    def __init__(self):
+        self.now = 0.0
+        self._by_id: Dict[int, "Order"] = {}
+        self._by_dish: Dict[object, List[Tuple[float, int]]] = {}
+        self._deadlines: List[Tuple[float, int]] = []
+        self.version = 0  # change à chaque ajout ou retrait
+
+    # ============ LECTURE ============
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator["Order"]:
+        """Commandes actives dans l'ordre d'arrivée"""
+        return iter(self._by_id.values())
+
+    def __contains__(self, order_or_id) -> bool:
+        return getattr(order_or_id, 'id', order_or_id) in self._by_id
+
+    def __bool__(self) -> bool:
+        return bool(self._by_id)
+
+    def get(self, order_id: int) -> Optional["Order"]:
+        return self._by_id.get(order_id)
+
+    def earliest(self, dish=None) -> Optional["Order"]:
+        """Commande la plus urgente (toutes, ou pour un plat)"""
+        heap = self._deadlines if dish is None else self._by_dish.get(dish)
+        if not heap:
+            return None
+        self._prune(heap)
+        return self._by_id[heap[0][1]] if heap else None
+
+    def earliest_n(self, n: int) -> List["Order"]:
+        """Les n commandes les plus urgentes, par échéance croissante"""
+        live = (self._by_id.get(order_id) for _, order_id in heapq.nsmallest(n + self._stale(), self._deadlines))
+        return [o for o in live if o is not None][:n]
+
+    # ============ ÉCRITURE ============
+    def add(self, order: "Order", deadline: Optional[float] = None):
+        """Ajoute une commande; l'échéance est now + time_limit sauf si imposée (répliques)"""
+        order.book = self
+        order.deadline = self.now + order.time_limit if deadline is None else deadline
+        self._by_id[order.id] = order
+        entry = (order.deadline, order.id)
+        for dish in set(order.items_needed):
+            heapq.heappush(self._by_dish.setdefault(dish, []), entry)
+        heapq.heappush(self._deadlines, entry)
+        self.version += 1
+
+    def remove(self, order: "Order"):
+        del self._by_id[order.id]
+        self.version += 1
+        self._maybe_compact()
+
+    def match(self, dish) -> Optional["Order"]:
+        """Retire et retourne la commande de ce plat la plus proche de son échéance"""
+        order = self.earliest(dish)
+        if order is not None:
+            self.remove(order)
+        return order
+
+    def advance(self, dt: float):
+        self.now += dt
+
+    def expire(self) -> List["Order"]:
+        """Retire et retourne les commandes arrivées à échéance"""
+        expired = []
+        heap = self._deadlines
+        while heap and heap[0][0] <= self.now:
+            _, order_id = heapq.heappop(heap)
+            order = self._by_id.pop(order_id, None)
+            if order is not None:
+                expired.append(order)
+                self.version += 1
+        if expired:
+            self._maybe_compact()
+        return expired
+
+    def clone(self, copy_order) -> "OrderBook":
+        """Copie du carnet; copy_order(order) copie une commande"""
+        twin = OrderBook()
+        twin.now = self.now
+        twin.version = self.version
+        for order in self._by_id.values():
+            copied = copy_order(order)
+            copied.book = twin
+            twin._by_id[copied.id] = copied
+        twin._by_dish = {dish: list(heap) for dish, heap in self._by_dish.items()}
+        twin._deadlines = list(self._deadlines)
+        return twin
+
+    # ============ INTERNE ============
+    def _prune(self, heap: List[Tuple[float, int]]):
+        while heap and heap[0][1] not in self._by_id:
+            heapq.heappop(heap)
+
+    def _stale(self) -> int:
+        return len(self._deadlines) - len(self._by_id)
+
+    def _maybe_compact(self):
+        """Retire les entrées mortes des tas par plat (et du tas des échéances) si elles s'accumulent"""
+        limit = _COMPACT_RATIO * len(self._by_id) + _COMPACT_SLACK
+        if sum(map(len, self._by_dish.values())) <= limit:
+            return
+        live = self._by_id
+        for heap in self._by_dish.values():
+            heap[:] = [entry for entry in heap if entry[1] in live]
+            heapq.heapify(heap)
+        if len(self._deadlines) > limit:
+            self._deadlines[:] = [entry for entry in self._deadlines if entry[1] in live]
+            heapq.heapify(self._deadlines)
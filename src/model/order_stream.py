@@ -0,0 +1,183 @@
+"""Flux de commandes (profils de charge)
+
+GameModel demande au flux quand arrive la prochaine commande, quel plat est
+commandé et combien de commandes peuvent être actives en même temps. Le
+tirage utilise le random.Random du modèle: à graine égale, même flux.
+
+- ClassicStream: le jeu d'origine (3 commandes max, une toutes les 15-30 s)
+- PoissonStream: arrivées de Poisson à taux constant
+- BurstyStream: rafales de Poisson (on) séparées de silences (off)
+- TraceStream: arrivées rejouées depuis un fichier (JSON ou CSV)
+"""
+import csv
+import json
+import math
+import random
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.model.items import ItemType
+from src.model.recipes import RECIPES
+
+
+class OrderStream(ABC):
+    def __init__(self, max_concurrent: int = 3, patience: float = 60.0,
+                 mix: Optional[Dict[ItemType, float]] = None):
+        """
+        max_concurrent: nombre max de commandes actives (les arrivées attendent une place)
+        patience: temps accordé à chaque commande (s)
+        mix: poids relatifs des plats (par défaut: uniforme sur les recettes)
+        """
+        self.max_concurrent = max_concurrent
+        self.patience = patience
+        self.mix = dict(mix) if mix else {dish: 1.0 for dish in RECIPES}
+        self._dishes = list(self.mix)
+        self._weights = list(self.mix.values())
+
+    def start(self, now: float, rng: random.Random) -> float:
+        """Heure de la première arrivée"""
+        return self.next_arrival(now, now, rng)
+
+    @abstractmethod
+    def next_arrival(self, due: float, now: float, rng: random.Random) -> float:
+        """Heure de l'arrivée suivante, `due` étant l'heure prévue de celle qu'on vient
+        de servir et `now` l'heure réelle (plus tard si on attendait une place)"""
+
+    def next_dish(self, rng: random.Random) -> ItemType:
+        return rng.choices(self._dishes, self._weights)[0]
+
+
+class ClassicStream(OrderStream):
+    """Le rythme d'origine: première commande à 3 s, puis toutes les 15 à 30 s"""
+    def __init__(self, max_concurrent: int = 3, patience: float = 60.0,
+                 mix: Optional[Dict[ItemType, float]] = None,
+                 first_delay: float = 3.0, min_gap: float = 15.0, max_gap: float = 30.0):
+        super().__init__(max_concurrent, patience, mix)
+        self.first_delay = first_delay
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+
+    def start(self, now: float, rng: random.Random) -> float:
+        return now + self.first_delay
+
+    def next_arrival(self, due: float, now: float, rng: random.Random) -> float:
+        # L'écart repart de la création effective de la commande
+        return now + rng.uniform(self.min_gap, self.max_gap)
+
+
+class PoissonStream(OrderStream):
+    """Arrivées de Poisson: `rate` commandes par seconde en moyenne"""
+    def __init__(self, rate: float, max_concurrent: int = 100, patience: float = 60.0,
+                 mix: Optional[Dict[ItemType, float]] = None):
+        super().__init__(max_concurrent, patience, mix)
+        if rate <= 0:
+            raise ValueError("rate doit être > 0")
+        self.rate = rate
+
+    def next_arrival(self, due: float, now: float, rng: random.Random) -> float:
+        return due + rng.expovariate(self.rate)
+
+
+class BurstyStream(OrderStream):
+    """Rafales: Poisson à `rate` pendant `on_duration` s, puis rien pendant `off_duration` s"""
+    def __init__(self, rate: float, on_duration: float, off_duration: float,
+                 max_concurrent: int = 100, patience: float = 60.0,
+                 mix: Optional[Dict[ItemType, float]] = None):
+        super().__init__(max_concurrent, patience, mix)
+        if rate <= 0 or on_duration <= 0 or off_duration < 0:
+            raise ValueError("rate et on_duration doivent être > 0, off_duration >= 0")
+        self.rate = rate
+        self.on_duration = on_duration
+        self.off_duration = off_duration
+        self._t0 = 0.0
+
+    def start(self, now: float, rng: random.Random) -> float:
+        self._t0 = now
+        return self.next_arrival(now, now, rng)
+
+    def next_arrival(self, due: float, now: float, rng: random.Random) -> float:
+        period = self.on_duration + self.off_duration
+        t = due
+        while True:
+            t += rng.expovariate(self.rate)
+            phase = (t - self._t0) % period
+            if phase < self.on_duration:
+                return t
+            # Tombé dans un silence: sans mémoire, on repart du début de la rafale suivante
+            t += period - phase
+
+
+class TraceStream(OrderStream):
+    """Arrivées scriptées: [(secondes depuis le début, plat), ...]"""
+    def __init__(self, events: List[Tuple[float, ItemType]], max_concurrent: int = 100,
+                 patience: float = 60.0):
+        super().__init__(max_concurrent, patience)
+        self.events = sorted(events, key=lambda e: e[0])
+        self._t0 = 0.0
+        self._index = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> "TraceStream":
+        """JSON: [{"t": 3.0, "dish": "burger"}, ...] ou CSV avec colonnes t,dish"""
+        path = Path(path)
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.suffix == ".csv":
+                rows = list(csv.DictReader(f))
+            else:
+                rows = json.load(f)
+        events = [(float(row["t"]), ItemType(row["dish"])) for row in rows]
+        return cls(events, **kwargs)
+
+    def start(self, now: float, rng: random.Random) -> float:
+        self._t0 = now
+        self._index = 0
+        return self._due()
+
+    def next_arrival(self, due: float, now: float, rng: random.Random) -> float:
+        self._index += 1
+        return self._due()
+
+    def next_dish(self, rng: random.Random) -> ItemType:
+        return self.events[self._index][1]
+
+    def _due(self) -> float:
+        if self._index >= len(self.events):
+            return math.inf
+        return self._t0 + self.events[self._index][0]
+
+
+def stream_from_config(config: dict) -> OrderStream:
+    """Construit un flux depuis un dict (fichier de config, ligne de commande)
+
+    {"profile": "poisson", "rate": 2.0, "max_concurrent": 200, "mix": {"burger": 2, "salad": 1}}
+    """
+    config = dict(config)
+    profile = config.pop("profile", "classic")
+    if "mix" in config:
+        config["mix"] = {ItemType(dish): float(w) for dish, w in config["mix"].items()}
+    if profile == "classic":
+        return ClassicStream(**config)
+    if profile == "poisson":
+        return PoissonStream(**config)
+    if profile == "bursty":
+        return BurstyStream(**config)
+    if profile == "trace":
+        config.pop("mix", None)
+        return TraceStream.load(config.pop("path"), **config)
+    raise ValueError(f"profil de charge inconnu: {profile}")
+
+
+def parse_profile(spec: str) -> OrderStream:
+    """Syntaxe courte: "poisson:rate=2,max_concurrent=200" ou "trace:path=ordres.csv" """
+    profile, _, params = spec.partition(":")
+    config: dict = {"profile": profile}
+    for pair in filter(None, params.split(",")):
+        key, _, value = pair.partition("=")
+        if key == "path":
+            config[key] = value
+        elif key == "max_concurrent":
+            config[key] = int(value)
+        else:
+            config[key] = float(value)
+    return stream_from_config(config)
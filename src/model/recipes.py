@@ -0,0 +1,142 @@
+"""Table des recettes, partagée par le modèle (assemblage) et le bot (planification)
+
+Chaque état d'ingrédient (type + coupé; la cuisson est portée par le type,
+RAW_PATTY -> COOKED_PATTY) correspond à un bit. La station d'assemblage tient
+le masque courant de son contenu, donc vérifier une recette complète revient
+à une seule recherche dans un dict indexé par masque (match_recipe), quel que
+soit le nombre de recettes.
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from src.model.items import Item, ItemType
+
+# (type, coupé) -> bit
+INGREDIENT_BITS: Dict[Tuple[ItemType, bool], int] = {
+    (item_type, chopped): 1 << (2 * i + int(chopped))
+    for i, item_type in enumerate(ItemType)
+    for chopped in (False, True)
+}
+
+_TYPE_BITS: Dict[ItemType, int] = {
+    item_type: INGREDIENT_BITS[(item_type, False)] | INGREDIENT_BITS[(item_type, True)]
+    for item_type in ItemType
+}
+
+# Ingrédients qui changent de type en cuisant avant l'assemblage
+COOKED_FORM: Dict[ItemType, ItemType] = {
+    ItemType.RAW_PATTY: ItemType.COOKED_PATTY,
+}
+
+
+def ingredient_bit(item: Item) -> int:
+    return INGREDIENT_BITS[(item.item_type, item.chopped)]
+
+
+def type_bits(item_type: ItemType) -> int:
+    """Bits de toutes les variantes d'un type (coupé ou non)"""
+    return _TYPE_BITS[item_type]
+
+
+def prepared(ingredient: ItemType) -> ItemType:
+    """Type sous lequel un ingrédient arrive sur l'assemblage (steak cuit, etc.)"""
+    return COOKED_FORM.get(ingredient, ingredient)
+
+
+@dataclass(frozen=True)
+class Recipe:
+    """
+    name: nom de la recette
+    dish: plat commandé et livré
+    result: item produit par l'assemblage (UNCOOKED_PIZZA pour la pizza, à cuire au four)
+    ingredients: liste de (ItemType, needs_chopping), ingrédients de base
+    exact: refuser tout ingrédient en trop (la salade), sinon le surplus est toléré
+    """
+    name: str
+    dish: ItemType
+    result: ItemType
+    ingredients: Tuple[Tuple[ItemType, bool], ...]
+    icon: str = ""
+    exact: bool = False
+
+    @property
+    def mask(self) -> int:
+        mask = 0
+        for ingredient, needs_chopping in self.ingredients:
+            mask |= INGREDIENT_BITS[(prepared(ingredient), needs_chopping)]
+        return mask
+
+    @property
+    def needs_baking(self) -> bool:
+        return self.result != self.dish
+
+
+# Bibliothèque de recettes
+RECIPES: Dict[ItemType, Recipe] = {
+    ItemType.BURGER: Recipe(
+        name="Burger",
+        dish=ItemType.BURGER,
+        result=ItemType.BURGER,
+        ingredients=(
+            (ItemType.BREAD, False),      # pain (pas de découpe)
+            (ItemType.RAW_PATTY, False),  # steak (cuisson nécessaire)
+            (ItemType.TOMATO, True),      # tomate coupée
+            (ItemType.LETTUCE, True),     # salade coupée
+        ),
+        icon="🍔",
+    ),
+    ItemType.PIZZA: Recipe(
+        name="Pizza",
+        dish=ItemType.PIZZA,
+        result=ItemType.UNCOOKED_PIZZA,   # l'assemblage donne une pizza non cuite
+        ingredients=(
+            (ItemType.BREAD, False),
+            (ItemType.TOMATO, True),
+            (ItemType.CHEESE, False),
+        ),
+        icon="🍕",
+    ),
+    ItemType.SALAD: Recipe(
+        name="Salad",
+        dish=ItemType.SALAD,
+        result=ItemType.SALAD,
+        ingredients=(
+            (ItemType.LETTUCE, True),     # salade coupée
+            (ItemType.TOMATO, True),      # tomate coupée
+        ),
+        icon="🥗",
+        exact=True,
+    ),
+}
+
+RECIPES_BY_MASK: Dict[int, Recipe] = {recipe.mask: recipe for recipe in RECIPES.values()}
+assert len(RECIPES_BY_MASK) == len(RECIPES), "deux recettes ont les mêmes ingrédients"
+
+# Masque de contenu -> recette (None si aucune). Rempli à la première
+# rencontre de chaque masque: ensuite la vérification est une seule recherche.
+_MATCHES: Dict[int, Optional[Recipe]] = {}
+
+
+def match_recipe(contents_mask: int) -> Optional[Recipe]:
+    """Première recette (ordre de RECIPES) réalisable avec ce contenu"""
+    try:
+        return _MATCHES[contents_mask]
+    except KeyError:
+        pass
+    found = None
+    for recipe in RECIPES.values():
+        mask = recipe.mask
+        if contents_mask == mask or (not recipe.exact and contents_mask & mask == mask):
+            found = recipe
+            break
+    _MATCHES[contents_mask] = found
+    return found
+
+
+def register_recipe(recipe: Recipe):
+    """Ajoute une recette à la table (le modèle la propose et le bot sait la préparer)"""
+    if recipe.mask in RECIPES_BY_MASK:
+        raise ValueError(f"recette en double: {recipe.name}")
+    RECIPES[recipe.dish] = recipe
+    RECIPES_BY_MASK[recipe.mask] = recipe
+    _MATCHES.clear()
@@ -0,0 +1,570 @@
+"""Différences binaires d'un GameModel entre deux ticks
+
+DiffEncoder garde le dernier état envoyé (valeurs de chaque champ) et n'écrit,
+pour chaque joueur (x, y, held_item) et chaque station (item,
+cooking_start_time, contents), que les champs modifiés, précédés d'un masque
+de champs. Il est abonné aux événements du modèle (src/model/events.py): un
+delta ne compare que les joueurs, stations et commandes signalés depuis la
+trame précédente. Les rangs sont des écarts en varint, les positions des écarts
+zigzag (un pas = 1 octet). Un tick sans changement tient en 3 octets.
+
+Toutes les `keyframe_every` trames, une keyframe donne l'état complet: un
+lecteur peut démarrer (ou reprendre après une perte) à n'importe quelle
+keyframe. DiffDecoder applique les trames à un GameModel de même plan.
+
+Horloges: le pas (clock et OrderBook.now) n'est transmis que lorsqu'il change,
+le décodeur l'ajoute à chaque trame. L'écart à l'horloge réelle reste sous
+_STEP_TOLERANCE et repart de zéro à chaque keyframe.
+"""
+import math
+import struct
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.model.game_model import GameModel, Item, ItemType, Order, Player
+from src.model.recipes import ingredient_bit
+
+KEYFRAME, DELTA = 2, 3
+
+# Issue d'une commande retirée (événement order_removed, animations côté vue)
+_OUTCOMES = {None: 0, "delivered": 1, "expired": 2, "overcooked": 3}
+_OUTCOME_NAMES = {code: name for name, code in _OUTCOMES.items()}
+# ... et son nom dans GameModel.completed_orders
+_COMPLETED_TYPES = {"delivered": "completed", "expired": "expired", "overcooked": "overcooked"}
+
+_ITEM_TYPES = list(ItemType)
+_ITEM_INDEX = {t: i for i, t in enumerate(_ITEM_TYPES)}
+
+_F64 = struct.Struct("<d")
+_ORDER = struct.Struct("<Bddd")  # plat, time_limit, deadline, created_at
+
+_STEP_TOLERANCE = 1e-9
+
+# En-tête d'un delta
+_H_TICK, _H_CLOCK, _H_BOOK, _H_SCORE, _H_START, _H_PLAYERS, _H_STATIONS, _H_ORDERS = (1 << i for i in range(8))
+# Champs d'un joueur / d'une station
+_P_X, _P_Y, _P_HELD = 1, 2, 4
+_S_ITEM, _S_COOKING, _S_CONTENTS, _S_APPEND = 1, 2, 4, 8
+
+
+# ============ PRIMITIVES ============
+def write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def item_code(item: Optional[Item]) -> int:
+    """0 = rien, sinon 1 + (type << 2 | coupé << 1 | brûlé)"""
+    if item is None:
+        return 0
+    return 1 + (_ITEM_INDEX[item.item_type] << 2 | item.chopped << 1 | item.overcooked)
+
+
+def item_from_code(code: int) -> Optional[Item]:
+    if code == 0:
+        return None
+    code -= 1
+    return Item(_ITEM_TYPES[code >> 2], chopped=bool(code & 2), overcooked=bool(code & 1))
+
+
+# ============ ENCODAGE ============
+_NO_PLAYER = (0, 0, 0)
+_NO_STATION = (0, 0.0, ())
+
+
+def _player_state(player) -> tuple:
+    return player.x, player.y, item_code(player.held_item)
+
+
+def _station_state(station) -> tuple:
+    contents = station.contents
+    return (item_code(station.item), station.cooking_start_time,
+            tuple(map(item_code, contents)) if contents else ())
+
+
+class DiffEncoder:
+    def __init__(self, keyframe_every: int = 300):
+        """keyframe_every: une keyframe toutes les N trames de encode() (0 = seulement la première)"""
+        self.keyframe_every = keyframe_every
+        self._since_keyframe: Optional[int] = None
+        self._tick = 0
+        self._clock = 0.0
+        self._clock_step: Optional[float] = None
+        self._book = 0.0
+        self._book_step: Optional[float] = None
+        self._score = 0
+        self._start: Optional[float] = None
+        self._players: List[tuple] = []
+        self._stations: List[tuple] = []
+        self._orders: Set[int] = set()
+        # Changements signalés depuis la dernière trame
+        self._model: Optional[GameModel] = None
+        self._station_index: Dict[int, int] = {}
+        self._dirty_players: Set[int] = set()
+        self._dirty_stations: Set[int] = set()
+        self._added: Dict[int, Order] = {}
+        self._removed: Dict[int, Optional[str]] = {}
+
+    def encode(self, model: GameModel, tick: int) -> bytes:
+        """Trame du tick: keyframe périodique, sinon delta"""
+        if (self._since_keyframe is None or model is not self._model
+                or (self.keyframe_every and self._since_keyframe + 1 >= self.keyframe_every)):
+            return self.keyframe(model, tick)
+        self._since_keyframe += 1
+        return self.delta(model, tick)
+
+    def keyframe(self, model: GameModel, tick: int) -> bytes:
+        """État complet; les deltas suivants partent de cet état"""
+        if model is not self._model:
+            self.close()
+            model.subscribe(self)
+            self._model = model
+            self._station_index = {id(s): i for i, s in enumerate(model.stations)}
+        self._dirty_players.clear()
+        self._dirty_stations.clear()
+        self._added.clear()
+        self._removed.clear()
+        self._since_keyframe = 0
+        self._tick = tick
+        self._clock = model.clock()
+        self._book = model.orders.now
+        self._score = model.score
+        self._start = model.start_time if model.game_started else None
+        self._players = [_player_state(p) for p in model.players]
+        self._stations = [_station_state(s) for s in model.stations]
+        self._orders = {o.id for o in model.orders}
+        return self.snapshot(model)
+
+    def close(self):
+        """Se désabonne du modèle encodé"""
+        if self._model is not None:
+            self._model.unsubscribe(self)
+            self._model = None
+
+    # Événements du modèle (GameModel.subscribe)
+    def player_moved(self, player_index: int, player: Player):
+        self._dirty_players.add(player_index)
+
+    def item_picked(self, player_index: int, station, item):
+        self._dirty_players.add(player_index)
+
+    item_placed = item_picked
+
+    def station_changed(self, station):
+        index = self._station_index.get(id(station))
+        if index is not None:
+            self._dirty_stations.add(index)
+
+    def order_added(self, order: Order):
+        self._added[order.id] = order
+
+    def order_removed(self, order: Order, outcome: Optional[str]):
+        # Ajoutée et retirée entre deux trames: le lecteur n'en saura rien
+        if self._added.pop(order.id, None) is None:
+            self._removed[order.id] = outcome
+
+    def snapshot(self, model: GameModel) -> bytes:
+        """Keyframe de l'état de référence courant (celui du dernier encode),
+        sans changer la suite des deltas: pour un client qui rejoint en cours"""
+        out = bytearray([KEYFRAME])
+        write_varint(out, self._tick)
+        out += _F64.pack(self._clock)
+        out += _F64.pack(self._book)
+        flags = ((self._clock_step is not None) | (self._book_step is not None) << 1
+                 | (self._start is not None) << 2)
+        out.append(flags)
+        for value in (self._clock_step, self._book_step, self._start):
+            if value is not None:
+                out += _F64.pack(value)
+        write_varint(out, zigzag(self._score))
+        write_varint(out, len(self._players))
+        for state in self._players:
+            out.append(0)  # écart de rang: tous les joueurs se suivent
+            _write_player(out, _NO_PLAYER, state, _P_X | _P_Y | _P_HELD)
+        changed = [(i, state) for i, state in enumerate(self._stations) if state != _NO_STATION]
+        self._write_stations(out, changed, [_NO_STATION] * len(self._stations))
+        _write_orders(out, [o for o in model.orders if o.id in self._orders])
+        return bytes(out)
+
+    def delta(self, model: GameModel, tick: int) -> bytes:
+        out = bytearray([DELTA])
+        header = bytearray()
+        mask = 0
+
+        if tick != self._tick + 1:
+            mask |= _H_TICK
+            write_varint(header, tick - self._tick)
+        self._tick = tick
+        step = model.clock() - self._clock
+        if self._clock_step is None or abs(step - self._clock_step) > _STEP_TOLERANCE:
+            mask |= _H_CLOCK
+            header += _F64.pack(step)
+            self._clock_step = step
+        self._clock += self._clock_step
+        step = model.orders.now - self._book
+        if self._book_step is None or abs(step - self._book_step) > _STEP_TOLERANCE:
+            mask |= _H_BOOK
+            header += _F64.pack(step)
+            self._book_step = step
+        self._book += self._book_step
+        if model.score != self._score:
+            mask |= _H_SCORE
+            write_varint(header, zigzag(model.score - self._score))
+            self._score = model.score
+        start = model.start_time if model.game_started else None
+        if start != self._start:
+            mask |= _H_START
+            header += _F64.pack(math.nan if start is None else start)
+            self._start = start
+
+        body = bytearray()
+        # Joueurs signalés: seulement les champs modifiés
+        sent = self._players
+        players = model.players
+        dirty = self._dirty_players
+        dirty.update(range(len(sent), len(players)))
+        changed = []
+        for i in sorted(dirty):
+            if i >= len(players):
+                continue
+            state = _player_state(players[i])
+            old = sent[i] if i < len(sent) else _NO_PLAYER
+            if state != old:
+                changed.append((i, old, state))
+                if i < len(sent):
+                    sent[i] = state
+                else:
+                    sent.append(state)
+        dirty.clear()
+        if changed:
+            mask |= _H_PLAYERS
+            write_varint(body, len(changed))
+            previous = -1
+            for i, old, state in changed:
+                write_varint(body, i - previous - 1)
+                previous = i
+                _write_player(body, old, state,
+                              (old[0] != state[0]) | (old[1] != state[1]) << 1 | (old[2] != state[2]) << 2)
+
+        # Stations signalées
+        sent = self._stations
+        stations = model.stations
+        changed = []
+        for i in sorted(self._dirty_stations):
+            state = _station_state(stations[i])
+            if state != sent[i]:
+                changed.append((i, state))
+        self._dirty_stations.clear()
+        if changed:
+            mask |= _H_STATIONS
+            self._write_stations(body, changed, sent)
+
+        # Commandes ajoutées / retirées
+        known = self._orders
+        added, removed = self._added, self._removed
+        if added or removed:
+            mask |= _H_ORDERS
+            _write_orders(body, list(added.values()))
+            known.update(added)
+            write_varint(body, len(removed))
+            for order_id, outcome in removed.items():
+                write_varint(body, order_id)
+                body.append(_OUTCOMES[outcome])
+                known.discard(order_id)
+            added.clear()
+            removed.clear()
+
+        out.append(mask)
+        out += header
+        out += body
+        return bytes(out)
+
+    @staticmethod
+    def _write_stations(out: bytearray, changed, sent: List[tuple]):
+        """Écrit les stations modifiées par rapport à `sent` (mis à jour)"""
+        write_varint(out, len(changed))
+        previous = -1
+        for i, state in changed:
+            write_varint(out, i - previous - 1)
+            previous = i
+            old = sent[i]
+            sent[i] = state
+            item, cooking, contents = state
+            old_contents = old[2]
+            fields = (item != old[0]) | (cooking != old[1]) << 1
+            if contents != old_contents:
+                appended = len(contents) == len(old_contents) + 1 and contents[:-1] == old_contents
+                fields |= _S_APPEND if appended else _S_CONTENTS
+            out.append(fields)
+            if fields & _S_ITEM:
+                out.append(item)
+            if fields & _S_COOKING:
+                out += _F64.pack(cooking)
+            if fields & _S_CONTENTS:
+                write_varint(out, len(contents))
+                out += bytes(contents)
+            elif fields & _S_APPEND:
+                out.append(contents[-1])
+
+
+def _write_player(out: bytearray, old: tuple, state: tuple, fields: int):
+    out.append(fields)
+    if fields & _P_X:
+        write_varint(out, zigzag(state[0] - old[0]))
+    if fields & _P_Y:
+        write_varint(out, zigzag(state[1] - old[1]))
+    if fields & _P_HELD:
+        out.append(state[2])
+
+
+def _write_orders(out: bytearray, orders):
+    write_varint(out, len(orders))
+    for order in orders:
+        write_varint(out, order.id)
+        out += _ORDER.pack(_ITEM_INDEX[order.items_needed[0]], order.time_limit, order.deadline, order.created_at)
+
+
+# ============ DÉCODAGE ============
+class DiffDecoder:
+    """Applique keyframes et deltas à un GameModel (même plan, horloge SimClock)
+
+    Le modèle n'est pas simulé (pas d'update): il reflète l'état transmis et
+    peut être dessiné par GameView.
+    """
+    def __init__(self, model: GameModel):
+        self.model = model
+        self.tick = -1
+        self.synced = False  # vrai après la première keyframe
+        self._clock_step = 0.0
+        self._book_step = 0.0
+
+    def apply(self, payload) -> bool:
+        """Applique une trame; False si elle est ignorée (delta avant toute keyframe)"""
+        kind = payload[0]
+        if kind == KEYFRAME:
+            self._apply_keyframe(payload)
+            self.synced = True
+            self.model.changes += 1
+            return True
+        if kind != DELTA or not self.synced:
+            return False
+        model = self.model
+        mask = payload[1]
+        if mask & ~_H_TICK:
+            model.changes += 1  # (un delta ne portant que l'écart de ticks ne change rien à l'écran)
+        pos = 2
+        if mask & _H_TICK:
+            gap, pos = read_varint(payload, pos)
+            self.tick += gap
+        else:
+            self.tick += 1
+        if mask & _H_CLOCK:
+            self._clock_step = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+        model.clock.now += self._clock_step
+        if mask & _H_BOOK:
+            self._book_step = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+        model.orders.now += self._book_step
+        if mask & _H_SCORE:
+            score, pos = read_varint(payload, pos)
+            model.score += unzigzag(score)
+        if mask & _H_START:
+            start = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+            model.game_started = not math.isnan(start)
+            model.start_time = start if model.game_started else None
+        if mask & _H_PLAYERS:
+            pos = self._read_players(payload, pos)
+        if mask & _H_STATIONS:
+            pos = self._read_stations(payload, pos)
+        if mask & _H_ORDERS:
+            pos = self._read_orders(payload, pos)
+            pos = self._read_removed(payload, pos)
+        for handler in model.events.tick:
+            handler(model.clock.now)
+        now = model.clock.now
+        if model.completed_orders:
+            model.completed_orders = [c for c in model.completed_orders if now - c['time'] < 3.0]
+        return True
+
+    def _apply_keyframe(self, payload):
+        model = self.model
+        self.tick, pos = read_varint(payload, 1)
+        model.clock.now, model.orders.now = struct.unpack_from("<dd", payload, pos)
+        flags = payload[pos + 16]
+        pos += 17
+        if flags & 1:
+            self._clock_step = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+        if flags & 2:
+            self._book_step = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+        model.game_started = bool(flags & 4)
+        model.start_time = None
+        if flags & 4:
+            model.start_time = _F64.unpack_from(payload, pos)[0]
+            pos += 8
+        score, pos = read_varint(payload, pos)
+        model.score = unzigzag(score)
+
+        count, pos = read_varint(payload, pos)
+        del model.players[count:]
+        for player in model.players:
+            player.x = player.y = 0
+            player.held_item = None
+            player.version += 1
+        for station in model.stations:
+            station.item = None
+            station.cooking_start_time = 0.0
+            station.contents = []
+            station.contents_mask = 0
+            station.version += 1
+        model.stations_version += 1
+        # Les commandes toujours présentes gardent leur objet et ne sont pas signalées aux abonnés
+        previous = {order.id: order for order in model.orders}
+        for order in previous.values():
+            model.orders.remove(order)
+        pos = self._read_players(payload, pos, count)
+        pos = self._read_stations(payload, pos)
+        self._read_orders(payload, pos, previous)
+        events = model.events
+        for order in previous.values():
+            for handler in events.order_removed:
+                handler(order, None)
+        for i, player in enumerate(model.players):
+            for handler in events.player_moved:
+                handler(i, player)
+        for station in model.stations:
+            for handler in events.station_changed:
+                handler(station)
+
+    def _read_players(self, payload, pos: int, count: Optional[int] = None) -> int:
+        players = self.model.players
+        events = self.model.events
+        if count is None:
+            count, pos = read_varint(payload, pos)
+        i = -1
+        for _ in range(count):
+            gap, pos = read_varint(payload, pos)
+            i += gap + 1
+            while i >= len(players):
+                players.append(Player(0, 0))
+            player = players[i]
+            fields = payload[pos]
+            pos += 1
+            if fields & _P_X:
+                dx, pos = read_varint(payload, pos)
+                player.x += unzigzag(dx)
+            if fields & _P_Y:
+                dy, pos = read_varint(payload, pos)
+                player.y += unzigzag(dy)
+            if fields & _P_HELD:
+                held = player.held_item
+                player.held_item = item_from_code(payload[pos])
+                player.version += 1
+                pos += 1
+                if held is not None:
+                    for handler in events.item_placed:
+                        handler(i, None, held)
+                if player.held_item is not None:
+                    for handler in events.item_picked:
+                        handler(i, None, player.held_item)
+            if fields & (_P_X | _P_Y):
+                for handler in events.player_moved:
+                    handler(i, player)
+        return pos
+
+    def _read_stations(self, payload, pos: int) -> int:
+        stations = self.model.stations
+        count, pos = read_varint(payload, pos)
+        i = -1
+        for _ in range(count):
+            gap, pos = read_varint(payload, pos)
+            i += gap + 1
+            station = stations[i]
+            station.version += 1
+            self.model.stations_version += 1
+            fields = payload[pos]
+            pos += 1
+            if fields & _S_ITEM:
+                station.item = item_from_code(payload[pos])
+                pos += 1
+            if fields & _S_COOKING:
+                station.cooking_start_time = _F64.unpack_from(payload, pos)[0]
+                pos += 8
+            if fields & _S_CONTENTS:
+                n, pos = read_varint(payload, pos)
+                station.contents = [item_from_code(code) for code in payload[pos:pos + n]]
+                station.contents_mask = 0
+                for item in station.contents:
+                    station.contents_mask |= ingredient_bit(item)
+                pos += n
+            elif fields & _S_APPEND:
+                item = item_from_code(payload[pos])
+                station.contents.append(item)
+                station.contents_mask |= ingredient_bit(item)
+                pos += 1
+            for handler in self.model.events.station_changed:
+                handler(station)
+        return pos
+
+    def _read_orders(self, payload, pos: int, previous: Optional[dict] = None) -> int:
+        """previous: commandes d'avant la keyframe (id -> Order); celles qui reviennent sont
+        réutilisées sans événement et retirées du dict"""
+        orders = self.model.orders
+        added = self.model.events.order_added
+        count, pos = read_varint(payload, pos)
+        for _ in range(count):
+            order_id, pos = read_varint(payload, pos)
+            dish, time_limit, deadline, created_at = _ORDER.unpack_from(payload, pos)
+            pos += _ORDER.size
+            order = previous.pop(order_id, None) if previous else None
+            if order is not None:
+                order.time_limit = time_limit
+                order.created_at = created_at
+                orders.add(order, deadline=deadline)
+                continue
+            order = Order([_ITEM_TYPES[dish]], time_limit=time_limit, id=order_id, created_at=created_at)
+            orders.add(order, deadline=deadline)
+            for handler in added:
+                handler(order)
+        return pos
+
+    def _read_removed(self, payload, pos: int) -> int:
+        model = self.model
+        now = model.clock.now
+        count, pos = read_varint(payload, pos)
+        for _ in range(count):
+            order_id, pos = read_varint(payload, pos)
+            outcome = _OUTCOME_NAMES.get(payload[pos])
+            pos += 1
+            order = model.orders.get(order_id)
+            if order is not None:
+                model.orders.remove(order)
+                order.expired = outcome == "expired"
+                for handler in model.events.order_removed:
+                    handler(order, outcome)
+            if outcome is not None:
+                model.completed_orders.append({'id': order_id, 'type': _COMPLETED_TYPES[outcome], 'time': now})
+        return pos
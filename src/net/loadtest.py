@@ -0,0 +1,127 @@
+"""Client de charge pour src/net/server.py
+
+Ouvre N connexions; chaque client tient une réplique (ModelMirror) à jour et
+ceux qui ont un joueur envoient des actions aléatoires. À la fin: trames et
+octets reçus par client, octets moyens par tick, écart au tick du serveur.
+
+    python -m src.net.loadtest --clients 50 --seconds 10
+    python -m src.net.loadtest --clients 50 --spawn-server   # serveur dans le même processus
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import List, Optional
+
+from src.net import protocol
+from src.net.diff import KEYFRAME
+from src.net.protocol import CHOP, INTERACT, MOVE, ModelMirror
+
+
+class LoadClient:
+    def __init__(self, actions_per_second: float = 4.0, seed: int = 0):
+        self.actions_per_second = actions_per_second
+        self.rng = random.Random(seed)
+        self.frames = 0
+        self.keyframes = 0
+        self.bytes_in = 0
+        self.mirror: Optional[ModelMirror] = None
+        self.player_index: Optional[int] = None
+
+    async def run(self, host: str, port: int, seconds: float):
+        reader, writer = await asyncio.open_connection(host, port)
+        payload = await protocol.read_frame(reader)
+        self.player_index, layout = protocol.parse_hello(payload)
+        self.mirror = ModelMirror(layout)
+        sender = None
+        if self.player_index is not None and self.actions_per_second > 0:
+            sender = asyncio.ensure_future(self._send_actions(writer))
+        try:
+            await asyncio.wait_for(self._receive(reader), seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if sender is not None:
+                sender.cancel()
+            writer.close()
+
+    async def _receive(self, reader):
+        while True:
+            payload = await protocol.read_frame(reader)
+            self.frames += 1
+            self.bytes_in += len(payload) + 4
+            if payload[0] == KEYFRAME:
+                self.keyframes += 1
+            self.mirror.apply(payload)
+
+    async def _send_actions(self, writer):
+        rng = self.rng
+        while True:
+            await asyncio.sleep(rng.expovariate(self.actions_per_second))
+            roll = rng.random()
+            if roll < 0.8:
+                dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1)))
+                data = protocol.action(MOVE, self.player_index, dx, dy)
+            else:
+                data = protocol.action(INTERACT if roll < 0.95 else CHOP, self.player_index)
+            writer.write(protocol.frame(data))
+
+
+async def run_load(host: str, port: int, clients: int, seconds: float,
+                   actions_per_second: float = 4.0) -> List[LoadClient]:
+    load = [LoadClient(actions_per_second, seed=i) for i in range(clients)]
+    await asyncio.gather(*(c.run(host, port, seconds) for c in load))
+    return load
+
+
+def report(load: List[LoadClient], seconds: float, server_tick: Optional[int] = None):
+    frames = [c.frames for c in load]
+    ticks = [c.mirror.tick for c in load if c.mirror is not None]
+    total_bytes = sum(c.bytes_in for c in load)
+    print(f"clients={len(load)} frames/s/client={statistics.fmean(frames) / seconds:.1f} "
+          f"(min {min(frames) / seconds:.1f}) keyframes={sum(c.keyframes for c in load)}")
+    print(f"octets/trame={total_bytes / max(1, sum(frames)):.1f} "
+          f"débit total={total_bytes / seconds / 1024:.1f} Kio/s")
+    if server_tick is not None and ticks:
+        print(f"retard max sur le serveur: {server_tick - min(ticks)} ticks")
+
+
+async def _main(args):
+    server = None
+    if args.spawn_server:
+        from src.net.server import GameServer, new_server_model
+        server = GameServer(new_server_model(players=args.players, seed=0))
+        await server.start(args.host, 0)
+        port = server.port
+        ticker = asyncio.ensure_future(server.run())
+    else:
+        port = args.port
+    start = time.perf_counter()
+    load = await run_load(args.host, port, args.clients, args.seconds, args.actions_per_second)
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        ticker.cancel()
+        await server.close()
+        stats = server.stats
+        print(f"serveur: ticks={stats['ticks']:.0f} ({stats['ticks'] / elapsed:.1f}/s) "
+              f"tick_ms={stats['tick_seconds'] / max(1, stats['ticks']) * 1000:.3f} "
+              f"skipped={stats['frames_skipped']:.0f}")
+    report(load, args.seconds, server.tick if server is not None else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge du serveur de jeu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--actions-per-second", type=float, default=4.0)
+    parser.add_argument("--spawn-server", action="store_true")
+    parser.add_argument("--players", type=int, default=8, help="joueurs du serveur lancé avec --spawn-server")
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Protocole binaire serveur -> clients (état de la cuisine) et clients -> serveur (actions)
+
+Trames sur TCP: longueur (u32 big-endian) puis charge utile, dont le premier
+octet donne le type. Entiers en varint (LEB128, zigzag pour les signés).
+
+- HELLO: index du joueur attribué (+1, 0 = spectateur), puis le plan en JSON
+- KEYFRAME / DELTA: état complet ou champs modifiés depuis le tick
+  précédent (format dans src/net/diff.py)
+- ACTION: opération (move / interact / chop), joueur, dx, dy
+
+Les stations sont identifiées par leur rang dans le plan: leur position et
+leur type viennent du HELLO et ne sont jamais retransmis.
+"""
+import json
+import struct
+from typing import Optional, Tuple
+
+from src.model.clock import SimClock
+from src.model.game_model import GameModel
+from src.model.layout import KitchenLayout
+from src.net.diff import DiffDecoder, read_varint, write_varint
+
+HELLO, ACTION = 1, 4
+MOVE, INTERACT, CHOP = 1, 2, 3
+
+_FRAME_HEADER = struct.Struct(">I")
+_ACTION = struct.Struct("<BBBbb")
+ACTION_SIZE = _ACTION.size
+
+
+# ============ TRAMES ============
+def frame(payload: bytes) -> bytes:
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader) -> bytes:
+    """Lit une trame complète (asyncio.StreamReader)"""
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    return await reader.readexactly(_FRAME_HEADER.unpack(header)[0])
+
+
+def hello(player_index: Optional[int], layout: KitchenLayout) -> bytes:
+    out = bytearray([HELLO])
+    write_varint(out, 0 if player_index is None else player_index + 1)
+    out += json.dumps(layout.to_dict()).encode("utf-8")
+    return bytes(out)
+
+
+def parse_hello(payload: bytes) -> Tuple[Optional[int], KitchenLayout]:
+    slot, pos = read_varint(payload, 1)
+    layout = KitchenLayout.from_dict(json.loads(payload[pos:].decode("utf-8")))
+    return (slot - 1 if slot else None), layout
+
+
+def action(op: int, player_index: int, dx: int = 0, dy: int = 0) -> bytes:
+    return _ACTION.pack(ACTION, op, player_index, dx, dy)
+
+
+def parse_action(payload: bytes) -> Tuple[int, int, int, int]:
+    return _ACTION.unpack(payload)[1:]
+
+
+class ModelMirror:
+    """Réplique d'un GameModel côté client, mise à jour par les trames d'état
+
+    `model` est un vrai GameModel (même plan): la vue peut le dessiner tel quel.
+    Il n'est jamais mis à jour par update(), seulement par apply().
+    """
+    def __init__(self, layout: KitchenLayout):
+        self.clock = SimClock()
+        self.model = GameModel(clock=self.clock, verbose=False, layout=layout)
+        self._decoder = DiffDecoder(self.model)
+
+    @property
+    def tick(self) -> int:
+        return self._decoder.tick
+
+    @property
+    def synced(self) -> bool:
+        return self._decoder.synced
+
+    def apply(self, payload: bytes) -> bool:
+        return self._decoder.apply(payload)
@@ -0,0 +1,219 @@
+"""Serveur de jeu asyncio (TCP): le GameModel tourne côté serveur
+
+Le serveur fait avancer le modèle à cadence fixe sur une SimClock (un tick =
+dt secondes simulées), applique les actions reçues au début du tick suivant
+et diffuse à chaque tick un delta binaire (src/net/protocol.py), encodé une
+seule fois pour tous les clients.
+
+La boucle de tick ne fait jamais `await drain()`: un client dont le tampon
+d'envoi dépasse `max_backlog` octets ne reçoit plus de deltas et repart d'une
+keyframe une fois son tampon vidé. Un client lent ne ralentit donc pas les
+autres ni la simulation.
+
+    python -m src.net.server --port 8765 --players 4
+    python -m src.net.loadtest --clients 50
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+
+from src.controller.bot_controller import AIBot
+from src.model.clock import SimClock
+from src.model.game_model import GameModel, Player
+from src.model.layout import load_layout
+from src.model.order_stream import parse_profile
+from src.net import protocol
+from src.net.diff import KEYFRAME, DiffEncoder
+from src.net.protocol import CHOP, INTERACT, MOVE, frame
+
+
+class _Client:
+    __slots__ = ("writer", "player_index", "needs_keyframe")
+
+    def __init__(self, writer, player_index: Optional[int]):
+        self.writer = writer
+        self.player_index = player_index
+        self.needs_keyframe = True
+
+
+class GameServer:
+    def __init__(self, model: GameModel, tick_rate: float = 60.0, keyframe_every: int = 300,
+                 max_backlog: int = 256 * 1024, bot: Optional[AIBot] = None):
+        """
+        model: partie à faire tourner (horloge SimClock, avancée par le serveur)
+        keyframe_every: keyframe diffusée à tous tous les N ticks (resynchronisation)
+        max_backlog: octets en attente au-delà desquels un client ne reçoit plus de deltas
+        bot: AIBot optionnel qui joue un des joueurs
+        """
+        if not isinstance(model.clock, SimClock):
+            raise ValueError("le serveur pilote le temps: GameModel(clock=SimClock())")
+        self.model = model
+        self.dt = 1.0 / tick_rate
+        self.keyframe_every = keyframe_every
+        self.max_backlog = max_backlog
+        self.bot = bot
+        self.tick = 0
+        self.clients: Set[_Client] = set()
+        self._actions: List[tuple] = []
+        self._free_players = [i for i in range(len(model.players))
+                              if bot is None or i != bot.player_index]
+        self._encoder = DiffEncoder(keyframe_every)
+        self.stats: Dict[str, float] = {"ticks": 0, "bytes_out": 0, "frames_skipped": 0, "tick_seconds": 0.0}
+        self._server = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    # ============ CONNEXIONS ============
+    async def start(self, host: str = "127.0.0.1", port: int = 8765):
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _handle_client(self, reader, writer):
+        player_index = self._free_players.pop(0) if self._free_players else None
+        client = _Client(writer, player_index)
+        self._handlers.add(asyncio.current_task())
+        writer.write(frame(protocol.hello(player_index, self.model.layout)))
+        self.clients.add(client)
+        try:
+            while True:
+                payload = await protocol.read_frame(reader)
+                is_action = bool(payload) and payload[0] == protocol.ACTION
+                if not payload or (is_action and len(payload) != protocol.ACTION_SIZE):
+                    break  # trame vide ou de mauvaise taille: erreur de protocole, on ferme
+                if is_action and player_index is not None:
+                    op, _, dx, dy = protocol.parse_action(payload)
+                    # Un client ne pilote que le joueur qui lui a été attribué
+                    self._actions.append((op, player_index, dx, dy))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.clients.discard(client)
+            self._handlers.discard(asyncio.current_task())
+            if player_index is not None:
+                self._free_players.append(player_index)
+            writer.close()
+
+    # ============ BOUCLE DE TICK ============
+    def step(self):
+        """Un tick: actions reçues, modèle, bot, puis diffusion"""
+        start = time.perf_counter()
+        model = self.model
+        actions, self._actions = self._actions, []
+        for op, player_index, dx, dy in actions:
+            if op == MOVE:
+                model.move_player(player_index, max(-1, min(1, dx)), max(-1, min(1, dy)))
+            elif op == INTERACT:
+                model.interact_with_station(player_index)
+            elif op == CHOP:
+                model.chop_at_station(player_index)
+
+        model.clock.advance(self.dt)
+        model.update(self.dt)
+        if self.bot is not None:
+            self.bot.update(model)
+        self.tick += 1
+        self._broadcast()
+        self.stats["ticks"] += 1
+        self.stats["tick_seconds"] += time.perf_counter() - start
+
+    def _broadcast(self):
+        if not self.clients:
+            return  # le prochain delta couvrira aussi ce tick
+        payload = self._encoder.encode(self.model, self.tick)
+        if payload[0] == KEYFRAME:
+            # Keyframe périodique: tout le monde se resynchronise dessus
+            for client in self.clients:
+                client.needs_keyframe = False
+        delta = frame(payload)
+        keyframe = None
+        for client in self.clients:
+            transport = client.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.max_backlog:
+                client.needs_keyframe = True
+                self.stats["frames_skipped"] += 1
+                continue
+            if client.needs_keyframe:
+                if keyframe is None:
+                    keyframe = frame(self._encoder.snapshot(self.model))
+                data = keyframe
+                client.needs_keyframe = False
+            else:
+                data = delta
+            client.writer.write(data)
+            self.stats["bytes_out"] += len(data)
+
+    async def run(self, seconds: Optional[float] = None):
+        """Tick à cadence fixe (temps réel); s'arrête à la fin de la partie ou après `seconds`"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        end = None if seconds is None else next_tick + seconds
+        while not self.model.is_over() and (end is None or next_tick < end):
+            self.step()
+            next_tick += self.dt
+            delay = next_tick - loop.time()
+            if delay < -0.25:
+                next_tick = loop.time()  # trop en retard: on ne rattrape pas en rafale
+            await asyncio.sleep(max(0.0, delay))
+
+    async def close(self):
+        for client in list(self.clients):
+            client.writer.close()
+        if self._handlers:
+            # Les lectures en cours se terminent sur la fermeture de la connexion
+            await asyncio.wait(list(self._handlers), timeout=1.0)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+def new_server_model(layout_path: Optional[str] = None, players: int = 1, seed: Optional[int] = None,
+                     load: Optional[str] = None) -> GameModel:
+    """Modèle serveur: SimClock, silencieux, `players` joueurs (ajoutés au départ du plan)"""
+    layout = load_layout(layout_path) if layout_path else None
+    model = GameModel(clock=SimClock(), verbose=False, layout=layout, seed=seed,
+                      order_stream=parse_profile(load) if load else None)
+    x, y = model.layout.players[0]
+    while len(model.players) < players:
+        model.players.append(Player(x, y))
+    return model
+
+
+async def _serve(args):
+    model = new_server_model(args.layout, args.players, args.seed, args.load)
+    bot = AIBot(player_index=0, verbose=False) if args.bot else None
+    server = GameServer(model, tick_rate=args.tick_rate, bot=bot)
+    await server.start(args.host, args.port)
+    print(f"serveur sur {args.host}:{server.port} ({len(model.players)} joueurs, {args.tick_rate:g} ticks/s)")
+    try:
+        await server.run(args.seconds)
+    finally:
+        await server.close()
+    stats = server.stats
+    ticks = max(1, stats["ticks"])
+    print(f"ticks={ticks:.0f} tick_ms={stats['tick_seconds'] / ticks * 1000:.3f} "
+          f"bytes_out={stats['bytes_out']:.0f} skipped={stats['frames_skipped']:.0f} score={model.score}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur de jeu (TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--tick-rate", type=float, default=60.0)
+    parser.add_argument("--seconds", type=float, default=None, help="arrêt après N secondes")
+    parser.add_argument("--bot", action="store_true", help="le joueur 0 est joué par AIBot")
+    parser.add_argument("--layout", default=None)
+    parser.add_argument("--load", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(_serve(args))
+
+
+if __name__ == "__main__":
+    main()
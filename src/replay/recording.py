@@ -0,0 +1,115 @@
+"""Enregistrement et relecture d'une partie
+
+Un enregistrement est la suite des trames de DiffEncoder (une par tick, une
+keyframe toutes les `keyframe_every` trames) précédée d'un en-tête JSON (plan
+de cuisine, pas de temps). Format:
+
+    b"OCREC1\\n" | u32 taille de l'en-tête | en-tête JSON | (u32 taille | trame)*
+
+Recording.seek(i) repart de la dernière keyframe <= i puis applique au plus
+keyframe_every - 1 deltas: le coût d'un saut ne dépend pas de la longueur de
+la partie. Vers l'avant et à courte distance, les deltas sont appliqués à la
+suite sans revenir à une keyframe.
+"""
+import bisect
+import json
+import struct
+from pathlib import Path
+from typing import List, Union
+
+from src.model.clock import SimClock
+from src.model.game_model import GameModel
+from src.model.layout import KitchenLayout
+from src.net.diff import KEYFRAME, DiffDecoder, DiffEncoder
+
+MAGIC = b"OCREC1\n"
+_SIZE = struct.Struct(">I")
+
+
+class SessionRecorder:
+    def __init__(self, model: GameModel, path: Union[str, Path], dt: float = 1 / 60,
+                 keyframe_every: int = 300):
+        """dt: pas nominal d'un tick (vitesse de relecture 1x)"""
+        self.model = model
+        self.encoder = DiffEncoder(keyframe_every)
+        self.tick = 0
+        self._file = open(path, "wb")
+        header = json.dumps({"layout": model.layout.to_dict(), "dt": dt,
+                             "keyframe_every": keyframe_every}).encode("utf-8")
+        self._file.write(MAGIC + _SIZE.pack(len(header)) + header)
+
+    def record(self):
+        """À appeler une fois par tick, après model.update"""
+        self.tick += 1
+        payload = self.encoder.encode(self.model, self.tick)
+        self._file.write(_SIZE.pack(len(payload)) + payload)
+
+    def close(self):
+        self.encoder.close()
+        self._file.close()
+
+
+class Recording:
+    def __init__(self, data: bytes):
+        if not data.startswith(MAGIC):
+            raise ValueError("ce n'est pas un enregistrement de partie")
+        pos = len(MAGIC)
+        size = _SIZE.unpack_from(data, pos)[0]
+        header = json.loads(data[pos + 4:pos + 4 + size].decode("utf-8"))
+        pos += 4 + size
+        self.layout = KitchenLayout.from_dict(header["layout"])
+        self.dt = header["dt"]
+        self.keyframe_every = header["keyframe_every"]
+
+        # Trames (vues sur le fichier, sans copie) et index des keyframes
+        view = memoryview(data)
+        self.frames: List[memoryview] = []
+        self.keyframes: List[int] = []
+        while pos + 4 <= len(data):
+            size = _SIZE.unpack_from(data, pos)[0]
+            frame = view[pos + 4:pos + 4 + size]
+            if len(frame) < size:
+                break  # enregistrement interrompu: dernière trame incomplète
+            if frame[0] == KEYFRAME:
+                self.keyframes.append(len(self.frames))
+            self.frames.append(frame)
+            pos += 4 + size
+        if not self.keyframes:
+            raise ValueError("enregistrement sans keyframe")
+
+        self.model = GameModel(clock=SimClock(), verbose=False, layout=self.layout)
+        self._decoder = DiffDecoder(self.model)
+        self.position = -1  # trame actuellement appliquée au modèle
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Recording":
+        return cls(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def duration(self) -> float:
+        return len(self.frames) * self.dt
+
+    def keyframe_before(self, index: int) -> int:
+        return self.keyframes[max(0, bisect.bisect_right(self.keyframes, index) - 1)]
+
+    def seek(self, index: int) -> GameModel:
+        """Amène le modèle à l'état de la trame `index` et le retourne"""
+        index = max(self.keyframes[0], min(index, len(self.frames) - 1))
+        if index == self.position:
+            return self.model
+        start = self.position + 1
+        keyframe = self.keyframe_before(index)
+        if index < self.position or keyframe > self.position:
+            # En arrière, ou une keyframe plus proche que la position courante
+            if index < self.position:
+                self.model.completed_orders = []
+            start = keyframe
+        apply = self._decoder.apply
+        frames = self.frames
+        for i in range(start, index + 1):
+            apply(frames[i])
+        self.position = index
+        return self.model
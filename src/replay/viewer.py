@@ -0,0 +1,139 @@
+"""Lecteur de parties enregistrées (affichage par GameView.render)
+
+    python -m src.replay.viewer partie.ocrec
+
+Espace: pause | ←/→: image précédente/suivante (en pause) | Maj+←/→: ±5 s
+↑/↓: vitesse x2 / /2 (0.25x à 16x) | Début/Fin | clic ou glisser sur la barre: déplacement
+Échap: quitter
+
+À vitesse élevée, une seule image est dessinée par rafraîchissement: les
+trames intermédiaires sont appliquées sans être dessinées (ou sautées via une
+keyframe si l'écart est grand).
+"""
+import argparse
+import time
+
+import pygame
+
+from src.replay.recording import Recording
+from src.view.game_view import SCALERS, GameView, init_display, parse_size
+
+SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+_BAR_HEIGHT = 36
+
+
+class ReplayViewer:
+    def __init__(self, recording: Recording, fps: int = 60, canvas=None, scaler: str = "scale"):
+        init_display()
+        self.recording = recording
+        self.view = GameView(logical_size=canvas, scaler=scaler)
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.running = True
+        self.paused = False
+        self.speed_index = SPEEDS.index(1.0)
+        self.position = float(recording.keyframes[0])  # trame (fractionnaire) affichée
+        self.scrubbing = False
+        self.font = pygame.font.Font(None, 26)
+
+    @property
+    def speed(self) -> float:
+        return SPEEDS[self.speed_index]
+
+    def run(self):
+        last = time.perf_counter()
+        end = len(self.recording) - 1
+        while self.running:
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            self._handle_events()
+            if not self.paused and not self.scrubbing:
+                self.position = min(end, self.position + elapsed * self.speed / self.recording.dt)
+            model = self.recording.seek(int(self.position))
+            self.view.render(model, overlay=self._draw_timeline)
+            self.clock.tick(self.fps)
+
+    # ============ ENTRÉES ============
+    def _handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                self._handle_key(event)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self._on_bar(self.view.to_logical(event.pos)):
+                self.scrubbing = True
+                self._scrub(self.view.to_logical(event.pos)[0])
+            elif event.type == pygame.MOUSEMOTION and self.scrubbing:
+                self._scrub(self.view.to_logical(event.pos)[0])
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                self.scrubbing = False
+
+    def _handle_key(self, event):
+        frames_per_second = 1.0 / self.recording.dt
+        shift = event.mod & pygame.KMOD_SHIFT
+        if event.key == pygame.K_ESCAPE:
+            self.running = False
+        elif event.key == pygame.K_SPACE:
+            self.paused = not self.paused
+        elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            direction = 1 if event.key == pygame.K_RIGHT else -1
+            if shift:
+                self._jump(direction * 5 * frames_per_second)
+            else:
+                self.paused = True
+                self._jump(direction)
+        elif event.key == pygame.K_UP:
+            self.speed_index = min(len(SPEEDS) - 1, self.speed_index + 1)
+        elif event.key == pygame.K_DOWN:
+            self.speed_index = max(0, self.speed_index - 1)
+        elif event.key == pygame.K_HOME:
+            self.position = 0.0
+        elif event.key == pygame.K_END:
+            self.position = float(len(self.recording) - 1)
+
+    def _jump(self, frames: float):
+        self.position = max(0.0, min(len(self.recording) - 1, int(self.position) + frames))
+
+    # ============ BARRE DE LECTURE ============
+    def _bar_rect(self) -> pygame.Rect:
+        width, height = self.view.screen.get_size()
+        return pygame.Rect(0, height - _BAR_HEIGHT, width, _BAR_HEIGHT)
+
+    def _on_bar(self, pos) -> bool:
+        return self._bar_rect().collidepoint(pos)
+
+    def _scrub(self, x: int):
+        bar = self._bar_rect()
+        fraction = min(1.0, max(0.0, (x - bar.x) / bar.width))
+        self.position = fraction * (len(self.recording) - 1)
+
+    def _draw_timeline(self, screen):
+        bar = self._bar_rect()
+        pygame.draw.rect(screen, (25, 25, 30), bar)
+        fraction = self.recording.position / max(1, len(self.recording) - 1)
+        pygame.draw.rect(screen, (100, 200, 255), (bar.x, bar.y, int(bar.width * fraction), 4))
+        for keyframe in self.recording.keyframes:
+            x = bar.x + int(bar.width * keyframe / max(1, len(self.recording) - 1))
+            pygame.draw.line(screen, (70, 70, 80), (x, bar.y + 4), (x, bar.y + 8))
+        t = self.recording.position * self.recording.dt
+        state = "pause" if self.paused else f"x{self.speed:g}"
+        label = (f"{t:6.1f} s / {self.recording.duration:.1f} s   image {self.recording.position}"
+                 f"/{len(self.recording) - 1}   {state}")
+        screen.blit(self.font.render(label, True, (230, 230, 230)), (bar.x + 10, bar.y + 12))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Relecture d'une partie enregistrée")
+    parser.add_argument("path")
+    parser.add_argument("--speed", type=float, default=1.0, choices=SPEEDS)
+    parser.add_argument("--canvas", type=parse_size, default=None, help="canevas logique, ex. 1280x720")
+    parser.add_argument("--scaler", default="scale", choices=SCALERS)
+    args = parser.parse_args(argv)
+    viewer = ReplayViewer(Recording.load(args.path), canvas=args.canvas, scaler=args.scaler)
+    viewer.speed_index = SPEEDS.index(args.speed)
+    viewer.run()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
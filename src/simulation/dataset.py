@@ -0,0 +1,374 @@
+"""Démonstrations d'AIBot pour l'apprentissage par imitation
+
+Des parties headless (une tâche du pool de processus par groupe de graines)
+produisent un exemple par action du bot: l'observation juste avant le cycle
+du bot, l'action (ACTIONS: un pas de déplacement, interagir, couper) et la
+récompense, variation du score jusqu'à l'action suivante (ou la fin de la
+partie, done=1). La somme des récompenses d'une partie est son score final.
+
+Stockage: des shards de `shard_size` exemples (le dernier de chaque tâche est
+plus court), chacun un tableau structuré NumPy (.npy, champs de RECORD_FIELDS)
+écrit d'un bloc quand il est plein, et un index.json (dimensions, noms des
+composantes de l'observation, shards et leurs tailles) écrit en dernier.
+DemoDataset ouvre les shards avec np.load(mmap_mode="r"): l'accès à un
+exemple ou à un lot ne lit que les pages concernées.
+
+Observation (float32, valeurs brutes): temps de partie restant, position et
+objet tenu du joueur, puis par station l'objet, le temps de cuisson écoulé
+(0 si rien ne cuit), le nombre d'objets posés et les MAX_CONTENTS premiers,
+puis les MAX_ORDERS commandes les plus urgentes (plat, temps restant). Les
+objets sont les codes de src/net/diff.item_code (0 = rien), les plats
+1 + rang dans ItemType: des catégories, pas des grandeurs.
+
+    python -m src.simulation.dataset demos --episodes 256
+    python -m src.simulation.dataset demos --episodes 1000 --load "poisson:rate=0.3,max_concurrent=8"
+"""
+import argparse
+import bisect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.controller.bot_controller import AIBot, BotParams
+from src.model.game_model import GameModel, ItemType
+from src.model.order_stream import parse_profile
+from src.net.diff import item_code
+from src.simulation.headless import DEFAULT_DT, new_model, simulate
+
+ACTIONS = ("left", "right", "up", "down", "interact", "chop")
+_MOVES = {(-1, 0): 0, (1, 0): 1, (0, -1): 2, (0, 1): 3}
+INTERACT, CHOP = 4, 5
+
+MAX_CONTENTS = 4
+MAX_ORDERS = 6
+_DISHES = {t: i + 1 for i, t in enumerate(ItemType)}
+_STATION_WIDTH = 3 + MAX_CONTENTS  # objet, cuisson, nombre d'objets posés, objets
+
+INDEX_FILE = "index.json"
+FORMAT = 1
+
+
+def observation_fields(n_stations: int) -> List[str]:
+    names = ["time_left", "player_x", "player_y", "held"]
+    for i in range(n_stations):
+        names += [f"station{i}_item", f"station{i}_cooking", f"station{i}_contents"]
+        names += [f"station{i}_content{j}" for j in range(MAX_CONTENTS)]
+    for k in range(MAX_ORDERS):
+        names += [f"order{k}_dish", f"order{k}_time_left"]
+    return names
+
+
+def record_dtype(obs_dim: int) -> np.dtype:
+    return np.dtype([("obs", "<f4", (obs_dim,)), ("action", "u1"), ("reward", "<f4"),
+                     ("done", "u1"), ("episode", "<u4"), ("tick", "<u4")])
+
+
+RECORD_FIELDS = record_dtype(1).names
+
+
+# ============ OBSERVATION ============
+class ObservationEncoder:
+    """Observation d'un joueur, reconstruite seulement quand le modèle a changé
+
+    refresh() (avant le cycle du bot, à chaque tick) ne réécrit la partie
+    lente (stations, commandes) que si les compteurs de version ont bougé,
+    avec les instants absolus (début de cuisson, échéance). write() les
+    convertit en durées pour l'instant du refresh: une action du bot
+    n'avance pas l'horloge.
+    """
+    def __init__(self, model: GameModel, player_index: int = 0):
+        self.player_index = player_index
+        self.fields = observation_fields(len(model.stations))
+        self.dim = len(self.fields)
+        self._base = np.zeros(self.dim, np.float32)
+        stations_end = 4 + _STATION_WIDTH * len(model.stations)
+        self._cooking = np.arange(5, stations_end, _STATION_WIDTH)
+        self._deadlines = np.arange(stations_end + 1, self.dim, 2)
+        self._versions = None
+        self.x = self.y = 0
+        self.now = self.book_now = self.time_left = 0.0
+
+    def refresh(self, model: GameModel):
+        player = model.players[self.player_index]
+        self.x, self.y = player.x, player.y
+        self.now = model.clock()
+        self.book_now = model.orders.now
+        self.time_left = model.time_left()
+        versions = (player.version, model.stations_version, model.orders.version)
+        if versions == self._versions:
+            return
+        self._versions = versions
+        base = self._base
+        base[:] = 0.0
+        base[3] = item_code(player.held_item)
+        i = 4
+        for station in model.stations:
+            contents = station.contents
+            base[i] = item_code(station.item)
+            base[i + 1] = station.cooking_start_time  # absolu, converti par write()
+            base[i + 2] = len(contents)
+            for j, item in enumerate(contents[:MAX_CONTENTS]):
+                base[i + 3 + j] = item_code(item)
+            i += _STATION_WIDTH
+        for order in model.orders.earliest_n(MAX_ORDERS):
+            base[i] = _DISHES[order.items_needed[0]]
+            base[i + 1] = order.deadline
+            i += 2
+
+    def write(self, out: np.ndarray):
+        """Observation du dernier refresh dans out (vecteur de taille dim)"""
+        out[:] = self._base
+        out[0] = self.time_left
+        out[1] = self.x
+        out[2] = self.y
+        cooking = out[self._cooking]
+        out[self._cooking] = np.where(cooking > 0, self.now - cooking, 0.0)
+        orders = out[self._deadlines - 1] > 0
+        out[self._deadlines] = np.where(orders, out[self._deadlines] - self.book_now, 0.0)
+
+
+# ============ ÉCRITURE ============
+class ShardWriter:
+    """Exemples en tableaux structurés de shard_size lignes, écrits quand ils sont pleins"""
+    def __init__(self, directory: Union[str, Path], prefix: str, obs_dim: int, shard_size: int):
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.buffer = np.zeros(shard_size, record_dtype(obs_dim))
+        self.rows = 0
+        self.shards: List[Tuple[str, int]] = []  # (fichier, exemples)
+
+    def next_row(self) -> np.void:
+        """Ligne suivante du shard courant, à remplir par l'appelant"""
+        if self.rows == self.shard_size:
+            self.flush()
+        row = self.buffer[self.rows]
+        self.rows += 1
+        return row
+
+    def flush(self):
+        if not self.rows:
+            return
+        name = f"{self.prefix}-{len(self.shards):05d}.npy"
+        np.save(self.directory / name, self.buffer[:self.rows])
+        self.shards.append((name, self.rows))
+        self.rows = 0
+
+
+class DemoRecorder:
+    """Enveloppe le bot (update(model) comme lui) et écrit un exemple par action
+
+    Les actions sont relevées par les événements du modèle émis pendant
+    bot.update: déplacement du joueur, coupe, sinon changement de station
+    (interaction). Un exemple attend l'action suivante pour connaître sa
+    récompense.
+    """
+    def __init__(self, bot: AIBot, model: GameModel, writer: ShardWriter, episode: int):
+        self.bot = bot
+        self.writer = writer
+        self.episode = episode
+        self.encoder = ObservationEncoder(model, bot.player_index)
+        self.tick = 0
+        self._action: Optional[int] = None
+        self._acting = False
+        self._pending = np.zeros(1, writer.buffer.dtype)[0]
+        self._pending_score: Optional[int] = None
+        model.subscribe(self)
+
+    def update(self, model: GameModel):
+        self.tick += 1
+        encoder = self.encoder
+        encoder.refresh(model)
+        score = model.score
+        self._action = None
+        self._acting = True
+        self.bot.update(model)
+        self._acting = False
+        if self._action is None:
+            return
+        self._emit(score, done=False)
+        pending = self._pending
+        encoder.write(pending["obs"])
+        pending["action"] = self._action
+        pending["tick"] = self.tick
+        self._pending_score = score
+
+    def close(self, model: GameModel):
+        """Fin de partie: dernier exemple (done) et désabonnement"""
+        self._emit(model.score, done=True)
+        model.unsubscribe(self)
+
+    def _emit(self, score: int, done: bool):
+        if self._pending_score is None:
+            return
+        row = self.writer.next_row()
+        row["obs"] = self._pending["obs"]
+        row["action"] = self._pending["action"]
+        row["reward"] = score - self._pending_score
+        row["done"] = done
+        row["episode"] = self.episode
+        row["tick"] = self._pending["tick"]
+        self._pending_score = None
+
+    # Événements du modèle: première action d'un cycle du bot
+    def player_moved(self, player_index: int, player):
+        if self._acting and self._action is None and player_index == self.bot.player_index:
+            encoder = self.encoder
+            step = ((player.x > encoder.x) - (player.x < encoder.x), (player.y > encoder.y) - (player.y < encoder.y))
+            self._action = _MOVES.get(step)
+
+    def item_chopped(self, station):
+        if self._acting and self._action is None:
+            self._action = CHOP
+
+    def station_changed(self, station):
+        if self._acting and self._action is None:
+            self._action = INTERACT
+
+
+def _generate(directory: str, prefix: str, seeds: Sequence[int], params: BotParams, dt: float,
+              load: Optional[str], seconds: float, shard_size: int) -> dict:
+    """Parties d'un groupe de graines (dans un processus du pool): shards écrits et totaux"""
+    writer = None
+    scores = []
+    for seed in seeds:
+        model = new_model(seed=seed, order_stream=parse_profile(load) if load else None)
+        if writer is None:
+            writer = ShardWriter(directory, prefix, len(observation_fields(len(model.stations))), shard_size)
+        recorder = DemoRecorder(AIBot(player_index=0, verbose=False, params=params), model, writer, seed)
+        simulate(model, recorder, seconds, dt)
+        recorder.close(model)
+        scores.append(model.score)
+    writer.flush()
+    return {"shards": writer.shards, "scores": scores, "n_stations": len(model.stations)}
+
+
+def export(directory: Union[str, Path], seeds: Sequence[int], params: Optional[BotParams] = None,
+           dt: float = DEFAULT_DT, load: Optional[str] = None, seconds: float = 3600.0,
+           shard_size: int = 16384, workers: Optional[int] = None, chunk: int = 16) -> dict:
+    """Génère le jeu de démonstrations dans directory (une partie par graine); retourne l'index"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    params = params or BotParams()
+    seeds = list(seeds)
+    chunks = [seeds[i:i + chunk] for i in range(0, len(seeds), chunk)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        done = list(pool.map(_generate, [str(directory)] * len(chunks),
+                             [f"shard-{i:04d}" for i in range(len(chunks))], chunks,
+                             [params] * len(chunks), [dt] * len(chunks), [load] * len(chunks),
+                             [seconds] * len(chunks), [shard_size] * len(chunks)))
+    fields = observation_fields(done[0]["n_stations"])
+    index = {
+        "format": FORMAT,
+        "obs_dim": len(fields),
+        "obs_fields": fields,
+        "actions": list(ACTIONS),
+        "shard_size": shard_size,
+        "episodes": len(seeds),
+        "seeds": seeds,
+        "dt": dt,
+        "load": load,
+        "params": asdict(params),
+        "score_mean": float(np.mean([s for part in done for s in part["scores"]])),
+        "shards": [{"file": name, "rows": rows} for part in done for name, rows in part["shards"]],
+    }
+    index["rows"] = sum(shard["rows"] for shard in index["shards"])
+    # L'index en dernier: un jeu sans index.json est incomplet
+    tmp = directory / (INDEX_FILE + ".tmp")
+    tmp.write_text(json.dumps(index, indent=1), encoding="utf-8")
+    os.replace(tmp, directory / INDEX_FILE)
+    return index
+
+
+# ============ LECTURE ============
+class DemoDataset:
+    """Jeu de démonstrations projeté en mémoire (shards ouverts à la demande, sans copie)
+
+    dataset[i] -> exemple (vue sur le shard), dataset.batch(indices) -> colonnes
+    des exemples demandés, dataset.shard(k) -> tableau structuré du shard k.
+    """
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.index = json.loads((self.directory / INDEX_FILE).read_text(encoding="utf-8"))
+        if self.index["format"] != FORMAT:
+            raise ValueError(f"format de jeu de démonstrations inconnu: {self.index['format']}")
+        self.obs_dim = self.index["obs_dim"]
+        self.dtype = record_dtype(self.obs_dim)
+        self._files = [shard["file"] for shard in self.index["shards"]]
+        self._starts = [0]
+        for shard in self.index["shards"]:
+            self._starts.append(self._starts[-1] + shard["rows"])
+        self._open: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def shard(self, k: int) -> np.ndarray:
+        data = self._open.get(k)
+        if data is None:
+            data = np.load(self.directory / self._files[k], mmap_mode="r")
+            if data.dtype != self.dtype:
+                raise ValueError(f"{self._files[k]}: type {data.dtype} au lieu de {self.dtype}")
+            self._open[k] = data
+        return data
+
+    def locate(self, i: int) -> Tuple[int, int]:
+        """Rang global -> (shard, rang dans le shard)"""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        k = bisect.bisect_right(self._starts, i) - 1
+        return k, i - self._starts[k]
+
+    def __getitem__(self, i: int) -> np.void:
+        k, j = self.locate(i)
+        return self.shard(k)[j]
+
+    def batch(self, indices: Sequence[int]) -> Dict[str, np.ndarray]:
+        """Colonnes (RECORD_FIELDS) des exemples demandés, dans l'ordre donné"""
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("rang hors du jeu de démonstrations")
+        out = np.empty(len(indices), self.dtype)
+        shards = np.searchsorted(self._starts, indices, side="right") - 1
+        for k in np.unique(shards):
+            where = np.nonzero(shards == k)[0]
+            out[where] = self.shard(int(k))[indices[where] - self._starts[k]]
+        return {name: out[name] for name in RECORD_FIELDS}
+
+    def sample(self, size: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        rng = rng if rng is not None else np.random.default_rng()
+        return self.batch(rng.integers(0, len(self), size))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Démonstrations du bot pour l'apprentissage par imitation")
+    parser.add_argument("out", help="répertoire du jeu (shards .npy + index.json)")
+    parser.add_argument("--episodes", type=int, default=64, help="parties (graines seed..)")
+    parser.add_argument("--seed", type=int, default=0, help="première graine")
+    parser.add_argument("--dt", type=float, default=DEFAULT_DT)
+    parser.add_argument("--load", default=None, help="profil de charge (voir headless --load)")
+    parser.add_argument("--order-choice", default="edf", help="politique de commande du bot")
+    parser.add_argument("--shard-size", type=int, default=16384, help="exemples par shard")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=16, help="parties par tâche du pool")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = export(args.out, range(args.seed, args.seed + args.episodes),
+                   BotParams(order_choice=args.order_choice), args.dt, args.load,
+                   shard_size=args.shard_size, workers=args.workers, chunk=args.chunk)
+    elapsed = time.perf_counter() - start
+    print(f"{index['episodes']} parties, {index['rows']} exemples ({index['obs_dim']} composantes)"
+          f" dans {len(index['shards'])} shards en {elapsed:.1f} s, score moyen {index['score_mean']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Boucle de jeu sans affichage: même enchaînement que GameController.run
+(model.update puis bot.update) mais pilotée par une SimClock, donc rapide
+et déterministe à graine fixe."""
+import argparse
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.model.clock import SimClock
+from src.model.game_model import GameModel
+from src.model.order_stream import OrderStream, parse_profile
+from src.controller.bot_controller import AIBot
+from src.metrics.kpi import KitchenMetrics, latency_summary, merge_latency
+
+DEFAULT_DT = 1 / 60
+
+
+@dataclass
+class EpisodeResult:
+    score: int
+    ticks: int
+    sim_seconds: float
+
+
+def new_model(start: float = 0.0, seed: Optional[int] = None,
+              order_stream: Optional[OrderStream] = None, layout=None) -> GameModel:
+    """Modèle silencieux branché sur une horloge simulée"""
+    return GameModel(clock=SimClock(start), verbose=False, layout=layout,
+                     order_stream=order_stream, seed=seed)
+
+
+def simulate(model: GameModel, bot: Optional[AIBot], seconds: float, dt: float = DEFAULT_DT,
+             on_tick: Optional[Callable[[], None]] = None) -> int:
+    """Avance le modèle (et le bot) de `seconds` secondes simulées; retourne le nombre de ticks
+    on_tick: appelé après chaque tick (enregistrement, etc.)"""
+    clock = model.clock
+    ticks = 0
+    for _ in range(int(seconds / dt)):
+        clock.advance(dt)
+        model.update(dt)
+        if bot is not None:
+            bot.update(model)
+        if on_tick is not None:
+            on_tick()
+        ticks += 1
+        if model.is_over():
+            break
+    return ticks
+
+
+def run_episode(bot: Optional[AIBot] = None, seed: Optional[int] = None,
+                dt: float = DEFAULT_DT, max_seconds: float = 3600.0,
+                order_stream: Optional[OrderStream] = None, layout=None) -> EpisodeResult:
+    """Joue une partie complète (jusqu'à la fin du chrono) sans affichage"""
+    model = new_model(seed=seed, order_stream=order_stream, layout=layout)
+    if bot is None:
+        bot = AIBot(player_index=0, verbose=False)
+    ticks = simulate(model, bot, max_seconds, dt)
+    return EpisodeResult(score=model.score, ticks=ticks, sim_seconds=model.clock())
+
+
+def _latency_episode(seed: int, dt: float, load: Optional[str]):
+    """Une partie (EDF) dans un processus du pool: score et histogrammes de latence"""
+    model = new_model(seed=seed, order_stream=parse_profile(load) if load else None)
+    metrics = KitchenMetrics(model)
+    simulate(model, AIBot(player_index=0, verbose=False), 3600.0, dt)
+    return model.score, metrics.latency
+
+
+def run_latency_batch(seeds, dt: float = DEFAULT_DT, load: Optional[str] = None,
+                      workers: Optional[int] = None):
+    """Joue une partie par graine en parallèle; retourne (scores, latences fusionnées)"""
+    from concurrent.futures import ProcessPoolExecutor
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_latency_episode, seeds, [dt] * len(seeds), [load] * len(seeds)))
+    return [score for score, _ in results], merge_latency(latency for _, latency in results)
+
+
+def _print_latency(latency):
+    print(f"{'plat/issue':<22}{'n':>6}{'p50':>8}{'p90':>8}{'p99':>8}")
+    for (dish, outcome), hist in sorted(latency.items()):
+        summary = latency_summary(hist)
+        print(f"{dish + '/' + outcome:<22}{summary['count']:>6}"
+              f"{summary['p50']:>8.1f}{summary['p90']:>8.1f}{summary['p99']:>8.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partie headless (bot seul)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dt", type=float, default=DEFAULT_DT)
+    parser.add_argument("--planner", choices=["edf", "mc"], default="edf")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--load", default=None,
+                        help='profil de charge, ex: "poisson:rate=0.5,max_concurrent=50"')
+    parser.add_argument("--runs", type=int, default=1,
+                        help="nombre de parties (graines seed..seed+runs-1) jouées en parallèle, latences fusionnées")
+    parser.add_argument("--trace", default=None,
+                        help="écrit les phases de décision du bot (Chrome trace-event JSON) dans ce fichier")
+    parser.add_argument("--record", default=None,
+                        help="enregistre la partie (relecture: python -m src.replay.viewer FICHIER)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="expose les indicateurs (format Prometheus) sur http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-jsonl", default=None,
+                        help="ajoute un snapshot JSON des indicateurs à ce fichier toutes les 5 s")
+    args = parser.parse_args(argv)
+
+    if args.runs > 1:
+        scores, latency = run_latency_batch(range(args.seed, args.seed + args.runs), args.dt,
+                                            args.load, args.workers)
+        print(f"runs={len(scores)} score_mean={sum(scores) / len(scores):.1f} "
+              f"min={min(scores)} max={max(scores)}")
+        _print_latency(latency)
+        return
+
+    # Outils importés à la demande: les workers qui importent ce module pour
+    # simulate() ne chargent ni serveur HTTP, ni pool, ni enregistreur
+    from src.metrics.export import JsonlSnapshotter, PrometheusExporter
+    from src.metrics.tracing import Tracer
+    from src.replay.recording import SessionRecorder
+
+    planner = None
+    if args.planner == "mc":
+        from src.controller.planner import MonteCarloPlanner
+        planner = MonteCarloPlanner(workers=args.workers, blocking=True)
+    stream = parse_profile(args.load) if args.load else None
+    model = new_model(seed=args.seed, order_stream=stream)
+    metrics = KitchenMetrics(model)
+    exporters = []
+    if args.metrics_port is not None:
+        exporters.append(PrometheusExporter([metrics], port=args.metrics_port).start())
+    if args.metrics_jsonl:
+        exporters.append(JsonlSnapshotter([metrics], args.metrics_jsonl).start())
+    tracer = Tracer() if args.trace else None
+    recorder = SessionRecorder(model, args.record, dt=args.dt) if args.record else None
+    try:
+        ticks = simulate(model, AIBot(player_index=0, planner=planner, verbose=False, tracer=tracer),
+                         3600.0, args.dt, on_tick=recorder.record if recorder else None)
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if planner is not None:
+            planner.close()
+        for exporter in exporters:
+            exporter.close()
+    snap = metrics.snapshot()
+    print(f"score={model.score} ticks={ticks} sim_seconds={model.clock():.1f}")
+    print(f"delivered={snap['orders_delivered']} expired={snap['orders_expired']} "
+          f"overcooked={snap['orders_overcooked']} latency_avg={snap['latency_avg']:.1f}s "
+          f"tick_rate={snap['tick_rate']:.0f}/s")
+    _print_latency(metrics.latency)
+    if tracer is not None:
+        tracer.save(args.trace)
+        for name, stats in tracer.summary().items():
+            print(f"trace {name:<18} n={stats['count']:<7} total={stats['total_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Balayage des réglages du bot (BotParams) en parallèle
+
+Chaque configuration est jouée sur les mêmes graines (parties headless, même
+flux de commandes à graine égale) dans un pool de processus. Les résultats
+sont écrits colonne par colonne dans un .npz (numpy), puis on affiche le
+front de Pareto score moyen (max) / commandes expirées (min).
+
+    python -m src.simulation.sweep --grid --seeds 4
+    python -m src.simulation.sweep --random 64 --seeds 8 --out sweep.npz
+"""
+import argparse
+import itertools
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, fields
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.controller.bot_controller import ORDER_CHOICES, AIBot, BotParams
+from src.metrics.kpi import KitchenMetrics
+from src.model.order_stream import parse_profile
+from src.simulation.headless import DEFAULT_DT, new_model, simulate
+
+# Valeurs essayées pour chaque réglage
+SPACE: Dict[str, Sequence] = {
+    "step_gap": (0.1, 0.15, 0.25, 0.4),
+    "cooldown": (0.0, 0.1, 0.25),
+    "oven_wait": (0.25, 0.5, 1.0),
+    "stove_wait": (0.1, 0.25, 0.5),
+    "order_choice": ORDER_CHOICES,
+}
+
+PARAM_NAMES = [f.name for f in fields(BotParams)]
+
+
+def grid(space: Dict[str, Sequence] = SPACE) -> List[BotParams]:
+    names = list(space)
+    return [BotParams(**dict(zip(names, values))) for values in itertools.product(*space.values())]
+
+
+def random_search(n: int, seed: int = 0, space: Dict[str, Sequence] = SPACE) -> List[BotParams]:
+    """n configurations distinctes tirées dans la grille (toute la grille si n la dépasse)"""
+    configs = grid(space)
+    return random.Random(seed).sample(configs, min(n, len(configs)))
+
+
+def evaluate(params: BotParams, seeds: Sequence[int], dt: float = DEFAULT_DT,
+             load: Optional[str] = None) -> dict:
+    """Joue une partie par graine; moyennes de score, commandes livrées et expirées"""
+    scores, delivered, expired = [], [], []
+    for seed in seeds:
+        model = new_model(seed=seed, order_stream=parse_profile(load) if load else None)
+        metrics = KitchenMetrics(model)
+        simulate(model, AIBot(player_index=0, verbose=False, params=params), 3600.0, dt)
+        scores.append(model.score)
+        delivered.append(metrics.orders_by_outcome["delivered"])
+        expired.append(metrics.orders_by_outcome["expired"])
+    return {
+        **asdict(params),
+        "score_mean": statistics.fmean(scores),
+        "score_std": statistics.pstdev(scores),
+        "delivered_mean": statistics.fmean(delivered),
+        "expired_mean": statistics.fmean(expired),
+    }
+
+
+def run_sweep(configs: Sequence[BotParams], seeds: Sequence[int], dt: float = DEFAULT_DT,
+              load: Optional[str] = None, workers: Optional[int] = None) -> List[dict]:
+    n = len(configs)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(evaluate, configs, [list(seeds)] * n, [dt] * n, [load] * n,
+                             chunksize=max(1, n // 64)))
+
+
+def pareto_front(rows: Sequence[dict]) -> List[dict]:
+    """Configurations non dominées (score plus haut ou moins d'expirations), par score décroissant"""
+    ranked = sorted(rows, key=lambda r: (-r["score_mean"], r["expired_mean"]))
+    front, best_expired = [], float("inf")
+    for row in ranked:
+        if row["expired_mean"] < best_expired:
+            front.append(row)
+            best_expired = row["expired_mean"]
+    return front
+
+
+def save_columns(rows: Sequence[dict], path: str):
+    """Une colonne numpy par champ, compressées dans un .npz"""
+    columns = {name: np.asarray([row[name] for row in rows]) for name in rows[0]}
+    np.savez_compressed(path, **columns)
+
+
+def load_columns(path: str) -> Dict[str, np.ndarray]:
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Balayage des réglages du bot")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--grid", action="store_true", help="grille complète (défaut)")
+    mode.add_argument("--random", type=int, metavar="N", help="N configurations tirées au hasard")
+    parser.add_argument("--sample-seed", type=int, default=0, help="graine du tirage des configurations")
+    parser.add_argument("--seeds", type=int, default=4, help="parties par configuration (graines 0..N-1)")
+    parser.add_argument("--dt", type=float, default=DEFAULT_DT)
+    parser.add_argument("--load", default=None, help="profil de charge (voir headless --load)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", default="sweep.npz")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    configs = random_search(args.random, args.sample_seed) if args.random else grid()
+    rows = run_sweep(configs, range(args.seeds), args.dt, args.load, args.workers)
+    save_columns(rows, args.out)
+    print(f"{len(rows)} configurations x {args.seeds} graines -> {args.out}")
+
+    print(f"{'score':>8}{'±':>6}{'expirées':>10}{'livrées':>9}  réglages")
+    for row in pareto_front(rows)[:args.top]:
+        settings = " ".join(f"{name}={row[name]}" for name in PARAM_NAMES)
+        print(f"{row['score_mean']:>8.1f}{row['score_std']:>6.1f}{row['expired_mean']:>10.2f}"
+              f"{row['delivered_mean']:>9.2f}  {settings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Tournoi de stratégies du bot sur des charges identiques
+
+Chaque politique joue les mêmes graines (même suite de plats, mêmes règles
+GameModel; seules les arrivées retardées par max_concurrent dépendent de la
+cuisine, comme en jeu), dans un pool de processus. Par partie: score,
+commandes livrées / expirées, et temps CPU du bot par action (appel de
+bot.update qui a modifié la cuisine). Le classement donne le score moyen avec
+son intervalle de confiance (bootstrap) et l'écart au premier, apparié par
+graine (même charge: intervalle bien plus serré que la différence de deux
+moyennes).
+
+Politiques: un nom de ORDER_CHOICES, des réglages BotParams
+("rapide:step_gap=0.1,order_choice=fifo"), ou un bot externe
+("mien:factory=paquet.module:fabrique", fabrique(player_index=0) -> objet
+avec update(model)).
+
+    python -m src.simulation.tournament edf fifo --episodes 200
+    python -m src.simulation.tournament edf rapide:step_gap=0.1 --episodes 2000 --out tournoi.npz
+"""
+import argparse
+import importlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.controller.bot_controller import ORDER_CHOICES, AIBot, BotParams
+from src.metrics.kpi import KitchenMetrics
+from src.model.order_stream import parse_profile
+from src.simulation.headless import DEFAULT_DT, new_model, simulate
+from src.simulation.sweep import save_columns
+
+COLUMNS = ("score", "delivered", "expired", "actions", "bot_cpu")
+_PARAM_TYPES = {f.name: type(f.default) for f in fields(BotParams)}
+
+
+@dataclass(frozen=True)
+class Policy:
+    name: str
+    params: BotParams = field(default_factory=BotParams)
+    factory: Optional[str] = None  # "paquet.module:fabrique"
+
+    def make_bot(self):
+        if self.factory is None:
+            return AIBot(player_index=0, verbose=False, params=self.params)
+        module, _, attr = self.factory.partition(":")
+        return getattr(importlib.import_module(module), attr)(player_index=0)
+
+
+def parse_policy(spec: str) -> Policy:
+    """ "edf", "rapide:step_gap=0.1,order_choice=fifo" ou "mien:factory=paquet.module:fabrique"
+    ValueError pour un nom ou un réglage inconnu (avant de lancer le pool)"""
+    name, _, params = spec.partition(":")
+    if not params:
+        if name not in ORDER_CHOICES:
+            raise ValueError(f"politique inconnue: {name} (attendu: {', '.join(ORDER_CHOICES)},"
+                             f" ou nom:réglage=valeur,...)")
+        return Policy(name, BotParams(order_choice=name))
+    overrides, factory = {}, None
+    for pair in filter(None, params.split(",")):
+        key, _, value = pair.partition("=")
+        if key == "factory":
+            factory = value
+        elif key in _PARAM_TYPES:
+            overrides[key] = _PARAM_TYPES[key](value)
+        else:
+            raise ValueError(f"réglage inconnu: {key} (attendu: factory, {', '.join(_PARAM_TYPES)})")
+    if overrides.get("order_choice", ORDER_CHOICES[0]) not in ORDER_CHOICES:
+        raise ValueError(f"order_choice inconnu: {overrides['order_choice']}"
+                         f" (attendu: {', '.join(ORDER_CHOICES)})")
+    return Policy(name, BotParams(**overrides), factory)
+
+
+class _TimedBot:
+    """Mesure le temps CPU des appels bot.update et compte ceux qui ont agi"""
+    __slots__ = ("bot", "cpu", "actions")
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.cpu = 0.0
+        self.actions = 0
+
+    def update(self, model):
+        changes = model.changes
+        start = time.thread_time()
+        self.bot.update(model)
+        self.cpu += time.thread_time() - start
+        if model.changes != changes:
+            self.actions += 1
+
+
+def play(policy: Policy, seeds: Sequence[int], dt: float = DEFAULT_DT,
+         load: Optional[str] = None) -> Dict[str, list]:
+    """Une partie par graine (dans un processus du pool): colonnes COLUMNS"""
+    rows: Dict[str, list] = {name: [] for name in COLUMNS}
+    for seed in seeds:
+        model = new_model(seed=seed, order_stream=parse_profile(load) if load else None)
+        metrics = KitchenMetrics(model)
+        bot = _TimedBot(policy.make_bot())
+        simulate(model, bot, 3600.0, dt)
+        rows["score"].append(model.score)
+        rows["delivered"].append(metrics.orders_by_outcome["delivered"])
+        rows["expired"].append(metrics.orders_by_outcome["expired"])
+        rows["actions"].append(bot.actions)
+        rows["bot_cpu"].append(bot.cpu)
+    return rows
+
+
+def run_tournament(policies: Sequence[Policy], seeds: Sequence[int], dt: float = DEFAULT_DT,
+                   load: Optional[str] = None, workers: Optional[int] = None,
+                   chunk: int = 16) -> Dict[str, Dict[str, np.ndarray]]:
+    """Politique -> colonnes (une valeur par graine, dans l'ordre de `seeds`)"""
+    seeds = list(seeds)
+    chunks = [seeds[i:i + chunk] for i in range(0, len(seeds), chunk)]
+    tasks = [(policy, part) for policy in policies for part in chunks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        done = list(pool.map(play, [p for p, _ in tasks], [s for _, s in tasks],
+                             [dt] * len(tasks), [load] * len(tasks)))
+    results: Dict[str, Dict[str, list]] = {p.name: {name: [] for name in COLUMNS} for p in policies}
+    for (policy, _), rows in zip(tasks, done):
+        for name in COLUMNS:
+            results[policy.name][name].extend(rows[name])
+    return {policy: {name: np.asarray(values) for name, values in columns.items()}
+            for policy, columns in results.items()}
+
+
+def bootstrap_ci(values: np.ndarray, confidence: float = 0.95, resamples: int = 2000,
+                 seed: int = 0) -> Tuple[float, float]:
+    """Intervalle de confiance de la moyenne (bootstrap percentile, graine fixe)"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return float(values.mean()), float(values.mean())
+    rng = np.random.default_rng(seed)
+    means = values[rng.integers(0, len(values), size=(resamples, len(values)))].mean(axis=1)
+    alpha = (1 - confidence) / 2
+    lo, hi = np.quantile(means, [alpha, 1 - alpha])
+    return float(lo), float(hi)
+
+
+def leaderboard(results: Dict[str, Dict[str, np.ndarray]], confidence: float = 0.95) -> List[dict]:
+    """Classement par score moyen; écart au premier apparié par graine"""
+    rows = []
+    for name, columns in results.items():
+        actions = columns["actions"].sum()
+        rows.append({
+            "policy": name,
+            "episodes": len(columns["score"]),
+            "score_mean": float(columns["score"].mean()),
+            "score_ci": bootstrap_ci(columns["score"], confidence),
+            "delivered_mean": float(columns["delivered"].mean()),
+            "expired_mean": float(columns["expired"].mean()),
+            "cpu_per_action_us": float(columns["bot_cpu"].sum() / actions * 1e6) if actions else 0.0,
+        })
+    rows.sort(key=lambda r: -r["score_mean"])
+    best = results[rows[0]["policy"]]["score"]
+    for row in rows:
+        diff = results[row["policy"]]["score"] - best
+        row["gap_mean"] = float(diff.mean())
+        row["gap_ci"] = bootstrap_ci(diff, confidence)
+    return rows
+
+
+def save_results(results: Dict[str, Dict[str, np.ndarray]], seeds: Sequence[int], path: str):
+    """Une ligne par (politique, graine), colonnes numpy dans un .npz"""
+    rows = [{"policy": name, "seed": seed, **{c: columns[c][i] for c in COLUMNS}}
+            for name, columns in results.items() for i, seed in enumerate(seeds)]
+    save_columns(rows, path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tournoi de stratégies du bot (mêmes graines)")
+    parser.add_argument("policies", nargs="+", help='ex: edf fifo "rapide:step_gap=0.1"')
+    parser.add_argument("--episodes", type=int, default=100, help="parties par politique (graines seed..)")
+    parser.add_argument("--seed", type=int, default=0, help="première graine")
+    parser.add_argument("--dt", type=float, default=DEFAULT_DT)
+    parser.add_argument("--load", default=None, help="profil de charge (voir headless --load)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk", type=int, default=16, help="parties par tâche du pool")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--out", default=None, help="résultats par partie (.npz)")
+    args = parser.parse_args(argv)
+
+    try:
+        policies = [parse_policy(spec) for spec in args.policies]
+    except ValueError as e:
+        parser.error(str(e))
+    if len({p.name for p in policies}) != len(policies):
+        parser.error("noms de politiques en double")
+    seeds = range(args.seed, args.seed + args.episodes)
+    start = time.perf_counter()
+    results = run_tournament(policies, seeds, args.dt, args.load, args.workers, args.chunk)
+    elapsed = time.perf_counter() - start
+    if args.out:
+        save_results(results, seeds, args.out)
+    print(f"{len(policies)} politiques x {args.episodes} parties en {elapsed:.1f} s"
+          f" (IC {args.confidence:.0%}, bootstrap)")
+
+    print(f"{'#':>2} {'politique':<20}{'score':>8}{'IC':>18}{'écart':>8}{'IC':>18}"
+          f"{'livrées':>9}{'expirées':>9}{'µs/action':>10}")
+    for rank, row in enumerate(leaderboard(results, args.confidence), 1):
+        lo, hi = row["score_ci"]
+        glo, ghi = row["gap_ci"]
+        print(f"{rank:>2} {row['policy']:<20}{row['score_mean']:>8.1f}{f'[{lo:.1f}, {hi:.1f}]':>18}"
+              f"{row['gap_mean']:>8.1f}{f'[{glo:.1f}, {ghi:.1f}]':>18}"
+              f"{row['delivered_mean']:>9.2f}{row['expired_mean']:>9.2f}{row['cpu_per_action_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
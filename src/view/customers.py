@@ -0,0 +1,105 @@
+"""Clients devant le comptoir, un par commande active
+
+Les clients sont indexés par id de commande et suivent les événements du
+modèle (order_added / order_removed avec l'issue, src/model/events.py) au
+lieu de rescanner model.orders et model.completed_orders pour chaque client
+à chaque image: un client part content, fâché ou déçu selon l'issue, et
+disparaît sans animation si la commande quitte une réplique sans issue.
+"""
+import math
+from typing import Dict, Optional
+
+from src.model.game_model import GameModel, Order
+from src.model.items import ItemType, slotted
+
+_EXPRESSIONS = {'delivered': 'happy', 'expired': 'angry', 'overcooked': 'overcooked'}
+
+
+@slotted
+class Customer:
+    order: Order
+    order_type: Optional[ItemType]
+    x: float
+    target_x: float
+    y: int = 550  # hauteur fixe dans la zone clients
+    waiting: bool = False
+    leaving: bool = False
+    expression: str = 'waiting'
+    animation_offset: float = 0.0
+
+
+class CustomerManager:
+    def __init__(self, width: int):
+        self.width = width
+        self.customers: Dict[int, Customer] = {}  # id de commande -> client, dans l'ordre d'arrivée
+        self.model: Optional[GameModel] = None
+        self._slots_dirty = True  # file d'attente modifiée: places à recalculer
+
+    def bind(self, model: GameModel):
+        """S'abonne au modèle (et se désabonne du précédent); un client par commande déjà présente"""
+        if self.model is not None:
+            self.model.unsubscribe(self)
+        self.model = model
+        model.subscribe(self)
+        self.customers = {}
+        for order in model.orders:
+            self.order_added(order)
+
+    # ============ ÉVÉNEMENTS DU MODÈLE ============
+    def order_added(self, order: Order):
+        self.customers[order.id] = Customer(
+            order, order.items_needed[0] if order.items_needed else None,
+            x=self.width + 50, target_x=self.width + 50)
+        self._slots_dirty = True
+
+    def order_removed(self, order: Order, outcome: Optional[str]):
+        customer = self.customers.get(order.id)
+        if customer is None:
+            return
+        expression = _EXPRESSIONS.get(outcome)
+        if expression is None:
+            del self.customers[order.id]
+        else:
+            customer.leaving = True
+            customer.expression = expression
+        self._slots_dirty = True
+
+    # ============ IMAGE ============
+    def update(self, model: GameModel, animation_time: float):
+        if self._slots_dirty:
+            self._assign_slots()
+
+        gone = []
+        for order_id, customer in self.customers.items():
+            customer.animation_offset = math.sin(animation_time + order_id) * 2
+            if customer.leaving:
+                customer.x += 4
+                if customer.x > self.width + 150:
+                    gone.append(order_id)
+                continue
+            if not customer.waiting:
+                # Marche vers sa place
+                if abs(customer.x - customer.target_x) > 5:
+                    customer.x += -3 if customer.x > customer.target_x else 3
+                else:
+                    customer.x = customer.target_x
+                    customer.waiting = True
+
+            remaining = customer.order.time_remaining
+            if remaining < 10:
+                customer.expression = 'angry'
+            elif remaining < 30:
+                customer.expression = 'worried'
+            else:
+                customer.expression = 'waiting'
+        for order_id in gone:
+            del self.customers[order_id]
+
+    def _assign_slots(self):
+        """Places au comptoir selon le rang d'arrivée parmi les clients qui attendent"""
+        queue = [c for c in self.customers.values() if not c.leaving]
+        available_width = self.width - 300  # marges
+        spacing = min(250, available_width // max(len(queue), 1))
+        for index, customer in enumerate(queue):
+            customer.target_x = 150 + index * spacing
+        self._slots_dirty = False
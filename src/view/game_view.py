@@ -1,18 +1,55 @@
 import pygame
-import time
 import math
-from typing import List
-from src.model.game_model import GameModel, ItemType, StationType
+from itertools import islice
+from functools import cached_property
+from typing import Optional, Tuple
+from src.model.game_model import HEATED_STATIONS, GameModel, Item, ItemType, StationType
+from src.view.customers import CustomerManager
+from src.view.particles import FLAME, SMOKE, STEAM, ParticleSystem
+from src.view.sprites import SpriteAtlas
+
+def init_display():
+    """Initialise seulement l'affichage et les polices (pygame.init démarre aussi son, manettes...)"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+
+SCALERS = ("scale", "smoothscale", "gpu")
+
+
+def parse_size(text: str) -> Tuple[int, int]:
+    """"1280x720" -> (1280, 720)"""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
 
 class GameView:
-    def __init__(self, width: int = 1000, height: int = 700):  # Increased size
-        
-        info = pygame.display.Info()
-        self.width = info.current_w
-        self.height = info.current_h
-        
+    def __init__(self, width: int = 1000, height: int = 700,  # Increased size
+                 logical_size: Optional[Tuple[int, int]] = None, display_size: Optional[Tuple[int, int]] = None,
+                 scaler: str = "scale"):
+        """logical_size: dessin sur un canevas de taille fixe (ex. (1280, 720)), mis à l'échelle de
+        l'écran une fois par image; sans lui, dessin direct à la résolution native.
+        scaler: "scale" / "smoothscale" (pygame.transform, coût proportionnel aux pixels de l'écran)
+        ou "gpu" (pygame.SCALED: mise à l'échelle par le moteur de rendu SDL, souris convertie par SDL).
+        display_size: fenêtre de cette taille au lieu du plein écran"""
+        if scaler not in SCALERS:
+            raise ValueError(f"scaler inconnu: {scaler!r} (attendu: {', '.join(SCALERS)})")
+        flags = pygame.FULLSCREEN if display_size is None else 0
+        self.scaler = scaler
+        self._viewport = None  # zone de l'écran où le canevas est affiché (mise à l'échelle logicielle)
+        if logical_size is not None and scaler == "gpu":
+            self.display = pygame.display.set_mode(logical_size, flags | pygame.SCALED)
+        else:
+            self.display = pygame.display.set_mode(display_size or (0, 0), flags)
         
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        # self.screen: surface de dessin (l'écran, ou le canevas logique)
+        self.screen = self.display
+        if logical_size is not None and scaler != "gpu":
+            self.screen = pygame.Surface(logical_size).convert()
+            self._fit_viewport()
+        self.width, self.height = self.screen.get_size()
         
         pygame.display.set_caption("Overcooked Deluxe - Multi-Recettes")
         
@@ -29,25 +66,108 @@ class GameView:
             'furnace': (20, 20, 20), 
         }
         
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 20)
-        self.large_font = pygame.font.Font(None, 42)
+        # Polices chargées au premier texte dessiné (voir font/small_font/large_font)
         self.animation_time = 0
-        self.customers = {}  # Dict with order ID as key
-        self.customer_spawn_timer = 0
+        self.customers = CustomerManager(self.width)  # clients indexés par id de commande
+        self.atlas = SpriteAtlas()  # chefs, clients et bulles pré-dessinés (voir _SPRITES)
+        self._sprites_baked = False
+        self.particles = ParticleSystem()
+        self._particles_time = None  # horloge du modèle à la dernière image
+
+        # Index par plan de cuisine, recalculés quand le modèle change de stations
+        self._indexed_stations = None
+        self._station_draws = []  # [(méthode de dessin, station)]
+        self._heated_stations = []
+        self._counters = []
+        self._now = 0.0  # horloge du modèle (time.time en jeu, SimClock en replay), relue à chaque render
+
+    @cached_property
+    def font(self):
+        return pygame.font.Font(None, 28)
+
+    @cached_property
+    def small_font(self):
+        return pygame.font.Font(None, 20)
+
+    @cached_property
+    def large_font(self):
+        return pygame.font.Font(None, 42)
+
+    def _index_layout(self, model: GameModel):
+        draw_by_type = {
+            StationType.STOVE: self._draw_stove,
+            StationType.FURNACE: self._draw_furnace,
+            StationType.CUTTING_BOARD: self._draw_cutting_board,
+            StationType.ASSEMBLY: self._draw_assembly_station,
+            StationType.DELIVERY: self._draw_delivery_station,
+            StationType.INGREDIENT_SPAWN: self._draw_ingredient_spawn,
+        }
+        self._station_draws = [(draw_by_type[s.station_type], s) for s in model.stations]
+        self._heated_stations = [s for s in model.stations if s.station_type in HEATED_STATIONS]
+        self._counters = list(model.layout.counters)
+        self._indexed_stations = model.stations
     
-    def render(self, model: GameModel):
+    def render(self, model: GameModel, overlay=None):
+        """Dessine une image; overlay(screen) optionnel, dessiné par-dessus avant l'affichage"""
         self.animation_time += 0.05
+        self._now = model.clock()
+        if model.stations is not self._indexed_stations:
+            self._index_layout(model)
+        if not self._sprites_baked:
+            self._bake_sprites()
         self._draw_floor()
         self._draw_walls()
-        self._draw_counters(model.stations)
-        self._draw_enhanced_stations(model.stations)
+        self._draw_counters(self._counters)
+        self._draw_enhanced_stations()
         self._update_customers(model)
         self._draw_customers()
         self._draw_players(model.players)
         self._draw_modern_ui(model)
-        self._draw_particle_effects(model.stations)
+        self._draw_particle_effects(self._heated_stations)
+        if overlay is not None:
+            overlay(self.screen)
+        if self._viewport is not None:
+            self._present_canvas()
         pygame.display.flip()
+
+    def animating(self, model: GameModel) -> bool:
+        """True si l'image change d'elle-même, modèle inchangé: clients (arrivée, attente, départ),
+        particules, cuisson en cours, objet porté qui rebondit"""
+        return bool(self.customers.customers or self.particles.count
+                    or any(s.item and s.cooking_start_time > 0 for s in self._heated_stations)
+                    or any(p.held_item for p in model.players))
+
+    # ============ CANEVAS LOGIQUE ============
+    def _fit_viewport(self):
+        """Plus grande zone centrée de l'écran aux proportions du canevas (bandes noires autour)"""
+        dw, dh = self.display.get_size()
+        lw, lh = self.screen.get_size()
+        scale = min(dw / lw, dh / lh)
+        w, h = int(lw * scale), int(lh * scale)
+        self._viewport = pygame.Rect((dw - w) // 2, (dh - h) // 2, w, h)
+        self._bars = [r for r in (pygame.Rect(0, 0, dw, self._viewport.top),
+                                  pygame.Rect(0, self._viewport.bottom, dw, dh - self._viewport.bottom),
+                                  pygame.Rect(0, 0, self._viewport.left, dh),
+                                  pygame.Rect(self._viewport.right, 0, dw - self._viewport.right, dh)) if r.w and r.h]
+        # Mise à l'échelle directement dans l'écran, sans surface intermédiaire
+        self._target = self.display.subsurface(self._viewport)
+
+    def _present_canvas(self):
+        if self._viewport.size == self.screen.get_size():
+            self._target.blit(self.screen, (0, 0))
+        elif self.scaler == "smoothscale":
+            pygame.transform.smoothscale(self.screen, self._viewport.size, self._target)
+        else:
+            pygame.transform.scale(self.screen, self._viewport.size, self._target)
+        for bar in self._bars:
+            self.display.fill((0, 0, 0), bar)
+
+    def to_logical(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """Position écran (souris) -> position sur la surface de dessin"""
+        if self._viewport is None:
+            return pos
+        vx, vy, vw, vh = self._viewport
+        return ((pos[0] - vx) * self.width // vw, (pos[1] - vy) * self.height // vh)
     
     def _draw_floor(self):
         tile_size = 50
@@ -78,8 +198,8 @@ class GameView:
             for y in range(10, wall_height - 10, tile_size):
                 pygame.draw.rect(self.screen, (118, 127, 135), (x, y, tile_size-2, tile_size-2))
     
-    def _draw_counters(self, stations):
-        for cx, cy, cw, ch in [(80, 140, 500, 80), (620, 140, 150, 80)]:
+    def _draw_counters(self, counters):
+        for cx, cy, cw, ch in counters:
             shadow = pygame.Surface((cw + 10, ch + 10), pygame.SRCALPHA)
             shadow.fill((0, 0, 0, 40))
             self.screen.blit(shadow, (cx + 5, cy + 5))
@@ -92,20 +212,9 @@ class GameView:
             pygame.draw.rect(self.screen, (100, 50, 5), (cx + 20, drawer_y, cw - 40, 35), 2)
             pygame.draw.circle(self.screen, (180, 180, 180), (cx + cw // 2, drawer_y + 17), 4)
     
-    def _draw_enhanced_stations(self, stations):
-        for station in stations:
-            if station.station_type == StationType.STOVE:
-                self._draw_stove(station)
-            elif station.station_type == StationType.FURNACE:
-                self._draw_furnace(station)
-            elif station.station_type == StationType.CUTTING_BOARD:
-                self._draw_cutting_board(station)
-            elif station.station_type == StationType.ASSEMBLY:
-                self._draw_assembly_station(station)
-            elif station.station_type == StationType.DELIVERY:
-                self._draw_delivery_station(station)
-            elif station.station_type == StationType.INGREDIENT_SPAWN:
-                self._draw_ingredient_spawn(station)
+    def _draw_enhanced_stations(self):
+        for draw, station in self._station_draws:
+            draw(station)
     
     def _draw_stove(self, station):
         x, y = station.x, station.y
@@ -119,9 +228,7 @@ class GameView:
         if station.item and station.item.item_type == ItemType.RAW_PATTY and station.cooking_start_time > 0:
             glow_intensity = int(100 + 155 * abs(math.sin(self.animation_time * 2)))
             pygame.draw.circle(self.screen, (glow_intensity, 20, 0), (x, y), 18)
-            for i in range(3):
-                flame_y = y + 15 + math.sin(self.animation_time * 3 + i) * 3
-                pygame.draw.circle(self.screen, (255, 150, 0), (x - 10 + i * 10, int(flame_y)), 4)
+            # (flammes: particules, voir _draw_particle_effects)
         
         for i in range(3):
             pygame.draw.circle(self.screen, (80, 80, 80), (x - 15 + i * 15, y - 30), 3)
@@ -129,7 +236,7 @@ class GameView:
         if station.item:
             self._draw_item(station.item, x, y - 5)
             if station.item.item_type == ItemType.RAW_PATTY and station.cooking_start_time > 0:
-                cooking_progress = (time.time() - station.cooking_start_time) / station.cooking_duration
+                cooking_progress = (self._now - station.cooking_start_time) / station.cooking_duration
                 cooking_progress = min(1.0, max(0.0, cooking_progress))
                 bar_width, bar_height = 50, 8
                 bar_x, bar_y = x - bar_width // 2, y + 35
@@ -149,7 +256,7 @@ class GameView:
         if station.item:
             self._draw_item(station.item, x, y - 5)
             if station.item.item_type == ItemType.UNCOOKED_PIZZA and station.cooking_start_time > 0:
-                cooking_progress = (time.time() - station.cooking_start_time) / station.cooking_duration
+                cooking_progress = (self._now - station.cooking_start_time) / station.cooking_duration
                 cooking_progress = min(1.0, max(0.0, cooking_progress))
                 bar_width, bar_height = 50, 8
                 bar_x, bar_y = x - bar_width // 2, y + 35
@@ -214,213 +321,201 @@ class GameView:
         pygame.draw.rect(self.screen, (210, 210, 230), (x - 25, y - 25, 50, 50), border_radius=3)
         pygame.draw.rect(self.screen, (180, 180, 200), (x + 10, y, 8, 15), border_radius=2)
         if station.ingredient_type:
-            item_dummy = type('Item', (), {'item_type': station.ingredient_type, 'chopped': False})()
+            item_dummy = Item(station.ingredient_type)
             self._draw_item(item_dummy, x, y, scale=0.8)
             label_text = station.ingredient_type.value.capitalize()
             text_surface = self.small_font.render(label_text, True, (100, 100, 100))
             self.screen.blit(text_surface, text_surface.get_rect(center=(x, y + 35)))
     
     def _draw_particle_effects(self, stations):
-        for station in stations:
-            if (station.station_type == StationType.STOVE and station.item and 
-                station.item.item_type == ItemType.RAW_PATTY and station.cooking_start_time > 0):
-                for i in range(3):
-                    offset = math.sin(self.animation_time * 2 + i) * 5
-                    y_pos = station.y - 20 - i * 10 - (self.animation_time % 20) * 2
-                    alpha = max(0, 100 - i * 30 - int((self.animation_time % 20) * 5))
-                    if alpha > 0:
-                        steam = pygame.Surface((20, 20), pygame.SRCALPHA)
-                        pygame.draw.circle(steam, (255, 255, 255, alpha), (10, 10), 8)
-                        self.screen.blit(steam, (int(station.x + offset - 10), int(y_pos)))
+        """Émetteurs par station chauffée: flammes pendant la cuisson, vapeur (steak cru),
+        fumée quand le plat cuit trop ou a brûlé"""
+        # Pas de temps sur l'horloge du modèle: particules figées en pause de relecture
+        dt = min(0.1, max(0.0, self._now - self._particles_time)) if self._particles_time is not None else 0.0
+        self._particles_time = self._now
+        particles = self.particles
+        for index, station in enumerate(stations):
+            item = station.item
+            if item is None:
+                continue
+            x, y = station.x, station.y
+            cooking = station.cooking_start_time > 0
+            if station.station_type == StationType.STOVE:
+                if cooking:
+                    particles.emitter((index, FLAME), FLAME, x, y + 18, dt)
+                    kind = STEAM if item.item_type == ItemType.RAW_PATTY else SMOKE
+                    particles.emitter((index, kind), kind, x, y - 20, dt)
+                elif item.item_type == ItemType.BURNT_PATTY:
+                    particles.emitter((index, SMOKE), SMOKE, x, y - 20, dt)
+            elif cooking:
+                particles.emitter((index, FLAME), FLAME, x, y + 8, dt)
+                if item.item_type == ItemType.PIZZA:  # cuite mais toujours au four
+                    particles.emitter((index, SMOKE), SMOKE, x, y - 25, dt)
+            elif item.overcooked:
+                particles.emitter((index, SMOKE), SMOKE, x, y - 25, dt)
+        particles.update(dt)
+        particles.draw(self.screen)
     
     def _update_customers(self, model):
-        # Remove customers for completed/expired orders
-        for order_id in list(self.customers.keys()):
-            if order_id not in [o.id for o in model.orders]:
-                completed_info = next((c for c in model.completed_orders if c['id'] == order_id), None)
-                if completed_info:
-                    if completed_info['type'] == 'overcooked':
-                        self.customers[order_id]['leaving'] = True
-                        self.customers[order_id]['expression'] = 'overcooked'
-                    elif completed_info['type'] == 'expired':
-                        self.customers[order_id]['leaving'] = True
-                        self.customers[order_id]['expression'] = 'angry'
-                    elif completed_info['type'] == 'completed':
-                        self.customers[order_id]['leaving'] = True
-                        self.customers[order_id]['expression'] = 'happy'
-                else:
-                    if order_id in self.customers:
-                        del self.customers[order_id]
-        
-        # Calculate spacing for customers based on the current number of orders
-        num_orders = len(model.orders)
-        available_width = self.width - 300  # Leave margins
-        spacing = min(250, available_width // max(num_orders, 1)) if num_orders > 0 else 250
-        start_x = 150
-
-        # Add new customers for new orders
-        for idx, order in enumerate(model.orders):
-            if order.id not in self.customers:
-                target_x = start_x + idx * spacing
-                self.customers[order.id] = {
-                    'x': self.width + 50, 
-                    'target_x': target_x, 
-                    'y': 550,  # Fixed y position in customer area
-                    'waiting': False,
-                    'leaving': False, 
-                    'animation_offset': 0, 
-                    'expression': 'waiting',
-                    'order_type': order.items_needed[0] if order.items_needed else None,
-                    'order_index': idx
-                }
-        
-        # Update customer positions and expressions
-        for order_id, customer in list(self.customers.items()):
-            if not customer['leaving']:
-                order_idx = next((i for i, o in enumerate(model.orders) if o.id == order_id), -1)
-                if order_idx >= 0:
-                    customer['order_index'] = order_idx
-                    customer['target_x'] = start_x + order_idx * spacing
-            
-            if customer['leaving']:
-                customer['x'] += 4
-                if customer['x'] > self.width + 150:
-                    if order_id in self.customers:
-                        del self.customers[order_id]
-            elif not customer['waiting']:
-                # Move towards target position
-                if abs(customer['x'] - customer['target_x']) > 5:
-                    if customer['x'] > customer['target_x']:
-                        customer['x'] -= 3
-                    else:
-                        customer['x'] += 3
-                else:
-                    customer['x'] = customer['target_x']
-                    customer['waiting'] = True
-            
-            customer['animation_offset'] = math.sin(self.animation_time + order_id) * 2
-            
-            # Update expression based on order time
-            if not customer['leaving'] and order_id in [o.id for o in model.orders]:
-                order = next((o for o in model.orders if o.id == order_id), None)
-                if order:
-                    if order.time_remaining < 10:
-                        customer['expression'] = 'angry'
-                    elif order.time_remaining < 30:
-                        customer['expression'] = 'worried'
-                    else:
-                        customer['expression'] = 'waiting'
+        if model is not self.customers.model:
+            self.customers.bind(model)
+        self.customers.update(model, self.animation_time)
     
     def _draw_customers(self):
-        for customer in self.customers.values():
-            x, y = customer['x'], int(customer['y'] + customer['animation_offset'])
-            expression = customer.get('expression', 'waiting')
-            order_type = customer.get('order_type')
-            
-            # Better customer body - rounded with clothing details
-            # Legs
-            pygame.draw.rect(self.screen, (50, 50, 100), (x - 8, y + 15, 6, 20), border_radius=3)
-            pygame.draw.rect(self.screen, (50, 50, 100), (x + 2, y + 15, 6, 20), border_radius=3)
-            # Shoes
-            pygame.draw.ellipse(self.screen, (40, 40, 40), (x - 10, y + 33, 8, 6))
-            pygame.draw.ellipse(self.screen, (40, 40, 40), (x + 2, y + 33, 8, 6))
-            
-            # Body - shirt
-            pygame.draw.ellipse(self.screen, (100, 150, 200), (x - 15, y - 5, 30, 25))
-            # Collar
-            pygame.draw.line(self.screen, (80, 120, 160), (x - 5, y - 3), (x - 10, y + 5), 2)
-            pygame.draw.line(self.screen, (80, 120, 160), (x + 5, y - 3), (x + 10, y + 5), 2)
-            
-            # Arms
-            pygame.draw.rect(self.screen, (255, 220, 177), (x - 20, y, 8, 15), border_radius=4)
-            pygame.draw.rect(self.screen, (255, 220, 177), (x + 12, y, 8, 15), border_radius=4)
-            pygame.draw.ellipse(self.screen, (255, 210, 167), (x - 22, y + 12, 10, 8))
-            pygame.draw.ellipse(self.screen, (255, 210, 167), (x + 12, y + 12, 10, 8))
-            
-            # Neck
-            pygame.draw.rect(self.screen, (255, 220, 177), (x - 4, y - 8, 8, 6))
-            
-            # Head
-            pygame.draw.circle(self.screen, (255, 220, 177), (x, y - 15), 14)
-            
-            # Hair
-            pygame.draw.arc(self.screen, (80, 50, 30), (x - 14, y - 28, 28, 20), 0, 3.14, 3)
-            
-            # Eyes
-            pygame.draw.circle(self.screen, (255, 255, 255), (x - 5, y - 17), 4)
-            pygame.draw.circle(self.screen, (255, 255, 255), (x + 5, y - 17), 4)
-            pygame.draw.circle(self.screen, (50, 50, 50), (x - 5, y - 16), 3)
-            pygame.draw.circle(self.screen, (50, 50, 50), (x + 5, y - 16), 3)
-            
-            # Eyebrows and mouth based on expression
-            if expression == 'angry' or expression == 'overcooked':
-                # Angry eyebrows
-                pygame.draw.line(self.screen, (50, 50, 50), (x - 8, y - 21), (x - 2, y - 23), 2)
-                pygame.draw.line(self.screen, (50, 50, 50), (x + 2, y - 23), (x + 8, y - 21), 2)
-                # Frown
-                pygame.draw.arc(self.screen, (50, 50, 50), (x - 6, y - 8, 12, 8), 3.14, 6.28, 2)
-            elif expression == 'worried':
-                # Worried eyebrows
-                pygame.draw.line(self.screen, (50, 50, 50), (x - 8, y - 22), (x - 2, y - 21), 2)
-                pygame.draw.line(self.screen, (50, 50, 50), (x + 2, y - 21), (x + 8, y - 22), 2)
-                # Straight mouth
-                pygame.draw.line(self.screen, (50, 50, 50), (x - 5, y - 9), (x + 5, y - 9), 2)
-            elif expression == 'happy':
-                # Happy eyebrows
-                pygame.draw.arc(self.screen, (50, 50, 50), (x - 8, y - 24, 6, 4), 0, 3.14, 2)
-                pygame.draw.arc(self.screen, (50, 50, 50), (x + 2, y - 24, 6, 4), 0, 3.14, 2)
-                # Big smile
-                pygame.draw.arc(self.screen, (50, 50, 50), (x - 7, y - 14, 14, 10), 0, 3.14, 2)
-            else:  # waiting
-                # Normal eyebrows
-                pygame.draw.arc(self.screen, (50, 50, 50), (x - 8, y - 23, 6, 4), 0, 3.14, 1)
-                pygame.draw.arc(self.screen, (50, 50, 50), (x + 2, y - 23, 6, 4), 0, 3.14, 1)
-                # Slight smile
-                pygame.draw.arc(self.screen, (50, 50, 50), (x - 5, y - 13, 10, 6), 0, 3.14, 2)
-            
-            # Speech bubble with order
-            if not customer['leaving'] and order_type and customer['waiting']:
-                # Draw speech bubble
-                bubble_x, bubble_y = x, y - 60
-                bubble_w, bubble_h = 70, 50
-                
-                # Bubble shadow
-                shadow = pygame.Surface((bubble_w + 5, bubble_h + 5), pygame.SRCALPHA)
-                shadow.fill((0, 0, 0, 40))
-                self.screen.blit(shadow, (bubble_x - bubble_w//2 + 2, bubble_y - bubble_h//2 + 2))
-                
-                # Main bubble
-                pygame.draw.ellipse(self.screen, (255, 255, 255), 
-                                  (bubble_x - bubble_w//2, bubble_y - bubble_h//2, bubble_w, bubble_h))
-                pygame.draw.ellipse(self.screen, (200, 200, 200), 
-                                  (bubble_x - bubble_w//2, bubble_y - bubble_h//2, bubble_w, bubble_h), 2)
-                
-                # Small bubble tail
-                pygame.draw.circle(self.screen, (255, 255, 255), (x - 10, y - 35), 6)
-                pygame.draw.circle(self.screen, (200, 200, 200), (x - 10, y - 35), 6, 2)
-                pygame.draw.circle(self.screen, (255, 255, 255), (x - 5, y - 42), 4)
-                pygame.draw.circle(self.screen, (200, 200, 200), (x - 5, y - 42), 4, 1)
-                
-                # Draw the order item in bubble
-                item_dummy = type('Item', (), {'item_type': order_type, 'chopped': False})()
-                self._draw_item(item_dummy, bubble_x, bubble_y - 5, scale=1.2)
-                
-                # "One X please" text
-                order_names = {
-                    ItemType.BURGER: "Burger",
-                    ItemType.PIZZA: "Pizza",
-                    ItemType.SALAD: "Salad"
-                }
-                order_text = order_names.get(order_type, "Order")
-                text_surface = self.small_font.render(order_text, True, (50, 50, 50))
-                self.screen.blit(text_surface, text_surface.get_rect(center=(bubble_x, bubble_y + 15)))
+        for customer in self.customers.customers.values():
+            x, y = int(customer.x), int(customer.y + customer.animation_offset)
+            expression = customer.expression
+            order_type = customer.order_type
+            self._draw_sprite('customer', expression, x, y)
+            if not customer.leaving and order_type and customer.waiting:
+                self._draw_sprite('bubble', order_type, x, y)
             
             # Show "OVERCOOKED!" message if leaving angry due to overcooked food
-            if customer['leaving'] and expression == 'overcooked':
-                text_surface = self.font.render("OVERCOOKED!", True, (255, 50, 50))
-                self.screen.blit(text_surface, text_surface.get_rect(center=(x, y - 80)))
+            if customer.leaving and expression == 'overcooked':
+                self._draw_sprite('label', "OVERCOOKED!", x, y)
+
+    # ============ SPRITES ============
+    # Personnages pré-dessinés dans l'atlas: genre -> (taille, origine dans la région, méthode)
+    # La méthode dessine la variante sur self.screen avec le personnage en (x, y)
+    _SPRITES = {
+        'chef': ((44, 84), (22, 47), '_paint_chef'),
+        'customer': ((50, 72), (25, 30), '_paint_customer'),
+        'bubble': ((90, 66), (45, 90), '_paint_bubble'),
+        'label': ((160, 30), (80, 95), '_paint_label'),
+    }
+    _PREBAKED = ([('chef', 'idle')]
+                 + [('customer', e) for e in ('waiting', 'worried', 'angry', 'happy', 'overcooked')]
+                 + [('bubble', dish) for dish in (ItemType.BURGER, ItemType.PIZZA, ItemType.SALAD)]
+                 + [('label', "OVERCOOKED!")])
+
+    def _bake_sprites(self):
+        """Rastérise toutes les variantes connues (première image); les autres le sont à la demande"""
+        for kind, variant in self._PREBAKED:
+            self._bake(kind, variant)
+        self.atlas.optimize()
+        self._sprites_baked = True
+
+    def _bake(self, kind, variant):
+        size, origin, method = self._SPRITES[kind]
+        paint = getattr(self, method)
+
+        def draw(surface, x, y):
+            screen, self.screen = self.screen, surface  # les _paint_* et _draw_item dessinent sur self.screen
+            try:
+                paint(x, y, variant)
+            finally:
+                self.screen = screen
+        self.atlas.bake((kind, variant), size, origin, draw)
+
+    def _draw_sprite(self, kind, variant, x, y):
+        key = (kind, variant)
+        if key not in self.atlas:
+            self._bake(kind, variant)
+        self.atlas.blit(self.screen, key, x, y)
+
+    def _paint_label(self, x, y, text):
+        text_surface = self.font.render(text, True, (255, 50, 50))
+        self.screen.blit(text_surface, text_surface.get_rect(center=(x, y - 80)))
+
+    def _paint_customer(self, x, y, expression):
+        # Better customer body - rounded with clothing details
+        # Legs
+        pygame.draw.rect(self.screen, (50, 50, 100), (x - 8, y + 15, 6, 20), border_radius=3)
+        pygame.draw.rect(self.screen, (50, 50, 100), (x + 2, y + 15, 6, 20), border_radius=3)
+        # Shoes
+        pygame.draw.ellipse(self.screen, (40, 40, 40), (x - 10, y + 33, 8, 6))
+        pygame.draw.ellipse(self.screen, (40, 40, 40), (x + 2, y + 33, 8, 6))
+
+        # Body - shirt
+        pygame.draw.ellipse(self.screen, (100, 150, 200), (x - 15, y - 5, 30, 25))
+        # Collar
+        pygame.draw.line(self.screen, (80, 120, 160), (x - 5, y - 3), (x - 10, y + 5), 2)
+        pygame.draw.line(self.screen, (80, 120, 160), (x + 5, y - 3), (x + 10, y + 5), 2)
+
+        # Arms
+        pygame.draw.rect(self.screen, (255, 220, 177), (x - 20, y, 8, 15), border_radius=4)
+        pygame.draw.rect(self.screen, (255, 220, 177), (x + 12, y, 8, 15), border_radius=4)
+        pygame.draw.ellipse(self.screen, (255, 210, 167), (x - 22, y + 12, 10, 8))
+        pygame.draw.ellipse(self.screen, (255, 210, 167), (x + 12, y + 12, 10, 8))
+
+        # Neck
+        pygame.draw.rect(self.screen, (255, 220, 177), (x - 4, y - 8, 8, 6))
+
+        # Head
+        pygame.draw.circle(self.screen, (255, 220, 177), (x, y - 15), 14)
+
+        # Hair
+        pygame.draw.arc(self.screen, (80, 50, 30), (x - 14, y - 28, 28, 20), 0, 3.14, 3)
+
+        # Eyes
+        pygame.draw.circle(self.screen, (255, 255, 255), (x - 5, y - 17), 4)
+        pygame.draw.circle(self.screen, (255, 255, 255), (x + 5, y - 17), 4)
+        pygame.draw.circle(self.screen, (50, 50, 50), (x - 5, y - 16), 3)
+        pygame.draw.circle(self.screen, (50, 50, 50), (x + 5, y - 16), 3)
+
+        # Eyebrows and mouth based on expression
+        if expression == 'angry' or expression == 'overcooked':
+            # Angry eyebrows
+            pygame.draw.line(self.screen, (50, 50, 50), (x - 8, y - 21), (x - 2, y - 23), 2)
+            pygame.draw.line(self.screen, (50, 50, 50), (x + 2, y - 23), (x + 8, y - 21), 2)
+            # Frown
+            pygame.draw.arc(self.screen, (50, 50, 50), (x - 6, y - 8, 12, 8), 3.14, 6.28, 2)
+        elif expression == 'worried':
+            # Worried eyebrows
+            pygame.draw.line(self.screen, (50, 50, 50), (x - 8, y - 22), (x - 2, y - 21), 2)
+            pygame.draw.line(self.screen, (50, 50, 50), (x + 2, y - 21), (x + 8, y - 22), 2)
+            # Straight mouth
+            pygame.draw.line(self.screen, (50, 50, 50), (x - 5, y - 9), (x + 5, y - 9), 2)
+        elif expression == 'happy':
+            # Happy eyebrows
+            pygame.draw.arc(self.screen, (50, 50, 50), (x - 8, y - 24, 6, 4), 0, 3.14, 2)
+            pygame.draw.arc(self.screen, (50, 50, 50), (x + 2, y - 24, 6, 4), 0, 3.14, 2)
+            # Big smile
+            pygame.draw.arc(self.screen, (50, 50, 50), (x - 7, y - 14, 14, 10), 0, 3.14, 2)
+        else:  # waiting
+            # Normal eyebrows
+            pygame.draw.arc(self.screen, (50, 50, 50), (x - 8, y - 23, 6, 4), 0, 3.14, 1)
+            pygame.draw.arc(self.screen, (50, 50, 50), (x + 2, y - 23, 6, 4), 0, 3.14, 1)
+            # Slight smile
+            pygame.draw.arc(self.screen, (50, 50, 50), (x - 5, y - 13, 10, 6), 0, 3.14, 2)
+
+    def _paint_bubble(self, x, y, order_type):
+        # Draw speech bubble
+        bubble_x, bubble_y = x, y - 60
+        bubble_w, bubble_h = 70, 50
+
+        # Bubble shadow
+        shadow = pygame.Surface((bubble_w + 5, bubble_h + 5), pygame.SRCALPHA)
+        shadow.fill((0, 0, 0, 40))
+        self.screen.blit(shadow, (bubble_x - bubble_w//2 + 2, bubble_y - bubble_h//2 + 2))
+
+        # Main bubble
+        pygame.draw.ellipse(self.screen, (255, 255, 255), 
+                          (bubble_x - bubble_w//2, bubble_y - bubble_h//2, bubble_w, bubble_h))
+        pygame.draw.ellipse(self.screen, (200, 200, 200), 
+                          (bubble_x - bubble_w//2, bubble_y - bubble_h//2, bubble_w, bubble_h), 2)
+
+        # Small bubble tail
+        pygame.draw.circle(self.screen, (255, 255, 255), (x - 10, y - 35), 6)
+        pygame.draw.circle(self.screen, (200, 200, 200), (x - 10, y - 35), 6, 2)
+        pygame.draw.circle(self.screen, (255, 255, 255), (x - 5, y - 42), 4)
+        pygame.draw.circle(self.screen, (200, 200, 200), (x - 5, y - 42), 4, 1)
+
+        # Draw the order item in bubble
+        item_dummy = Item(order_type)
+        self._draw_item(item_dummy, bubble_x, bubble_y - 5, scale=1.2)
+
+        # "One X please" text
+        order_names = {
+            ItemType.BURGER: "Burger",
+            ItemType.PIZZA: "Pizza",
+            ItemType.SALAD: "Salad"
+        }
+        order_text = order_names.get(order_type, "Order")
+        text_surface = self.small_font.render(order_text, True, (50, 50, 50))
+        self.screen.blit(text_surface, text_surface.get_rect(center=(bubble_x, bubble_y + 15)))
     
-    def _draw_chef_character(self, x, y):
+    def _paint_chef(self, x, y, pose='idle'):
         shadow = pygame.Surface((40, 10), pygame.SRCALPHA)
         pygame.draw.ellipse(shadow, (0, 0, 0, 60), (0, 0, 40, 10))
         self.screen.blit(shadow, (x - 20, y + 25))
@@ -450,7 +545,7 @@ class GameView:
     
     def _draw_players(self, players):
         for player in players:
-            self._draw_chef_character(player.x, player.y)
+            self._draw_sprite('chef', 'idle', player.x, player.y)
             if player.held_item:
                 bounce = math.sin(self.animation_time * 3) * 2
                 self._draw_item(player.held_item, player.x, int(player.y - 50 + bounce))
@@ -490,7 +585,7 @@ class GameView:
         
         # Show timer or "Waiting..." message
         if model.game_started and model.start_time:
-            time_remaining = max(0, model.game_time - (time.time() - model.start_time))
+            time_remaining = model.time_left()
             timer_text = self.font.render(f"⏱ {int(time_remaining // 60):02d}:{int(time_remaining % 60):02d}", True, (255, 255, 255))
         else:
             timer_text = self.font.render("Waiting...", True, (150, 150, 150))
@@ -509,7 +604,9 @@ class GameView:
         title_surface = self.large_font.render("ORDERS", True, (255, 255, 255))
         self.screen.blit(title_surface, (self.width - 270, orders_title_y))
         
-        for i, order in enumerate(model.orders):
+        # Seuls les panneaux qui tiennent à l'écran sont dessinés (charge élevée: des centaines de commandes)
+        visible = max(0, (self.height - 140) // 110)
+        for i, order in enumerate(islice(model.orders, visible)):
             panel_x = self.width - 280
             panel_y = 140 + i * 110
             panel_w, panel_h = 260, 100
@@ -534,7 +631,7 @@ class GameView:
                 self.screen.blit(order_num_text, (panel_x + 15, panel_y + 12))
                 
                 # Item icon (larger and clearer)
-                item_dummy = type('Item', (), {'item_type': item_type, 'chopped': False})()
+                item_dummy = Item(item_type)
                 self._draw_item(item_dummy, panel_x + 40, panel_y + 55, scale=1.5)
                 
                 # Item name
@@ -542,7 +639,7 @@ class GameView:
                 self.screen.blit(item_name_text, (panel_x + 80, panel_y + 45))
                 
                 # Timer bar
-                time_ratio = max(0, min(1, order.time_remaining / 60.0))
+                time_ratio = max(0, min(1, order.time_remaining / order.time_limit))
                 bar_x, bar_y = panel_x + 15, panel_y + 75
                 bar_w, bar_h = panel_w - 30, 15
                 
@@ -0,0 +1,146 @@
+"""Particules (vapeur, flammes, fumée) dans des tableaux NumPy préalloués
+
+Les particules vivantes occupent les `count` premières cases de tableaux de
+taille fixe (position, vitesse, âge, durée de vie, genre): mise à jour
+vectorisée, les mortes sont retirées par compaction, aucune allocation par
+particule. Le dessin copie des sprites pré-rendus, un par genre et par
+niveau d'opacité, en un seul Surface.blits.
+
+Les émetteurs (un par station et par genre) accumulent un débit en
+particules/s: le nombre de particules émises ne dépend pas du nombre
+d'images par seconde. Leurs naissances sont mises en file et créées en une
+seule opération vectorisée au update suivant.
+"""
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Tuple
+
+import numpy as np
+import pygame
+
+STEAM, FLAME, SMOKE = 0, 1, 2
+_ALPHA_LEVELS = 8
+
+
+@dataclass(frozen=True)
+class ParticleKind:
+    color: Tuple[int, int, int]
+    radius: int
+    alpha: int  # opacité à la naissance, décroît linéairement jusqu'à 0
+    life: float  # durée de vie moyenne (s)
+    rise: float  # vitesse verticale (px/s, négatif = monte)
+    jitter: float  # écart-type de la vitesse horizontale (px/s)
+    spread: float  # demi-largeur de la zone d'émission (px)
+    rate: float  # particules/s par émetteur
+
+
+KINDS = (
+    ParticleKind((255, 255, 255), 8, 100, 1.6, -28.0, 6.0, 6.0, 5.0),   # STEAM
+    ParticleKind((255, 150, 0), 4, 230, 0.35, -22.0, 4.0, 11.0, 24.0),  # FLAME
+    ParticleKind((70, 70, 70), 10, 140, 2.2, -20.0, 9.0, 8.0, 9.0),      # SMOKE
+)
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = 8192, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.life = np.ones(capacity, np.float32)
+        self.kind = np.zeros(capacity, np.int8)
+        self.rng = np.random.default_rng(seed)
+        self._emitters: Dict[Hashable, float] = {}  # émetteur -> fraction de particule en attente
+        self._births: List[Tuple[int, float, float, int]] = []  # (genre, x, y, n) à créer au update
+        self._radius = np.array([k.radius for k in KINDS], np.float32)
+        self._spread = np.array([k.spread for k in KINDS], np.float32)
+        self._jitter = np.array([k.jitter for k in KINDS], np.float32)
+        self._rise = np.array([k.rise for k in KINDS], np.float32)
+        self._life = np.array([k.life for k in KINDS], np.float32)
+        self._sprites: List[pygame.Surface] = []  # genre * _ALPHA_LEVELS + niveau
+
+    # ============ ÉMISSION ============
+    def emit(self, kind: int, x: float, y: float, n: int):
+        """n particules autour de (x, y), créées au prochain update"""
+        self._births.append((kind, x, y, n))
+
+    def emitter(self, key: Hashable, kind: int, x: float, y: float, dt: float):
+        """Émission continue au débit du genre; key identifie l'émetteur (station, genre)"""
+        pending = self._emitters.get(key, 0.0) + KINDS[kind].rate * dt
+        n = int(pending)
+        self._emitters[key] = pending - n
+        if n:
+            self._births.append((kind, x, y, n))
+
+    def _spawn(self):
+        """Crée les naissances en file; celles qui dépassent la capacité sont ignorées"""
+        kinds, xs, ys, ns = zip(*self._births)
+        self._births.clear()
+        ns = np.array(ns)
+        start = self.count
+        n = min(int(ns.sum()), self.capacity - start)
+        if n <= 0:
+            return
+        end = start + n
+        kind = np.repeat(np.array(kinds, np.int8), ns)[:n]
+        rng = self.rng
+        self.x[start:end] = np.repeat(np.array(xs, np.float32), ns)[:n] + rng.uniform(-1.0, 1.0, n) * self._spread[kind]
+        self.y[start:end] = np.repeat(np.array(ys, np.float32), ns)[:n]
+        self.vx[start:end] = rng.standard_normal(n) * self._jitter[kind]
+        self.vy[start:end] = rng.uniform(0.7, 1.3, n) * self._rise[kind]
+        self.age[start:end] = 0.0
+        self.life[start:end] = rng.uniform(0.7, 1.0, n) * self._life[kind]
+        self.kind[start:end] = kind
+        self.count = end
+
+    # ============ IMAGE ============
+    def update(self, dt: float):
+        n = self.count
+        if n:
+            self._age(n, dt)
+        if self._births:
+            self._spawn()
+
+    def _age(self, n: int, dt: float):
+        age = self.age[:n]
+        age += dt
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        alive = age < self.life[:n]
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            for array in (self.x, self.y, self.vx, self.vy, self.age, self.life, self.kind):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def draw(self, surface: pygame.Surface):
+        n = self.count
+        if not n:
+            return
+        if not self._sprites:
+            self._sprites = _render_sprites()
+        kind = self.kind[:n]
+        remaining = 1.0 - self.age[:n] / self.life[:n]
+        level = np.clip((remaining * _ALPHA_LEVELS).astype(np.int32), 0, _ALPHA_LEVELS - 1)
+        radius = self._radius[kind]
+        xs = (self.x[:n] - radius).astype(np.int32).tolist()
+        ys = (self.y[:n] - radius).astype(np.int32).tolist()
+        sprites = self._sprites
+        index = (kind.astype(np.int32) * _ALPHA_LEVELS + level).tolist()
+        surface.blits([(sprites[i], (x, y)) for i, x, y in zip(index, xs, ys)], False)
+
+
+def _render_sprites() -> List[pygame.Surface]:
+    sprites = []
+    for spec in KINDS:
+        size = spec.radius * 2 + 2
+        for level in range(_ALPHA_LEVELS):
+            alpha = int(spec.alpha * (level + 1) / _ALPHA_LEVELS)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, spec.color + (alpha,), (spec.radius + 1, spec.radius + 1), spec.radius)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()  # format de l'écran: blits plus rapides
+            sprites.append(sprite)
+    return sprites
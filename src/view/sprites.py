@@ -0,0 +1,70 @@
+"""Atlas de sprites: variantes de personnages dessinées une seule fois
+
+Chaque variante (chef, client par expression, bulle par plat...) est
+rastérisée une fois dans une région d'une grande Surface partagée, rangée
+par étagères. Dessiner un personnage revient ensuite à copier sa région:
+un blit au lieu d'une trentaine d'appels pygame.draw.
+"""
+from typing import Callable, Dict, Hashable, Tuple
+
+import pygame
+
+
+class SpriteAtlas:
+    def __init__(self, width: int = 1024, height: int = 256, padding: int = 1):
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.padding = padding
+        self.regions: Dict[Hashable, Tuple[pygame.Rect, Tuple[int, int]]] = {}  # clé -> (région, origine)
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.regions
+
+    def bake(self, key: Hashable, size: Tuple[int, int], origin: Tuple[int, int],
+             paint: Callable[[pygame.Surface, int, int], None]):
+        """Réserve une région de `size` et y dessine paint(surface, *origin)
+
+        origin: point de la région qui correspond à la position du personnage
+        """
+        rect = self._allocate(size)
+        paint(self.surface.subsurface(rect), origin[0], origin[1])
+        self.regions[key] = (rect, origin)
+
+    def blit(self, target: pygame.Surface, key: Hashable, x: int, y: int):
+        rect, (ox, oy) = self.regions[key]
+        target.blit(self.surface, (x - ox, y - oy), rect)
+
+    def optimize(self):
+        """Convertit l'atlas au format de l'écran (blits plus rapides), une fois la fenêtre ouverte"""
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    # ============ RANGEMENT PAR ÉTAGÈRES ============
+    def _allocate(self, size: Tuple[int, int]) -> pygame.Rect:
+        width, height = size[0] + self.padding, size[1] + self.padding
+        atlas_width = self.surface.get_width()
+        if width > atlas_width:
+            raise ValueError(f"sprite trop large pour l'atlas: {size[0]} > {atlas_width - self.padding}")
+        if self._shelf_x + width > atlas_width:
+            self._shelf_y += self._shelf_height
+            self._shelf_x = self._shelf_height = 0
+        if self._shelf_y + height > self.surface.get_height():
+            self._grow(self._shelf_y + height)
+        rect = pygame.Rect(self._shelf_x, self._shelf_y, size[0], size[1])
+        self._shelf_x += width
+        self._shelf_height = max(self._shelf_height, height)
+        return rect
+
+    def _grow(self, min_height: int):
+        old = self.surface
+        height = old.get_height()
+        while height < min_height:
+            height *= 2
+        grown = pygame.Surface((old.get_width(), height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            grown = grown.convert_alpha()
+        grown.fill((0, 0, 0, 0))
+        grown.blit(old, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)  # copie exacte, alpha compris
+        self.surface = grown